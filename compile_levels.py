@@ -0,0 +1,37 @@
+'''
+data/tilemap_data.json에 있는 모든 맵을 미리 컴파일 (화면 없이 돌아감)
+
+- 맵마다 옆에 .ltm(바이너리 타일맵) + .level(청크 인덱스, 충돌 직사각형, 스포너 위치표) 생성
+- 원본 JSON이랑 타일 이미지가 안 바뀐 맵은 건너뜀
+
+python compile_levels.py              # 바뀐 맵만 컴파일
+python compile_levels.py --force      # 전부 다시 컴파일
+python compile_levels.py --jobs 4     # 워커 프로세스 수 지정
+python compile_levels.py --autotile   # 컴파일 전에 원본 JSON 일괄 오토타일 (바뀐 맵은 JSON도 덮어씀)
+'''
+import argparse
+import json
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from scripts.tilemap.level_compiler import compile_all_levels
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="레벨 오프라인 컴파일")
+    parser.add_argument("--force", action="store_true", help="최신이어도 전부 다시 컴파일")
+    parser.add_argument("--jobs", type=int, default=None, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--autotile", action="store_true", help="컴파일 전에 원본 JSON 일괄 오토타일")
+    args = parser.parse_args()
+
+    with open("data/tilemap_data.json", 'r', encoding="utf-8") as f:
+        tilemap_data = json.load(f)
+    file_names = [file_name for maps in tilemap_data["maps"].values() for file_name in maps]
+    file_names += tilemap_data["main_menu_maps"]
+
+    results = compile_all_levels(file_names, args.jobs, args.force, args.autotile)
+    for file_name, status in results.items():
+        print(f"{file_name}: {status}")
+
+    sys.exit(1 if any(status.startswith("failed") for status in results.values()) else 0)
@@ -0,0 +1,20 @@
+'''
+data/tilemaps 아래 JSON 타일맵들을 바이너리(.ltm)로 변환 + 원본이랑 같은지 검증
+
+python convert_tilemaps.py            # 변환 + 검증
+python convert_tilemaps.py --verify   # 검증만 (JSON 고치고 변환 안 했으면 FAIL 뜸)
+'''
+import os
+import sys
+
+from scripts.tilemap.compiled_map import convert_all_tilemaps, compiled_path
+from scripts.tilemap import BASE_TILEMAP_PATH
+
+results = convert_all_tilemaps(BASE_TILEMAP_PATH, verify_only="--verify" in sys.argv[1:])
+for json_path, problems in results.items():
+    binary_path = compiled_path(json_path)
+    binary_size = os.path.getsize(binary_path) if os.path.exists(binary_path) else 0
+    status = "OK" if not problems else "FAIL: " + ", ".join(problems)
+    print(f"{json_path}: {os.path.getsize(json_path)} -> {binary_size} bytes {status}")
+
+sys.exit(1 if any(results.values()) else 0)
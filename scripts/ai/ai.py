@@ -40,11 +40,11 @@ class WanderAI:
         right_check = pg.Vector2(entity.rect.midbottom[0] + tile_size // 2 - check_w, entity.rect.bottom + 1)
 
         # 왼쪽 바닥 없으면 오른쪽으로 방향 고정
-        if not any(r.collidepoint(left_check) for r in tilemap_data.physic_tiles_around(left_check)):
+        if tilemap_data.collision_rect_at(left_check) is None:
             self.handle_collision_or_fall("fall_left")
 
         # 오른쪽 바닥 없으면 왼쪽으로 방향 고정
-        elif not any(r.collidepoint(right_check) for r in tilemap_data.physic_tiles_around(right_check)):
+        elif tilemap_data.collision_rect_at(right_check) is None:
             self.handle_collision_or_fall("fall_right")
 
     def check_wall(self):
@@ -159,7 +159,7 @@ class App:
         singleton (App): 싱글톤 인스턴스.
         is_debug (bool): 켜져있으면 히트박스를 그림
         screen (Surface): 메인 디스플레이 Surface.
-        surfaces (dict): 레이어별 Surface 딕셔너리.
+        surfaces (LayerCompositor): 레이어별 Surface 딕셔너리 (이번 프레임에 쓴 레이어만 지우고 합침).
         registered_scenes (dict): 등록된 씬 객체 딕셔너리.
         scene (Scene): 현재 활성화된 씬.
         player_data (dict): 플레이어의 저장 데이터.
@@ -170,6 +170,8 @@ class App:
         dt (float): 스케일 적용된 델타 타임.
         unscaled_dt (float): 스케일 미적용 델타 타임.
         time_scale (float): 시간 배율.
+        quality (QualityGovernor): 프레임 시간 보고 그래픽 품질 단계를 조절함.
+        render_scale (float): 월드 레이어 렌더 해상도 배율 (인터페이스 레이어는 항상 원래 해상도).
         
     """
     singleton: 'App' = None
@@ -233,15 +235,24 @@ class App:
         pg.display.set_icon(load_image("app_icon.png"))
         
     def create_surfaces(self):
-        """레이어별 Surface를 생성함."""
-        self.surfaces = {
-            LAYER_BG: pg.Surface(SCREEN_SIZE, SURFACE_FLAGS).convert_alpha(),
-            LAYER_OBJ: pg.Surface(SCREEN_SIZE, SURFACE_FLAGS).convert_alpha(),
-            LAYER_ENTITY: pg.Surface(SCREEN_SIZE, SURFACE_FLAGS).convert_alpha(),
-            LAYER_VOLUME: pg.Surface(SCREEN_SIZE, SURFACE_FLAGS).convert_alpha(),
-            LAYER_DYNAMIC: pg.Surface(SCREEN_SIZE, SURFACE_FLAGS).convert_alpha(),
-            LAYER_INTERFACE: pg.Surface(SCREEN_SIZE, SURFACE_FLAGS).convert_alpha(),
-        }
+        """레이어별 Surface를 생성함. 레이어 종류(불투명 / 알파 / 필요할때 생성)는 LAYER_CONFIG 따름."""
+        self.surfaces = LayerCompositor(self.screen, LAYER_CONFIG, SURFACE_FLAGS, RENDER_SCALED_LAYERS,
+                                        sort_queues=RENDER_QUEUE_SORT)
+
+    @property
+    def render_scale(self) -> float:
+        """월드 레이어 렌더 해상도 배율."""
+        return self.surfaces.render_scale
+
+    def set_render_scale(self, render_scale: float):
+        """
+        월드 레이어 렌더 해상도 배율을 바꾸고 플레이어 데이터에 기록함.
+        
+        Args:
+            render_scale (float): RENDER_SCALES 중 하나.
+        """
+        self.player_data["render_scale"] = render_scale
+        self.surfaces.set_render_scale(render_scale)
 
     def load_data_and_assets(self):
         """플레이어 데이터와 모든 게임 에셋을 로드함."""
@@ -282,6 +293,10 @@ class App:
         self.dt: float = 0
         self.unscaled_dt: float = 0
         self.time_scale: float = 1
+        # player_data에 quality_tier가 있으면 그 단계로 고정, 없거나 null이면 자동 조절함.
+        self.quality = QualityGovernor(1 / TARGET_FPS, self.player_data.get("quality_tier"))
+        # 저장된 렌더 해상도 배율을 적용함 (없으면 원래 해상도).
+        self.surfaces.set_render_scale(self.player_data.get("render_scale", 1))
         self.update_time()
         self.update_event()
         
@@ -318,13 +333,19 @@ class App:
     def create_fps_renderer(self):
         """FPS 표시용 텍스트 렌더러를 생성하고, update 함수를 할당함."""
         fps_text = TextRenderer("??", pg.Vector2(SCREEN_SIZE.x, 0), color="green", anchor=pg.Vector2(1, 0))
-        # 람다 함수로 FPS 업데이트 로직을 덮어씀.
-        fps_text.update = lambda: setattr(fps_text, "text", str(int(self.clock.get_fps())))
+        # 람다 함수로 FPS 업데이트 로직을 덮어씀. 디버그 모드면 건너뛴 레이어 작업 수랑 품질 단계도 같이 표시함.
+        def update_fps_text():
+            fps_text.text = str(int(self.clock.get_fps()))
+            if self.is_debug:
+                fps_text.text += f" | skip {self.surfaces.skipped_passes} | {self.quality.describe()}"
+        fps_text.update = update_fps_text
 
     def update_time(self):
         """델타 타임 및 스케일이 적용된 시간을 업데이트함."""
         self.unscaled_dt = self.clock.tick(TARGET_FPS) / 1000
         self.dt = self.unscaled_dt * self.time_scale
+        # 품질 조절은 리미터가 기다린 시간을 뺀 실제 작업 시간 기준 (unscaled_dt는 목표 FPS 아래로 안 내려가서 여유를 모름)
+        self.quality.record(self.clock.get_rawtime() / 1000)
 
     def update_event(self):
         """이벤트 큐를 갱신함."""
@@ -372,15 +393,13 @@ class App:
                 self.window_should_be_closed = True
 
     def clear_surfaces(self):
-        """모든 Surface를 검은색으로 초기화함."""
-        self.screen.fill("black")
-        for surface in self.surfaces.values():
-            surface.fill(pg.Color(0, 0, 0, 0))
+        """새 프레임 시작. 레이어는 이번 프레임에 처음 꺼낼때 지워짐 (안 쓰는 레이어는 안 지움)."""
+        self.surfaces.begin_frame()
+        self.quality.begin_frame()
 
     def draw_surfaces(self):
-        """모든 Surface를 메인 화면에 그림."""
-        for surface in self.surfaces.values():
-            self.screen.blit(surface, (0, 0))
+        """이번 프레임에 그린 레이어들만 메인 화면에 합침."""
+        self.surfaces.compose()
 
     def run(self):
         """메인 게임 루프. 게임 실행 중 프레임마다 while 루프 속 내용 진행"""
@@ -400,6 +419,8 @@ class App:
             pg.display.flip()
             self.update_time()
 
-        # 게임 종료 시 플레이어 데이터를 저장하고 Pygame을 종료함.
+        # 게임 종료 시 씬들의 백그라운드 작업을 정리하고, 플레이어 데이터를 저장하고 Pygame을 종료함.
+        for scene in self.registered_scenes.values():
+            scene.on_app_quit()
         self.save_player_data()
         pg.quit()
\ No newline at end of file
@@ -1,2 +1,3 @@
 from .load_image import load_image, load_images
+from .atlas import TextureAtlas, pack_rects, ATLAS_PAGE_SIZE
 from .load_all_assets import load_all_assets
\ No newline at end of file
@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+import pygame as pg
+
+from .load_image import load_images, BASE_IMAGE_PATH
+
+# 아틀라스 페이지 한 장 크기 (이것보다 큰 이미지는 혼자 한 장 씀)
+ATLAS_PAGE_SIZE = 2048
+# 이미지 사이 여백 (픽셀)
+ATLAS_PADDING = 1
+# 채워넣은 아틀라스 페이지 저장해두는 폴더 (원본 이미지가 바뀌면 다시 만듦), None이면 저장 안 함
+# 지금 에셋은 개별 PNG 로드 + 채워넣기가 큰 페이지 PNG 읽기보다 빨라서 (0.2초 vs 0.25초) 기본은 꺼둠
+# 에셋이 많아지거나 확대 / 틴트가 무거워지면 "assets/atlas_cache/" 같은 폴더 지정
+ATLAS_CACHE_DIR: str | None = None
+ATLAS_CACHE_VERSION = 1
+
+AtlasRect = tuple[int, int, int, int, int]  # (페이지, x, y, w, h)
+
+def pack_rects(sizes: list[tuple[int, int]], page_size: int = ATLAS_PAGE_SIZE,
+               padding: int = ATLAS_PADDING) -> tuple[list[AtlasRect], list[tuple[int, int]]]:
+    '''
+    크기 목록을 선반(shelf) 방식으로 페이지들에 채워넣음
+
+    - 높이 큰 것부터 한 줄씩 왼쪽 -> 오른쪽으로 채우고, 줄이 넘치면 다음 줄, 페이지가 넘치면 다음 페이지
+    - page_size보다 큰 이미지는 그 크기만한 페이지 하나를 혼자 씀
+
+    :return: (sizes 순서대로 위치, 페이지별 실제 크기)
+    '''
+    rects: list[AtlasRect | None] = [None] * len(sizes)
+    pages: list[tuple[int, int]] = []
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+
+    page = -1
+    x = y = shelf_height = page_size  # 첫 이미지에서 새 페이지 열리게
+    for i in order:
+        width, height = sizes[i]
+        if width + padding > page_size or height + padding > page_size:
+            pages.append((width, height))
+            rects[i] = (len(pages) - 1, 0, 0, width, height)
+            continue
+
+        if x + width > page_size:
+            x, y = 0, y + shelf_height
+            shelf_height = 0
+        if page < 0 or y + height > page_size:
+            pages.append((0, 0))
+            page = len(pages) - 1
+            x = y = shelf_height = 0
+
+        rects[i] = (page, x, y, width, height)
+        x += width + padding
+        shelf_height = max(shelf_height, height + padding)
+        pages[page] = (max(pages[page][0], x - padding), max(pages[page][1], y + height))
+    return rects, pages
+
+class TextureAtlas:
+    '''
+    카테고리 하나(타일, 엔티티, 이펙트 등)의 이미지들을 큰 서피스 몇 장에 모아두는 아틀라스
+
+    - images()로 폴더를 등록하면 빈 리스트를 바로 돌려주고, build()할때 그 리스트를 아틀라스 서브서피스로 채움
+      (AnimationClip 등이 리스트를 그대로 들고 있어도 됨, 기존 코드는 그냥 pg.Surface 리스트로 씀)
+    - cache_dir가 있으면 채워넣은 페이지를 PNG + JSON으로 저장해두고, 다음 실행때 원본 이미지(경로, 수정 시간, 크기)와
+      배율 / 틴트가 같으면 개별 이미지 로드 / 확대 / 틴트 없이 페이지만 읽음
+    - 서브서피스는 아틀라스 페이지 픽셀을 같이 쓰니까 내용 바꾸면 안 됨 (set_alpha 등 할거면 copy() 해서 쓸 것)
+
+    :param name: 아틀라스 이름 (캐시 파일 이름)
+    :param page_size: 페이지 한 장 크기
+    :param padding: 이미지 사이 여백
+    :param cache_dir: 캐시 저장 폴더 (None이면 저장 안 함)
+    '''
+
+    def __init__(self, name: str, page_size: int = ATLAS_PAGE_SIZE, padding: int = ATLAS_PADDING,
+                 cache_dir: str | None = ATLAS_CACHE_DIR):
+        self.name = name
+        self.page_size = page_size
+        self.padding = padding
+        self.cache_dir = cache_dir
+
+        # (폴더 경로, 배율, 틴트) 요청들이랑 build때 채울 리스트
+        self.requests: list[tuple[str, float, pg.Color | None, list[pg.Surface]]] = []
+        self.pages: list[pg.Surface] = []
+        self.loaded_from_cache = False
+
+    def images(self, path: str, scale: float = 1, tint_color: pg.Color = None) -> list[pg.Surface]:
+        '''
+        load_images랑 같은 인자로 폴더 등록 (build() 전까지는 빈 리스트)
+        '''
+        frames: list[pg.Surface] = []
+        self.requests.append((path, scale, None if tint_color is None else pg.Color(tint_color), frames))
+        return frames
+
+    def signature(self) -> str:
+        '''원본 이미지 파일들 + 로드 옵션 + 채우기 설정 해시 (캐시가 최신인지 확인용)'''
+        h = hashlib.sha1()
+        h.update(repr((ATLAS_CACHE_VERSION, self.page_size, self.padding)).encode())
+        for path, scale, tint_color, _ in self.requests:
+            h.update(repr((path, scale, None if tint_color is None else tuple(tint_color))).encode())
+            dir_path = BASE_IMAGE_PATH + path
+            for filename in sorted(os.listdir(dir_path)):
+                stat = os.stat(os.path.join(dir_path, filename))
+                h.update(repr((filename, stat.st_mtime_ns, stat.st_size)).encode())
+        return h.hexdigest()
+
+    def cache_path(self, suffix: str) -> str:
+        return os.path.join(self.cache_dir, self.name + suffix)
+
+    def load_cache(self, signature: str) -> list[AtlasRect] | None:
+        '''캐시가 최신이면 페이지들 읽고 위치 목록 반환, 아니면 None'''
+        if self.cache_dir is None:
+            return None
+        try:
+            with open(self.cache_path(".json"), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["signature"] != signature:
+                return None
+            pages = [pg.image.load(self.cache_path(f"_{i}.png")).convert_alpha() for i in range(meta["page_count"])]
+        except (OSError, ValueError, KeyError, pg.error):
+            return None
+        self.pages = pages
+        return [tuple(rect) for rect in meta["rects"]]
+
+    def save_cache(self, signature: str, rects: list[AtlasRect]):
+        '''페이지들 PNG + 위치 목록 JSON 저장 (실패해도 게임은 그냥 진행)'''
+        if self.cache_dir is None:
+            return
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for i, page in enumerate(self.pages):
+                pg.image.save(page, self.cache_path(f"_{i}.png"))
+            with open(self.cache_path(".json"), "w", encoding="utf-8") as f:
+                json.dump({"signature": signature, "page_count": len(self.pages), "rects": rects}, f)
+        except (OSError, pg.error):
+            pass
+
+    def pack(self, sources: list[pg.Surface]) -> list[AtlasRect]:
+        '''원본 이미지들을 페이지에 채워넣음'''
+        rects, page_sizes = pack_rects([image.get_size() for image in sources], self.page_size, self.padding)
+        self.pages = [pg.Surface((max(1, w), max(1, h)), pg.SRCALPHA).convert_alpha() for w, h in page_sizes]
+        for image, (page, x, y, _, _) in zip(sources, rects):
+            self.pages[page].blit(image, (x, y), special_flags=pg.BLEND_RGBA_MAX)
+        return rects
+
+    def build(self):
+        '''등록한 폴더들 로드(혹은 캐시 읽기) + 채워넣기 + 요청 리스트들을 서브서피스로 채움'''
+        signature = self.signature() if self.cache_dir is not None else ""
+        rects = self.load_cache(signature)
+        self.loaded_from_cache = rects is not None
+        if rects is None:
+            sources = []
+            for path, scale, tint_color, _ in self.requests:
+                sources.extend(load_images(path, scale, tint_color))
+            rects = self.pack(sources)
+            self.save_cache(signature, rects)
+
+        # 요청 순서대로 폴더 안 이미지 수만큼씩 잘라서 채움 (load_images랑 같은 순서)
+        i = 0
+        for path, _, _, frames in self.requests:
+            count = len(os.listdir(BASE_IMAGE_PATH + path))
+            frames[:] = [self.pages[page].subsurface((x, y, w, h)) for page, x, y, w, h in rects[i:i + count]]
+            i += count
@@ -3,31 +3,32 @@ import pygame as pg
 from scripts.utils import *
 from scripts.constants import *
 from .load_image import *
+from .atlas import TextureAtlas
 
-def load_tilemap_assets():
+def load_tilemap_assets(atlas: TextureAtlas):
     '''타일맵 관련 이미지들 한방에 로드 (타일, 오브젝트 등)'''
     base_args = {"scale": 2, "tint_color": "grey"}
     return {
-        "dirt": load_images("tiles/tiles/dirt", **base_args),
-        "stone": load_images("tiles/tiles/stone", **base_args),
-        "dead_grass": load_images("tiles/tiles/dead_grass", **base_args),
-        "dark_folliage": load_images("tiles/objects/dark_folliage", **base_args),
-        "wood_struct": load_images("tiles/tiles/wood_struct", **base_args),
-        "dark_rocks": load_images("tiles/objects/dark_rocks", scale=3, tint_color="grey"),
-        "grave_woods": load_images("tiles/objects/grave_woods", scale=3, tint_color="grey"),
-        "dark_stones": load_images("tiles/objects/dark_stones", **base_args),
-        "folliage": load_images("tiles/objects/folliage", **base_args),
-        "props": load_images("tiles/objects/props", **base_args),
-        "statues": load_images("tiles/objects/statues", **base_args),
-        "spawners_entities": load_images("tiles/spawners_entities", scale=2),
-        "spawners_enemies": load_images("tiles/spawners_enemies", scale=2),
-        "custom_point": load_images("tiles/custom_point", scale=2),
+        "dirt": atlas.images("tiles/tiles/dirt", **base_args),
+        "stone": atlas.images("tiles/tiles/stone", **base_args),
+        "dead_grass": atlas.images("tiles/tiles/dead_grass", **base_args),
+        "dark_folliage": atlas.images("tiles/objects/dark_folliage", **base_args),
+        "wood_struct": atlas.images("tiles/tiles/wood_struct", **base_args),
+        "dark_rocks": atlas.images("tiles/objects/dark_rocks", scale=3, tint_color="grey"),
+        "grave_woods": atlas.images("tiles/objects/grave_woods", scale=3, tint_color="grey"),
+        "dark_stones": atlas.images("tiles/objects/dark_stones", **base_args),
+        "folliage": atlas.images("tiles/objects/folliage", **base_args),
+        "props": atlas.images("tiles/objects/props", **base_args),
+        "statues": atlas.images("tiles/objects/statues", **base_args),
+        "spawners_entities": atlas.images("tiles/spawners_entities", scale=2),
+        "spawners_enemies": atlas.images("tiles/spawners_enemies", scale=2),
+        "custom_point": atlas.images("tiles/custom_point", scale=2),
     }
 
-def load_entity_animations():
+def load_entity_animations(atlas: TextureAtlas):
     '''엔티티 애니메이션 전부 로드 (플레이어, 적, 소울 등)'''
     def anim(path, scale=3, duration=0.08, loop=True):
-        return Animation(load_images(path, scale), duration, loop)
+        return AnimationClip(atlas.images(path, scale), duration, loop)
 
     anims = {}
 
@@ -44,18 +45,18 @@ def load_entity_animations():
     }
 
     anims["soul"] = {
-        "idle": Animation(load_images("entities/soul/idle", 2, "cyan"), 0.05),
+        "idle": AnimationClip(atlas.images("entities/soul/idle", 2, "cyan"), 0.05),
     }
 
     anims["portal"] = {
-        "idle": Animation(load_images("entities/portal/idle", 2), 0.05),
+        "idle": AnimationClip(atlas.images("entities/portal/idle", 2), 0.05),
     }
 
     # 적 애니메이션, 기본 스케일 2, idle 0.05초, run 0.15초 기본 세팅
     def enemy_anim(name, scale=2, idle_dur=0.05, run_dur=0.15, extra=None):
         base = {
-            "idle": Animation(load_images(f"entities/enemies/{name}/idle", scale), idle_dur),
-            "run": Animation(load_images(f"entities/enemies/{name}/run", scale), run_dur),
+            "idle": AnimationClip(atlas.images(f"entities/enemies/{name}/idle", scale), idle_dur),
+            "run": AnimationClip(atlas.images(f"entities/enemies/{name}/run", scale), run_dur),
         }
         if extra:
             base.update(extra)
@@ -67,60 +68,60 @@ def load_entity_animations():
     anims["two_beta"] = enemy_anim("two_beta")
 
     anims["three_alpha"] = {
-        "attack": Animation(load_images("entities/enemies/three_alpha/attack", 2), 0.05, False),
-        "idle": Animation(load_images("entities/enemies/three_alpha/idle", 2), 0.15),
+        "attack": AnimationClip(atlas.images("entities/enemies/three_alpha/attack", 2), 0.05, False),
+        "idle": AnimationClip(atlas.images("entities/enemies/three_alpha/idle", 2), 0.15),
     }
     anims["three_beta"] = {
-        "attack": Animation(load_images("entities/enemies/three_beta/attack", 2), 0.05, False),
-        "idle": Animation(load_images("entities/enemies/three_beta/idle", 2), 0.15),
+        "attack": AnimationClip(atlas.images("entities/enemies/three_beta/attack", 2), 0.05, False),
+        "idle": AnimationClip(atlas.images("entities/enemies/three_beta/idle", 2), 0.15),
     }
 
     anims["four_alpha"] = enemy_anim("four_alpha", run_dur=0.08)
     anims["four_beta"] = enemy_anim("four_beta", run_dur=0.03)
 
     anims["five_omega"] = {
-        "idle": Animation(load_images("entities/enemies/five_omega/idle", 1.5), 0.05),
-        "run": Animation(load_images("entities/enemies/five_omega/run", 1.5), 0.08),
-        "scythe_attack": Animation(load_images("entities/enemies/five_omega/scythe_attack", 1.5), 0.02, False),
-        "turn_eye": Animation(load_images("entities/enemies/five_omega/turn_eye", 1.5), 0.04, False),
+        "idle": AnimationClip(atlas.images("entities/enemies/five_omega/idle", 1.5), 0.05),
+        "run": AnimationClip(atlas.images("entities/enemies/five_omega/run", 1.5), 0.08),
+        "scythe_attack": AnimationClip(atlas.images("entities/enemies/five_omega/scythe_attack", 1.5), 0.02, False),
+        "turn_eye": AnimationClip(atlas.images("entities/enemies/five_omega/turn_eye", 1.5), 0.04, False),
     }
 
     return anims
 
-def load_vfx_animations():
+def load_vfx_animations(atlas: TextureAtlas):
     '''파티클, 이펙트 애니메이션들'''
     return {
-        "hurt": Animation(load_images("particles/hurt", scale=2), 0.03, False),
-        "explosion": Animation(load_images("particles/explosion", scale=4), 0.03, False),
-        "darkness" :  Animation(load_images("particles/darkness", scale=3), 0.03, False),
-        "darkness_big" :  Animation(load_images("particles/darkness", scale=5), 0.1, False),
+        "hurt": AnimationClip(atlas.images("particles/hurt", scale=2), 0.03, False),
+        "explosion": AnimationClip(atlas.images("particles/explosion", scale=4), 0.03, False),
+        "darkness" :  AnimationClip(atlas.images("particles/darkness", scale=3), 0.03, False),
+        "darkness_big" :  AnimationClip(atlas.images("particles/darkness", scale=5), 0.1, False),
         "enemy": {
-            "attack": Animation(load_images("particles/enemy/attack", scale=2, tint_color="grey"), 0.03, False),
-            "die": Animation(load_images("particles/enemy/die", scale=2, tint_color="black"), 0.03, False),
+            "attack": AnimationClip(atlas.images("particles/enemy/attack", scale=2, tint_color="grey"), 0.03, False),
+            "die": AnimationClip(atlas.images("particles/enemy/die", scale=2, tint_color="black"), 0.03, False),
         },
         "soul": {
-            "interact": Animation(load_images("particles/soul/interact", scale=2), 0.03, False),
+            "interact": AnimationClip(atlas.images("particles/soul/interact", scale=2), 0.03, False),
         },
         "portal": {
-            "interact": Animation(load_images("particles/portal/interact", scale=5), 0.03, False),
+            "interact": AnimationClip(atlas.images("particles/portal/interact", scale=5), 0.03, False),
         },
         "projectile_destroy": {
-            "enemy_alpha": Animation(load_images("particles/destroy", scale=2, tint_color="purple"), 0.03, False),
-            "enemy_beta": Animation(load_images("particles/destroy", scale=2, tint_color="orange"), 0.03, False),
-            "player": Animation(load_images("particles/destroy", scale=2), 0.03, False),
+            "enemy_alpha": AnimationClip(atlas.images("particles/destroy", scale=2, tint_color="purple"), 0.03, False),
+            "enemy_beta": AnimationClip(atlas.images("particles/destroy", scale=2, tint_color="orange"), 0.03, False),
+            "player": AnimationClip(atlas.images("particles/destroy", scale=2), 0.03, False),
         },
     }
 
-def load_projectile_animations():
+def load_projectile_animations(atlas: TextureAtlas):
     '''투사체 애니메이션 로드'''
     base_args = {"scale": 2}
     return {
-        "two_alpha_projectile": Animation(load_images("projectiles/projectile", tint_color="purple", **base_args), 0.03, True),
-        "two_beta_projectile": Animation(load_images("projectiles/projectile", tint_color="red", **base_args), 0.03, True),
-        "player_projectile": Animation(load_images("projectiles/projectile", **base_args), 0.03, True),
-        "boss_fire": Animation(load_images("projectiles/boss_fire", **base_args), 0.03, True),
-        "boss_lazer": Animation(load_images("projectiles/boss_lazer", **base_args), 0.03, True),
-        "boss_knife": Animation(load_images("projectiles/boss_knife", **base_args), 0.03, True),
+        "two_alpha_projectile": AnimationClip(atlas.images("projectiles/projectile", tint_color="purple", **base_args), 0.03, True),
+        "two_beta_projectile": AnimationClip(atlas.images("projectiles/projectile", tint_color="red", **base_args), 0.03, True),
+        "player_projectile": AnimationClip(atlas.images("projectiles/projectile", **base_args), 0.03, True),
+        "boss_fire": AnimationClip(atlas.images("projectiles/boss_fire", **base_args), 0.03, True),
+        "boss_lazer": AnimationClip(atlas.images("projectiles/boss_lazer", **base_args), 0.03, True),
+        "boss_knife": AnimationClip(atlas.images("projectiles/boss_knife", **base_args), 0.03, True),
     }
 
 def load_sound_assets():
@@ -233,15 +234,23 @@ def load_all_assets():
     모든 애셋을 한방에 로드
 
     - App 클래스에서 딱 1번만 실행 (엄청 무거움)
+    - 타일 / 엔티티 / 이펙트 / 탄환 이미지는 카테고리별 아틀라스 페이지의 서브서피스 (내용 수정 금지)
     - 리턴값 딕셔너리 구조는 엄청 중요하니 절대 바꾸지 말 것
     '''
+    # 게임 중 매 프레임 그리는 작은 이미지들은 카테고리별 아틀라스로 모음 (리스트는 build()때 채워짐)
+    atlases = {name: TextureAtlas(name) for name in ("tilemap", "entities", "vfxs", "projectiles")}
+    tilemap_assets = load_tilemap_assets(atlases["tilemap"])
+    animations = {
+        "entities": load_entity_animations(atlases["entities"]),
+        "vfxs": load_vfx_animations(atlases["vfxs"]),
+        "projectiles": load_projectile_animations(atlases["projectiles"]),
+    }
+    for atlas in atlases.values():
+        atlas.build()
+
     return {
-        "tilemap": load_tilemap_assets(),
-        "animations": {
-            "entities": load_entity_animations(),
-            "vfxs": load_vfx_animations(),
-            "projectiles": load_projectile_animations(),
-        },
+        "tilemap": tilemap_assets,
+        "animations": animations,
         "fonts": {
             "default": "PF스타더스트 3.0 Bold.ttf",
             "gothic": "Jacquard24-Regular.ttf",
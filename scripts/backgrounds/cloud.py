@@ -29,6 +29,9 @@ class Cloud(GameObject):
         self.depth = depth
 
         self.img.set_alpha(CLOUD_ALPHA)
+
+        # 생성 순서 (품질 단계의 cloud_count보다 크면 안 그림, 깊이랑 상관없이 랜덤이라 골고루 빠짐)
+        self.rank = 0
     
     def update(self):
         super().update()
@@ -36,6 +39,8 @@ class Cloud(GameObject):
 
     def draw(self):
         super().draw()
+        if self.rank >= self.app.quality.tier.cloud_count:
+            return
         
         # depth에 따라 카메라가 스크롤하는 량이 달라짐. (Parallax 효과 만들기)
         depth_pos = self.pos - (self.camera.position * self.depth)
@@ -44,8 +49,10 @@ class Cloud(GameObject):
         clamped_x = depth_pos.x % (SCREEN_SIZE.x + self.size.x) - self.size.x
         clamped_y = depth_pos.y % (SCREEN_SIZE.y + self.size.y) - self.size.y
 
-        screen_pos = pg.Vector2(clamped_x, clamped_y)
-        self.app.surfaces[LAYER_BG].blit(self.img, screen_pos)
+        # 배경 레이어는 렌더 해상도 배율 적용받음
+        scale = self.app.render_scale
+        render_pos = pg.Vector2(clamped_x, clamped_y) * scale
+        self.app.surfaces.submit(LAYER_BG, scale_image(self.img, scale), render_pos)
 
 
 class CloudFactory:
@@ -78,8 +85,9 @@ class Clouds(GameObject):
         self.cloud_factory = CloudFactory(self.app)  # 팩토리 패턴으로 구름 생성 책임 위임
         self.all_clouds : list[Cloud] = []
 
-        for _ in range(cloud_count):
+        for i in range(cloud_count):
             cloud = self.cloud_factory.create_cloud()
+            cloud.rank = i
             self.all_clouds.append(cloud)
 
         # 깊이별로 정렬
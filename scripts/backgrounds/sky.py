@@ -17,6 +17,16 @@ class Sky(GameObject):
         for surface in self.surfaces:
             self.cache.blit(surface, (0, 0))
 
+        # 화면 전체를 불투명하게 덮으면 알파 없는 서피스로 바꿔두고, 배경 레이어 대신 화면에 바로 그림
+        screen_rect = pg.Rect((0, 0), SCREEN_SIZE)
+        self.is_opaque = self.cache.get_bounding_rect(min_alpha=255).contains(screen_rect)
+        if self.is_opaque:
+            self.cache = self.cache.convert()
+
     def draw(self):
         super().draw()
-        self.app.surfaces[LAYER_BG].blit(self.cache, (0, 0))
\ No newline at end of file
+        cache = scale_image(self.cache, self.app.render_scale)
+        if self.is_opaque:
+            self.app.surfaces.cover(LAYER_BG).blit(cache, (0, 0))
+        else:
+            self.app.surfaces[LAYER_BG].blit(cache, (0, 0))
\ No newline at end of file
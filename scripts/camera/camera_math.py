@@ -33,4 +33,18 @@ class CameraMath:
         :return: 월드 좌표 (Vector2)
         '''
         anchor_pixel = SCREEN_SIZE.elementwise() * camera.anchor
-        return (screen_pos - anchor_pixel) + (camera.position + camera.shake_offset)
\ No newline at end of file
+        return (screen_pos - anchor_pixel) + (camera.position + camera.shake_offset)
+
+    @staticmethod
+    def world_to_render(camera: Camera2D, world_pos: pg.Vector2) -> pg.Vector2:
+        '''
+        월드 좌표를 월드 레이어(렌더 해상도 배율 적용된 서피스) 좌표로 변환
+
+        - 월드 레이어(RENDER_SCALED_LAYERS)에 그릴때는 world_to_screen 대신 이걸 써야 함
+        - 화면 안에 있는지 검사 / 마우스 좌표 변환은 배율이랑 상관없이 스크린 좌표 기준 (world_to_screen / screen_to_world)
+
+        :param camera: 현재 카메라 객체
+        :param world_pos: 월드 좌표 (Vector2)
+        :return: 월드 레이어 좌표 (Vector2)
+        '''
+        return CameraMath.world_to_screen(camera, world_pos) * camera.app.render_scale
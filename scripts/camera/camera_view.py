@@ -34,6 +34,19 @@ class CameraView:
         screen_size = pg.Vector2(rect.size)
         return pg.Rect(screen_pos, screen_size)
 
+    @staticmethod
+    def world_rect_to_render_rect(camera: Camera2D, rect: pg.Rect) -> pg.Rect:
+        '''
+        월드 좌표계에 있는 Rect를 월드 레이어(렌더 해상도 배율 적용된 서피스) 좌표계 Rect로 변환
+
+        :param camera: 현재 카메라 객체
+        :param rect: 월드 좌표 기준 Rect
+        :return: 월드 레이어 좌표 기준 Rect
+        '''
+        scale = camera.app.render_scale
+        render_pos = CameraMath.world_to_render(camera, pg.Vector2(rect.topleft))
+        return pg.Rect(render_pos, pg.Vector2(rect.size) * scale)
+
     @staticmethod
     def is_rect_in_view(camera: Camera2D, rect: pg.Rect) -> bool:
         '''
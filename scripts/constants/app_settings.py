@@ -5,4 +5,8 @@ TARGET_FPS = 144
 SCREEN_FLAGS = pg.SCALED | pg.DOUBLEBUF | pg.HWSURFACE | pg.FULLSCREEN
 SURFACE_FLAGS = pg.SRCALPHA | pg.HWSURFACE 
 APP_NAME = "< Limen >"
-MIXER_CHANNEL_COUNT = 32
\ No newline at end of file
+MIXER_CHANNEL_COUNT = 32
+# 설정에서 고를 수 있는 월드 렌더 해상도 배율
+RENDER_SCALES = (.5, .75, 1)
+# True면 레이어별 스프라이트 큐를 원본 서피스(아틀라스 페이지)별로 정렬해서 그림 (겹친 스프라이트 앞뒤가 바뀔 수 있음)
+RENDER_QUEUE_SORT = False
@@ -3,4 +3,24 @@ LAYER_OBJ = 1
 LAYER_ENTITY = 2
 LAYER_DYNAMIC = 3
 LAYER_VOLUME = 4
-LAYER_INTERFACE = 5
\ No newline at end of file
+LAYER_INTERFACE = 5
+
+# 레이어 종류
+LAYER_OPAQUE = "opaque"      # 항상 화면 전체를 불투명하게 덮음 (알파 없는 서피스, 맨 아래면 화면에 바로 그림)
+LAYER_ALPHA = "alpha"        # 픽셀별 알파 서피스, 시작할때 바로 만듦
+LAYER_OPTIONAL = "optional"  # 픽셀별 알파 서피스, 처음 쓰는 씬이 나올때 만듦
+
+# 레이어 -> 종류 (화면에 합치는 순서대로, 아래 -> 위)
+# 합치는 순서는 레이어 번호가 아니라 이 딕셔너리 순서 (LAYER_DYNAMIC이 번호는 작아도 LAYER_VOLUME 위에 그려짐)
+LAYER_CONFIG = {
+    LAYER_BG: LAYER_OPAQUE,
+    LAYER_OBJ: LAYER_ALPHA,
+    LAYER_ENTITY: LAYER_ALPHA,
+    LAYER_VOLUME: LAYER_OPTIONAL,
+    LAYER_DYNAMIC: LAYER_OPTIONAL,
+    LAYER_INTERFACE: LAYER_ALPHA,
+}
+
+# 렌더 해상도 배율(App.render_scale) 적용받는 월드 레이어 (작게 그리고 화면에 합칠때 한번에 늘림)
+# LAYER_INTERFACE는 항상 원래 해상도
+RENDER_SCALED_LAYERS = (LAYER_BG, LAYER_OBJ, LAYER_ENTITY, LAYER_DYNAMIC, LAYER_VOLUME)
@@ -37,11 +37,12 @@ class Entity(GameObject):
         
         self.is_being_drawn = True
         
+        self.anim: AnimationPlayer | None = None
         self.set_action(start_action)
 
     def set_action(self, action_name: str):
         """
-        현재 액션과 다르면 애니메이션 교체
+        현재 액션과 다르면 애니메이션 교체 (재생 상태에 클립만 바꿔 끼움)
 
         Args:
             action_name (str): 변경할 애니메이션 액션 이름
@@ -50,8 +51,11 @@ class Entity(GameObject):
             return
         self.current_action = action_name
         
-        self.anim = self.app.ASSETS["animations"]["entities"]\
-        [self.name][action_name].copy()
+        clip = self.app.ASSETS["animations"]["entities"][self.name][action_name]
+        if self.anim is None:
+            self.anim = AnimationPlayer(clip)
+        else:
+            self.anim.play(clip)
 
     def get_rect_points(self) -> list[pg.Vector2]:
         """
@@ -67,6 +71,17 @@ class Entity(GameObject):
             pg.Vector2(self.rect.bottomright)
         ]
 
+    def get_rect_corners(self) -> tuple[tuple[int, int], ...]:
+        """
+        히트박스의 4개 꼭짓점 좌표를 튜플로 반환 (get_rect_points의 Vector2 안 만드는 버전)
+        매 프레임 타일 충돌 조회할 때 씀
+
+        Returns:
+            tuple: 좌상, 우상, 좌하, 우하 (x, y) 튜플
+        """
+        rect = self.rect
+        return (rect.topleft, rect.topright, rect.bottomleft, rect.bottomright)
+
     def flip_anim(self):
         """
         이동 방향(x축 속도)에 따라 애니메이션 좌우 반전 설정
@@ -118,5 +133,5 @@ class Entity(GameObject):
             self.is_being_drawn = False
             return
 
-        screen_pos = CameraMath.world_to_screen(cam, world_pos)
-        self.app.surfaces[LAYER_ENTITY].blit(img, screen_pos)
\ No newline at end of file
+        render_pos = CameraMath.world_to_render(cam, world_pos)
+        self.app.surfaces.submit(LAYER_ENTITY, scale_image(img, self.app.render_scale), render_pos)
\ No newline at end of file
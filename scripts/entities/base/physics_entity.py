@@ -38,38 +38,40 @@ class PhysicsEntity(Entity):
         - 수직 이동 후 충돌 검사 및 충돌 시 이동 제한 (중력 관련 부분은 따로 처리)
         """
         self.collisions = {"left": False, "right": False, "up": False, "down": False}
+        tilemap_data = self.scene.tilemap_data
+        tile_size = tilemap_data.tile_size
 
         # 수평 이동 적용
         self.rect.x += int(self.movement.x * self.app.dt)
 
-        # 각 꼭짓점 주변 타일들과 충돌 체크
-        for point in self.get_rect_points():
-            for rect in self.scene.tilemap_data.physic_tiles_around(point):
-                if rect.colliderect(self.rect):
-                    if self.movement.x > 0:  # 오른쪽 이동 중 충돌
-                        self.collisions["right"] = True
-                        self.movement.x = 0
-                        self.rect.right = rect.x
-                    elif self.movement.x < 0:  # 왼쪽 이동 중 충돌
-                        self.collisions["left"] = True
-                        self.movement.x = 0
-                        self.rect.x = rect.right
+        # 각 꼭짓점 주변 충돌 모양들과 충돌 체크 (4개 꼭짓점을 한번에 조회)
+        for rect in tilemap_data.collision_rects_around_points(self.get_rect_corners()):
+            if rect.colliderect(self.rect):
+                # 충돌 모양은 여러 타일을 합친 큰 Rect라서, 타일에 박혀있던 경우(스폰 위치 등)
+                # 합친 Rect 끝까지 밀려나지 않게 엔티티가 걸친 칸 경계까지만 밀어냄
+                if self.movement.x > 0:  # 오른쪽 이동 중 충돌
+                    self.collisions["right"] = True
+                    self.movement.x = 0
+                    self.rect.right = max(rect.x, self.rect.left // tile_size * tile_size)
+                elif self.movement.x < 0:  # 왼쪽 이동 중 충돌
+                    self.collisions["left"] = True
+                    self.movement.x = 0
+                    self.rect.x = min(rect.right, ((self.rect.right - 1) // tile_size + 1) * tile_size)
 
         # 수직 이동 적용
         self.rect.y += int(self.movement.y * self.app.dt)
 
-        # 각 꼭짓점 주변 타일들과 충돌 체크
-        for point in self.get_rect_points():
-            for rect in self.scene.tilemap_data.physic_tiles_around(point):
-                if rect.colliderect(self.rect):
-                    if self.movement.y > 0:  # 아래쪽 이동 중 충돌 (땅)
-                        self.collisions["down"] = True
-                        # 중력 처리 따로 하기 때문에 movement.y = 0 은 하지 않음
-                        self.rect.bottom = rect.y
-                    elif self.movement.y < 0:  # 위쪽 이동 중 충돌 (머리 박음)
-                        self.collisions["up"] = True
-                        # 중력 처리 따로 하기 때문에 movement.y = 0 은 하지 않음
-                        self.rect.top = rect.bottom
+        # 각 꼭짓점 주변 충돌 모양들과 충돌 체크
+        for rect in tilemap_data.collision_rects_around_points(self.get_rect_corners()):
+            if rect.colliderect(self.rect):
+                if self.movement.y > 0:  # 아래쪽 이동 중 충돌 (땅)
+                    self.collisions["down"] = True
+                    # 중력 처리 따로 하기 때문에 movement.y = 0 은 하지 않음
+                    self.rect.bottom = max(rect.y, self.rect.top // tile_size * tile_size)
+                elif self.movement.y < 0:  # 위쪽 이동 중 충돌 (머리 박음)
+                    self.collisions["up"] = True
+                    # 중력 처리 따로 하기 때문에 movement.y = 0 은 하지 않음
+                    self.rect.top = min(rect.bottom, ((self.rect.bottom - 1) // tile_size + 1) * tile_size)
 
     def physics_gravity(self):
         """
@@ -1 +1,2 @@
-from .projectile import Projectile, EnemyProjectile
\ No newline at end of file
+from .projectile import Projectile, EnemyProjectile
+from .rotation_cache import RotationCache, get_rotation_cache, ROTATION_BUCKETS, ROTATION_CACHE_BUDGET
\ No newline at end of file
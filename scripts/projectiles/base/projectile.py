@@ -6,6 +6,7 @@ from scripts.utils import *
 from scripts.camera import *
 from scripts.vfx import *
 from scripts.ui import *
+from .rotation_cache import RotationCache, get_rotation_cache
 
 # 탄환 데이터 파일 경로
 DATA_PATH = "data/projectile_data.json"
@@ -36,9 +37,13 @@ class Projectile(GameObject):
 
         self.position = start_position
         self.direction = start_direction
+        # 마지막으로 타일맵 충돌 검사한 위치 (여기서 지금 위치까지 선분으로 검사함)
+        self.sweep_x, self.sweep_y = start_position.x, start_position.y
 
-        # 탄환 애니메이션 복사본 생성
-        self.anim: Animation = self.app.ASSETS["animations"]["projectiles"][projectile_name].copy()
+        # 탄환 애니메이션 재생 상태 생성 (클립 데이터는 공유)
+        self.anim = AnimationPlayer(self.app.ASSETS["animations"]["projectiles"][projectile_name])
+        # 같은 종류 탄환끼리 같이 쓰는 회전 이미지 캐시
+        self.rotation_cache: RotationCache = get_rotation_cache(projectile_name)
 
         # 탄환 수명 타이머 설정, 끝나면 자동 파괴
         self.timer = Timer(life_time, lambda: self.destroy())
@@ -52,15 +57,17 @@ class Projectile(GameObject):
 
     def update_tilemap_collision(self):
         """
-        현재 위치 주변 타일맵 타일들과 충돌 검사
+        지난번 검사한 위치부터 현재 위치까지 지나간 길에 충돌 타일이 있는지 검사
+        (한 프레임에 타일보다 많이 움직여도 벽을 안 뚫고 지나감)
         충돌 시 탄환 파괴
         """
         if not self.destroy_on_tilemap_collision:
             return
-        for rect in self.scene.tilemap_data.physic_tiles_around(self.position):
-            if rect.collidepoint(self.position):
-                self.destroy()
-                break
+        position = self.position
+        hit = self.scene.tilemap_data.raycast((self.sweep_x, self.sweep_y), position)
+        self.sweep_x, self.sweep_y = position.x, position.y
+        if hit is not None:
+            self.destroy()
 
     def update(self):
         """
@@ -84,7 +91,6 @@ class Projectile(GameObject):
         """
         super().draw()
 
-        surface = self.app.surfaces[LAYER_DYNAMIC]
         camera = self.camera
 
         image = self.anim.img()
@@ -92,14 +98,14 @@ class Projectile(GameObject):
         # 이동 방향 벡터에 따른 회전 각도 계산 (기본 x축 벡터 기준)
         angle = self.direction.angle_to(pg.Vector2(1, 0))
 
-        # 애니메이션 이미지 회전
-        rotated_img = pg.transform.rotate(image, angle)
+        # 애니메이션 이미지 회전 (각도 칸 단위로 캐시된 이미지 사용)
+        rotated_img = self.rotation_cache.get(image, angle)
 
         # 이미지 중앙 기준 위치 조정
         draw_pos = self.position - pg.Vector2(rotated_img.get_size()) * 0.5
-        screen_pos = CameraMath.world_to_screen(camera, draw_pos)
+        render_pos = CameraMath.world_to_render(camera, draw_pos)
 
-        surface.blit(rotated_img, screen_pos)
+        self.app.surfaces.submit(LAYER_DYNAMIC, scale_image(rotated_img, self.app.render_scale), render_pos)
 
 class EnemyProjectile(Projectile):
     def __init__(self, projectile_name, start_position, start_direction, life_time,
@@ -0,0 +1,64 @@
+import pygame as pg
+from collections import OrderedDict
+
+# 360도를 몇 칸으로 나눠서 회전 이미지를 만들지 (128칸이면 약 2.8도 단위)
+ROTATION_BUCKETS = 128
+# 탄환 종류 하나당 회전 이미지들이 쓸 수 있는 최대 메모리 (바이트, 넘으면 제일 오래 안 쓴 것부터 버림)
+ROTATION_CACHE_BUDGET = 32 * 1024 * 1024
+
+RotationKey = tuple[pg.Surface, int]
+
+class RotationCache:
+    '''
+    (애니메이션 프레임, 각도 칸) -> 회전된 이미지 LRU 캐시
+
+    - 각도는 buckets칸으로 반올림해서, 같은 칸이면 같은 이미지 돌려줌
+    - 같은 종류 탄환들은 전부 같은 캐시를 씀 (get_rotation_cache)
+    - 프레임 이미지는 애니메이션 원본을 같이 쓰니까 이미지 자체를 키로 씀
+    - 탄환이 날아가는 동안 방향이 안 바뀌면 애니메이션 프레임이 넘어갈때만 새로 돌림
+
+    :param buckets: 각도 칸 수
+    :param budget_bytes: 회전 이미지들이 쓸 수 있는 최대 바이트
+    '''
+
+    def __init__(self, buckets: int = ROTATION_BUCKETS, budget_bytes: int = ROTATION_CACHE_BUDGET):
+        self.buckets = buckets
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        self.images: OrderedDict[RotationKey, pg.Surface] = OrderedDict()
+
+    @staticmethod
+    def surface_bytes(surface: pg.Surface) -> int:
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def get(self, image: pg.Surface, angle: float) -> pg.Surface:
+        '''image를 angle도 (반시계, pg.transform.rotate 기준) 돌린 이미지'''
+        bucket = round(angle * self.buckets / 360) % self.buckets
+        key = (image, bucket)
+        rotated = self.images.get(key)
+        if rotated is not None:
+            self.images.move_to_end(key)
+            return rotated
+
+        rotated = pg.transform.rotate(image, bucket * 360 / self.buckets)
+        self.images[key] = rotated
+        self.used_bytes += self.surface_bytes(rotated)
+        while self.used_bytes > self.budget_bytes and len(self.images) > 1:
+            _, evicted = self.images.popitem(last=False)
+            self.used_bytes -= self.surface_bytes(evicted)
+        return rotated
+
+    def clear(self):
+        self.images.clear()
+        self.used_bytes = 0
+
+# 탄환 종류(projectile_name) -> 회전 캐시
+_rotation_caches: dict[str, RotationCache] = {}
+
+def get_rotation_cache(projectile_name: str) -> RotationCache:
+    '''탄환 종류별 회전 캐시 (없으면 만듦)'''
+    cache = _rotation_caches.get(projectile_name)
+    if cache is None:
+        cache = RotationCache()
+        _rotation_caches[projectile_name] = cache
+    return cache
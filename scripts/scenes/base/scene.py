@@ -17,6 +17,9 @@ class Scene:
         self.app = App.singleton
 
         self.objects: list[GameObject] = []
+        # 클래스 -> {그 클래스(혹은 자식 클래스) 오브젝트: 추가된 순번}, MRO 전체에 등록 (get_objects_by_types용)
+        self.objects_by_type: dict[type, dict[GameObject, int]] = {}
+        self._added_count = 0
         self.skip_when_paused = skip_when_paused
         self.light_manager = LightManager(self)
 
@@ -43,9 +46,13 @@ class Scene:
             if hasattr(obj, "destroy"):
                 obj.destroy()
         self.objects.clear()
+        self.objects_by_type.clear()
 
         self.app.sound_manager.fade_all_sfx()
 
+    def on_app_quit(self):
+        """게임 종료 직전에 등록된 모든 씬에 대해 호출됨 (백그라운드 작업 정리 등)."""
+
     # -------------------------------------------------
     # 일시정지 관리
     # -------------------------------------------------
@@ -76,13 +83,39 @@ class Scene:
     # -------------------------------------------------
     def add_object(self, obj: GameObject):
         self.objects.append(obj)
+        self._added_count += 1
+        for cls in type(obj).__mro__:
+            bucket = self.objects_by_type.get(cls)
+            if bucket is None:
+                bucket = self.objects_by_type[cls] = {}
+            bucket[obj] = self._added_count
 
     def remove_object(self, obj: GameObject):
         if obj in self.objects:
             self.objects.remove(obj)
+            for cls in type(obj).__mro__:
+                bucket = self.objects_by_type.get(cls)
+                if bucket is not None:
+                    bucket.pop(obj, None)
 
     def get_objects_by_types(self, target_classes: type | tuple[type]) -> list[GameObject]:
-        return [obj for obj in self.objects if isinstance(obj, target_classes)]
+        """
+        target_classes(혹은 자식 클래스) 오브젝트들을 추가된 순서대로 반환
+        전체 오브젝트를 훑지 않고 클래스별 목록에서 바로 꺼냄
+        """
+        if isinstance(target_classes, type):
+            return list(self.objects_by_type.get(target_classes, ()))
+
+        merged: dict[GameObject, int] = {}
+        found = 0
+        for cls in target_classes:
+            bucket = self.objects_by_type.get(cls)
+            if bucket:
+                merged.update(bucket)
+                found += 1
+        if found > 1:
+            return sorted(merged, key=merged.__getitem__)
+        return list(merged)
 
     # -------------------------------------------------
     # 메인 루프
@@ -613,6 +613,8 @@ class MainGameScene(Scene):
         super().__init__()  # 부모 Scene 클래스 초기화함
         self.current_chapter = 1  # 시작 챕터 번호 설정함
         self.current_level = 0  # 시작 레벨 번호 설정함
+        # 다음 레벨 타일맵을 플레이 중에 백그라운드로 미리 읽어둠 (씬 바뀌어도 유지)
+        self.tilemap_prefetcher = TilemapPrefetcher()
 
     def on_scene_start(self):
         """
@@ -653,8 +655,16 @@ class MainGameScene(Scene):
         # 타일맵 로드 + 엔티티 스폰함
         chapter_str = str(self.current_chapter)  # 챕터 번호를 문자열로 변환함
         file_path = TILEMAP_FILES_BY_CHAPTER[chapter_str][self.current_level]  # 타일맵 파일 경로 가져옴
-        self.tilemap_data = TilemapData(file_path)
-        TilemapRenderer(self.tilemap_data)
+        prefetched = self.tilemap_prefetcher.take(file_path)  # 미리 읽어둔게 있으면 그대로 씀
+        if prefetched is not None:
+            self.tilemap_data = prefetched.data
+            self.tilemap_renderer = TilemapRenderer(self.tilemap_data, baker=prefetched.baker, prebake_keys=prefetched.spawn_chunk_keys)
+        else:
+            self.tilemap_data = TilemapData(file_path)
+            self.tilemap_renderer = TilemapRenderer(self.tilemap_data)
+        # 밖에서 타일맵 JSON 고치면 바뀐 타일만 반영 (이미 스폰된 엔티티는 그대로, 개발용이라 디버그 모드에서만)
+        hot_reload = TILEMAP_HOT_RELOAD or self.app.is_debug
+        self.tilemap_watcher = TilemapWatcher(self.tilemap_data, self.tilemap_renderer) if hot_reload else None
         spawn_all_entities_by_data(self.tilemap_data)  # 타일맵의 모든 엔티티들 스폰함
 
         # 적 죽으면 점수 추가하도록 이벤트 연결함
@@ -695,6 +705,8 @@ class MainGameScene(Scene):
             
         # 게임 UI 생성함
         self.game_ui = GameUI(self, self.player_status)
+        # 미니맵 생성함
+        self.minimap = Minimap(self.tilemap_data)
         # 일시정지 UI 생성함
         self.pause_ui = PauseUI(self, self.player_status)
 
@@ -713,6 +725,9 @@ class MainGameScene(Scene):
         # 다음 진행상황 미리 업데이트함
         self.update_next_progress()
 
+        # 다음에 올 레벨 타일맵 미리 읽어두기 시작함
+        self.prefetch_next_tilemaps()
+
     @property
     def score(self):
         """
@@ -780,6 +795,31 @@ class MainGameScene(Scene):
         # 플레이어 데이터 저장함
         self.app.save_player_data()
 
+    def prefetch_next_tilemaps(self):
+        """
+        다음 씬 시작때 쓸 타일맵들을 백그라운드에서 미리 준비함
+
+        - 다음 레벨 (챕터 마지막이면 다음 챕터 첫 레벨)
+        - 현재 레벨 (죽어서 재시작하는 경우)
+        - 그 외에 예전에 요청해둔건 버림
+        """
+        file_names = []
+
+        chapter_maps = TILEMAP_FILES_BY_CHAPTER.get(str(self.current_chapter))
+        if chapter_maps is None:  # 엔딩 등으로 더 이상 챕터가 없는 경우
+            self.tilemap_prefetcher.retain(file_names)
+            return
+
+        if self.current_level + 1 < len(chapter_maps):
+            file_names.append(chapter_maps[self.current_level + 1])
+        elif str(self.current_chapter + 1) in TILEMAP_FILES_BY_CHAPTER:
+            file_names.append(TILEMAP_FILES_BY_CHAPTER[str(self.current_chapter + 1)][0])
+        file_names.append(chapter_maps[self.current_level])
+
+        self.tilemap_prefetcher.retain(file_names)
+        for file_name in file_names:
+            self.tilemap_prefetcher.prefetch(file_name, self.app.ASSETS["tilemap"])
+
     def level_intro(self):
         """
         레벨 시작 시 중앙에 레벨 이름 텍스트 보여주고 서서히 사라지게 처리함
@@ -796,6 +836,19 @@ class MainGameScene(Scene):
             fade_delay=.1, fade_duration=1.5
         )
 
+    def on_scene_end(self):
+        """
+        씬 종료 시 호출됨
+
+        아직 시작 안 한 타일맵 프리페치는 취소함 (끝난건 다음 레벨 시작때 그대로 씀)
+        """
+        self.tilemap_prefetcher.shutdown()
+        super().on_scene_end()
+
+    def on_app_quit(self):
+        """게임 종료 시 프리페치 워커 정리함 (종료가 로딩 기다리느라 안 막히게)"""
+        self.tilemap_prefetcher.shutdown()
+
     def on_pause_start(self):
         """
         일시정지 시작 시 호출됨
@@ -834,6 +887,8 @@ class MainGameScene(Scene):
         입력 처리 후 부모 클래스 업데이트 호출함
         """
         self.handle_input()  # 입력 처리함
+        if self.tilemap_watcher is not None:
+            self.tilemap_watcher.poll()  # 타일맵 파일 바뀌었으면 반영함
         super().update()  # 부모 클래스 업데이트 호출함
     
     def on_level_end(self):
@@ -54,6 +54,7 @@ class SettingsUI:
 
         # 버튼 데이터 (이름, 표시 텍스트, y좌표, hover색, 기본색)
         buttons = [
+            ("render_scale_button", "", 570, pg.Color("blue"), pg.Color("white")),
             ("reset_button", "모든 데이터 초기화", 650, pg.Color("yellow"), pg.Color("red")),
             ("unlock_button", "모든 레벨 잠금 해제", 700, pg.Color("blue"), pg.Color("red")),
         ]
@@ -67,6 +68,7 @@ class SettingsUI:
     def connect_events(self):
         self.ui_elements["sfx_volume_slider"].on_value_changed = self.change_vfx
         self.ui_elements["bgm_volume_slider"].on_value_changed = self.change_bgm
+        self.ui_elements["render_scale_button"].on_click = self.on_render_scale_button_click
         self.ui_elements["reset_button"].on_click = self.on_reset_button_click
         self.ui_elements["unlock_button"].on_click = self.on_unlock_button_click
 
@@ -74,6 +76,7 @@ class SettingsUI:
         """볼륨 표시 업데이트"""
         self.ui_elements["sfx_volume_text"].text = f"SFX 음량 : {self.scene.app.player_data['sfx_volume']}"
         self.ui_elements["bgm_volume_text"].text = f"BGM 음량 : {self.scene.app.player_data['bgm_volume']}"
+        self.ui_elements["render_scale_button"].renderer.text = f"렌더 해상도 : {round(self.scene.app.render_scale * 100)}%"
 
     def change_vfx(self):
         self.scene.app.player_data["sfx_volume"] = round(self.ui_elements["sfx_volume_slider"].value, 2)
@@ -83,6 +86,12 @@ class SettingsUI:
         self.scene.app.player_data["bgm_volume"] = round(self.ui_elements["bgm_volume_slider"].value, 2)
         self.scene.app.sound_manager.set_bgm_volume(self.scene.app.player_data["bgm_volume"])
 
+    def on_render_scale_button_click(self, _):
+        """렌더 해상도 배율을 RENDER_SCALES 안에서 다음 값으로 바꿈"""
+        render_scale = self.scene.app.render_scale
+        index = RENDER_SCALES.index(render_scale) if render_scale in RENDER_SCALES else -1
+        self.scene.app.set_render_scale(RENDER_SCALES[(index + 1) % len(RENDER_SCALES)])
+
     def on_reset_button_click(self, _):
         if self.button_click_stack >= len(RESET_MSGS):
             self.scene.app.reset_player_data()
@@ -93,6 +102,7 @@ class SettingsUI:
             self.ui_elements["bgm_volume_slider"].update_rects()
             self.scene.app.sound_manager.set_sfx_volume(self.scene.app.player_data["sfx_volume"])
             self.scene.app.sound_manager.set_bgm_volume(self.scene.app.player_data["bgm_volume"])
+            self.scene.app.set_render_scale(self.scene.app.player_data.get("render_scale", 1))
             self.scene.app.sound_manager.play_sfx(self.scene.app.ASSETS["sounds"]["ui"]["reset"])
             self.scene.app.change_scene("main_menu_scene")
         else:
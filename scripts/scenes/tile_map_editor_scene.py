@@ -1,6 +1,5 @@
 import pygame as pg
 import math
-import copy
 import json
 
 from scripts.constants import *
@@ -11,48 +10,19 @@ from scripts.ui import *
 from .base import Scene
 
 CAMERA_MOVE_SPEED = 400
-MAX_UNDO_STACK = 20
+MAX_UNDO_STEPS = 100
+MAX_UNDO_CHANGES = 100_000  # 모든 undo 단계 합쳐서 저장할 최대 변경 수 (메모리 제한)
 IN_GRID_TILES = ["dirt", "stone", "dead_grass", "wood_struct"]
 
 def save_tilemap_file(tilemap_data : TilemapData, file_name: str = "temp.json"):
     """
-    현재 타일맵 데이터를 JSON 파일로 저장
+    현재 타일맵 데이터를 JSON 파일로 저장 (바이너리 .ltm도 같이 갱신)
     :param file_name: 저장할 파일 이름 (기본 temp.json)
     """
 
     with open(BASE_TILEMAP_PATH + '/' + file_name, 'w', encoding="utf-8") as f:
-        json.dump({
-            "tile_size": tilemap_data.tile_size,
-            "in_grid": tilemap_data.in_grid,
-            "off_grid": tilemap_data.off_grid
-        }, f)
-
-def autotile(tilemap_data : TilemapData, auto_tile_types : list[str] = ["dirt", "stone", "dead_grass"]):
-    """
-    오토타일링 알고리즘 적용
-    """
-    AUTOTILE_MAP = {
-        tuple(sorted([(1, 0), (0, 1)])): 0,
-        tuple(sorted([(1, 0), (0, 1), (-1, 0)])): 1,
-        tuple(sorted([(-1, 0), (0, 1)])): 2,
-        tuple(sorted([(-1, 0), (0, -1), (0, 1)])): 3,
-        tuple(sorted([(-1, 0), (0, -1)])): 4,
-        tuple(sorted([(-1, 0), (0, -1), (1, 0)])): 5,
-        tuple(sorted([(1, 0), (0, -1)])): 6,
-        tuple(sorted([(1, 0), (0, -1), (0, 1)])): 7,
-        tuple(sorted([(1, 0), (-1, 0), (0, 1), (0, -1)])): 8,
-    }
-
-    for tile in tilemap_data.in_grid.values():
-        neighbors = set()
-        for shift in [(1, 0), (-1, 0), (0, -1), (0, 1)]:
-            check_pos = f"{tile['pos'][0] + shift[0]},{tile['pos'][1] + shift[1]}"
-            if check_pos in tilemap_data.in_grid and tilemap_data.in_grid[check_pos]['type'] == tile['type']:
-                neighbors.add(shift)
-        sorted_neighbors = tuple(sorted(neighbors))
-        
-        if tile['type'] in auto_tile_types and sorted_neighbors in AUTOTILE_MAP:
-            tile['variant'] = AUTOTILE_MAP[sorted_neighbors]
+        json.dump(tilemap_data.to_json(), f)
+    write_compiled_tilemap(BASE_TILEMAP_PATH + '/' + file_name)
 
 class EditorInputHandler:
     def __init__(self, editor_toolbox, camera, app):
@@ -62,7 +32,7 @@ class EditorInputHandler:
         self.keys = pg.key.get_pressed()
 
     def handle_keyboard_input(self):
-        """키보드 입력 처리 (C, TAB, V, B, O, U, CTRL+Z)"""
+        """키보드 입력 처리 (C, TAB, V, B, T, O, U, CTRL+Z, CTRL+Y / CTRL+SHIFT+Z)"""
         for event in self.app.events:
             if event.type == pg.KEYUP:
                 if event.key == pg.K_c and self.editor_toolbox.in_grid_mode:
@@ -74,20 +44,26 @@ class EditorInputHandler:
                     self.editor_toolbox.in_collision_view = not self.editor_toolbox.in_collision_view
                 elif event.key == pg.K_b:
                     self.editor_toolbox.autotile_and_rerender()
+                elif event.key == pg.K_t:
+                    self.editor_toolbox.auto_autotile = not self.editor_toolbox.auto_autotile
                 elif event.key == pg.K_o:
                     self.editor_toolbox.save_tilemap()
                 elif event.key == pg.K_u:
                     self.editor_toolbox.erase_all()
+                elif event.key == pg.K_z and self.keys[pg.K_LCTRL] and self.keys[pg.K_LSHIFT]:
+                    self.editor_toolbox.redo()
                 elif event.key == pg.K_z and self.keys[pg.K_LCTRL]:
                     self.editor_toolbox.undo()
+                elif event.key == pg.K_y and self.keys[pg.K_LCTRL]:
+                    self.editor_toolbox.redo()
 
     def handle_mouse_input(self):
         """마우스 입력 처리 (좌클릭 설치, 우클릭 삭제, 휠로 타일 변경)"""
         for event in self.app.events:
             if event.type == pg.MOUSEBUTTONDOWN and not self.editor_toolbox.in_grid_mode and event.button == 1:
                 self.editor_toolbox.place_tile_offgrid()
-            if event.type == pg.MOUSEBUTTONUP and event.button == 1:
-                self.editor_toolbox.last_placed_tile_pos = None
+            if event.type == pg.MOUSEBUTTONUP and event.button in (1, 3):
+                self.editor_toolbox.end_stroke()
             if event.type == pg.MOUSEWHEEL:
                 if self.keys[pg.K_LSHIFT]:
                     self.editor_toolbox.change_tile_variant(event.y)
@@ -128,10 +104,10 @@ class EditorUI:
         """좌측 상단 텍스트 출력 및 상태 표시기 생성"""
         texts = [
             ("[WASD] 움직이기", (10, 10), "white"),
-            ("[B] 오토 타일", (10, 110), "white"),
+            ("[B] 오토 타일 (전체)", (10, 110), "white"),
             ("[휠] 타일 종류 변경 | [SHIFT + 휠] 타일 인덱스 변경", (10, 135), "white"),
             ("[O] 저장하기 (temp.json에 저장됨.)", (10, 190), "white"),
-            ("[컨트롤 Z] 되돌리기 (최대 20까지)", (10, 215), "white"),
+            ("[컨트롤 Z] 되돌리기 | [컨트롤 Y] 다시하기", (10, 215), "white"),
             ("[U] 다 지워버렷", (10, 240), "green")
         ]
         for text, pos, color in texts:
@@ -141,17 +117,25 @@ class EditorUI:
         self.grid_mode_text_renderer = TextRenderer("", pg.Vector2(10, 60), color="white")
         self.view_mode_text_renderer = TextRenderer("", pg.Vector2(10, 85), color="white")
         self.current_tile_text_renderer = TextRenderer("", pg.Vector2(10, 165), color="red")
+        self.auto_autotile_text_renderer = TextRenderer("", pg.Vector2(10, 265), color="white")
+        self.reload_text_renderer = TextRenderer("", pg.Vector2(10, 290), color="yellow")
 
     def update(self):
         """화면에 현재 상태 텍스트 갱신"""
         self.collide_mode_text_renderer.text = "[C] 현재 : 충돌 가능" if self.editor_toolbox.can_collide else "[C] 현재 : 충돌 X"
         self.grid_mode_text_renderer.text = "[Tab] 현재: 그리드" if self.editor_toolbox.in_grid_mode else "[Tab] 현재: 자유"
         self.view_mode_text_renderer.text = "[V] 현재 : 충돌범위 뷰" if self.editor_toolbox.in_collision_view else "[V] 현재 : 일반 뷰"
+        self.auto_autotile_text_renderer.text = "[T] 현재 : 놓을때 오토 타일" if self.editor_toolbox.auto_autotile else "[T] 현재 : 오토 타일 수동"
         
         current_tile_type = self.editor_toolbox.tile_types[self.editor_toolbox.current_tile_type_index]
         current_tile_variant = self.editor_toolbox.current_tile_variant
         self.current_tile_text_renderer.text = f"{current_tile_type} : [{current_tile_variant}]"
 
+        # 밖에서 파일이 바뀌었는데 저장 안 한 편집 때문에 못 불러온 경우
+        watcher = self.editor_toolbox.scene.tilemap_watcher
+        self.reload_text_renderer.text = "temp.json이 밖에서 바뀜 (저장 안 한 편집이 있어서 안 불러옴)" \
+            if watcher is not None and watcher.reload_pending else ""
+
 class EditorToolbox:
     def __init__(self, scene, tilemap_data, tilemap_renderer, app, camera):
         self.scene = scene
@@ -162,11 +146,12 @@ class EditorToolbox:
         self.tile_types = list(self.app.ASSETS["tilemap"].keys())
         self.current_tile_type_index = 0
         self.current_tile_variant = 0
-        self.undo_stack = []
+        self.history = EditHistory(MAX_UNDO_STEPS, MAX_UNDO_CHANGES)
         self.last_placed_tile_pos = None
         self.can_collide = True
         self.in_grid_mode = True
         self.in_collision_view = False
+        self.auto_autotile = True  # 그리드 타일 놓거나 지울때마다 주변 칸 오토타일
         self.mouse_world_pos = pg.Vector2(0, 0)
         self.tile_pos = pg.Vector2(0, 0)
 
@@ -182,36 +167,68 @@ class EditorToolbox:
             self.tile_pos = pg.Vector2(self.mouse_world_pos.x / self.tilemap_data.tile_size,
                                          self.mouse_world_pos.y / self.tilemap_data.tile_size)
 
-    def save_undo_state(self):
-        """undo 스택에 현재 타일맵 상태 저장"""
-        self.undo_stack.append({
-            "in_grid": copy.deepcopy(self.tilemap_data.in_grid),
-            "off_grid": copy.deepcopy(self.tilemap_data.off_grid)
-        })
-        if len(self.undo_stack) > MAX_UNDO_STACK:
-            self.undo_stack.pop(0)
+    def end_stroke(self):
+        """마우스 뗐을때 호출, 누르고 있는 동안 칠하거나 지운걸 undo 한 단계로 묶음"""
+        self.history.commit()
+        self.last_placed_tile_pos = None
 
     def undo(self):
-        """undo 스택에서 마지막 상태 불러와 타일맵 롤백"""
-        if not self.undo_stack:
-            return
-        last_state = self.undo_stack.pop()
-        self.tilemap_data.in_grid = last_state["in_grid"]
-        self.tilemap_data.off_grid = last_state["off_grid"]
-        self.tilemap_renderer.rerender()
+        """마지막 단계 되돌림 (바뀐 칸만 다시 그림)"""
+        self.history.undo(self.tilemap_data, self.tilemap_renderer)
+
+    def redo(self):
+        """되돌린 단계 다시 적용"""
+        self.history.redo(self.tilemap_data, self.tilemap_renderer)
 
     def autotile_and_rerender(self):
-        autotile(self.tilemap_data)
-        self.tilemap_renderer.rerender()
+        """맵 전체 일괄 오토타일 (undo 한 단계로 기록)"""
+        self.history.commit()
+        changes = autotile_all(self.tilemap_data)
+        for before, after in changes:
+            self.history.record_grid(before, after)
+        self.history.commit()
+
+        if len(changes) > BULK_REPAINT_THRESHOLD:
+            self.tilemap_renderer.rerender()
+        else:
+            for before, after in changes:
+                self.tilemap_renderer.replace_tile(before, after)
+
+    def autotile_around(self, x: int, y: int):
+        """자동 오토타일 켜져있으면 바뀐 칸 + 주변 8칸만 다시 오토타일하고 그 칸들만 다시 그림"""
+        if not self.auto_autotile:
+            return
+        for before, after in autotile_around(self.tilemap_data, x, y):
+            self.history.record_grid(before, after)
+            self.tilemap_renderer.replace_tile(before, after)
 
     def save_tilemap(self):
         save_tilemap_file(self.tilemap_data)
+        self.history.mark_saved()
+        if self.scene.tilemap_watcher is not None:
+            self.scene.tilemap_watcher.sync()
+
+    def reload_tilemap(self, watcher: TilemapWatcher):
+        """
+        밖에서 temp.json 고친걸 반영 (undo 한 단계로 기록)
+        저장 안 한 편집이 있으면 덮어쓰지 않고 바뀐것만 확인함
+        """
+        changes = watcher.poll(apply=not self.history.is_modified())
+        if changes:
+            self.history.record_changes(changes)
+            self.history.mark_saved()
 
     def erase_all(self):
-        """전체 타일 삭제 + undo 저장 + 리렌더"""
-        self.tilemap_data.in_grid = {}
-        self.tilemap_data.off_grid = []
-        self.save_undo_state()
+        """전체 타일 삭제 (undo 한 단계로 기록) + 리렌더"""
+        self.history.commit()
+        for tile in list(self.tilemap_data.in_grid.values()):
+            self.tilemap_data.remove_grid_tile(*tile["pos"])
+            self.history.record_grid(tile, None)
+        # 한번에 비우고, 뒤에서부터 지운걸로 기록해야 undo할때 앞에서부터 원래 자리에 다시 들어감
+        removed = self.tilemap_data.clear_off_grid()
+        for index in range(len(removed) - 1, -1, -1):
+            self.history.record_off_grid(index, removed[index], added=False)
+        self.history.commit()
         self.tilemap_renderer.rerender()
 
     def change_tile_variant(self, delta):
@@ -235,48 +252,53 @@ class EditorToolbox:
         key = f"{int(self.tile_pos.x)},{int(self.tile_pos.y)}"
         if self.last_placed_tile_pos == key:
             return
-        self.save_undo_state()
 
-        self.tilemap_data.in_grid[key] = {
+        tile = {
             "pos": [int(self.tile_pos.x), int(self.tile_pos.y)],
             "type": self.tile_types[self.current_tile_type_index],
             "variant": self.current_tile_variant,
             "can_collide": self.can_collide
         }
+        previous = self.tilemap_data.get_grid_tile(*tile["pos"])
+        self.tilemap_data.set_grid_tile(tile)
+        self.history.record_grid(previous, tile)
+        if previous is not None:
+            self.tilemap_renderer.replace_tile(previous, tile)
+        else:
+            self.tilemap_renderer.add_tile(tile, in_grid=True)
+        self.autotile_around(*tile["pos"])
         self.last_placed_tile_pos = key
-        self.tilemap_renderer.rerender()
 
     def place_tile_offgrid(self):
         """자유 모드에서 타일 설치"""
         if self.in_grid_mode:
             return
-        self.save_undo_state()
-        self.tilemap_data.off_grid.append({
+        tile = {
             "pos": [self.tile_pos.x, self.tile_pos.y],
             "type": self.tile_types[self.current_tile_type_index],
             "variant": self.current_tile_variant
-        })
-        self.tilemap_renderer.rerender()
+        }
+        self.tilemap_data.add_off_grid_tile(tile)
+        self.history.record_off_grid(len(self.tilemap_data.off_grid) - 1, tile, added=True)
+        self.history.commit()
+        self.tilemap_renderer.add_tile(tile, in_grid=False)
 
     def remove_tile(self):
         """마우스 위치 타일 삭제 (그리드/자유 모드 모두)"""
         if self.in_grid_mode:
-            key = f"{int(self.tile_pos.x)},{int(self.tile_pos.y)}"
-            if key in self.tilemap_data.in_grid:
-                self.save_undo_state()
-                del self.tilemap_data.in_grid[key]
+            tile_x, tile_y = int(self.tile_pos.x), int(self.tile_pos.y)
+            removed = self.tilemap_data.remove_grid_tile(tile_x, tile_y)
+            if removed is not None:
+                self.history.record_grid(removed, None)
+                self.tilemap_renderer.remove_tile(removed)
+                self.autotile_around(tile_x, tile_y)
         else:
-            for obj_data in self.tilemap_data.off_grid.copy():
-                original_image = self.app.ASSETS["tilemap"][obj_data["type"]][obj_data["variant"]]
-                size = original_image.get_size()
-                rect = pg.Rect(obj_data["pos"][0] * self.tilemap_data.tile_size,
-                                obj_data["pos"][1] * self.tilemap_data.tile_size,
-                                size[0], size[1])
-                if rect.collidepoint(self.mouse_world_pos):
-                    self.save_undo_state()
-                    if obj_data in self.tilemap_data.off_grid:
-                        self.tilemap_data.off_grid.remove(obj_data)
-        self.tilemap_renderer.rerender()
+            off_grid_index = self.tilemap_data.get_off_grid_index(self.app.ASSETS["tilemap"])
+            for obj_data in off_grid_index.query_point(self.mouse_world_pos):
+                index = self.tilemap_data.remove_off_grid_tile(obj_data)
+                if index is not None:
+                    self.history.record_off_grid(index, obj_data, added=False)
+                    self.tilemap_renderer.remove_tile(obj_data)
     
     def draw_grid(self, surface):
         """그리드 모드일 때 그리드 선 그리기"""
@@ -362,12 +384,16 @@ class TileMapEditScene(Scene):
 
     def on_scene_start(self):
         super().on_scene_start()
-        self.tilemap_data = TilemapData("temp.json")
+        self.tilemap_data = TilemapData("temp.json", use_compiled_level=False)
         self.tilemap_renderer = TilemapRenderer(self.tilemap_data)
+        # 밖에서 temp.json 고치면 바뀐 타일만 바로 반영
+        self.tilemap_watcher = TilemapWatcher(self.tilemap_data, self.tilemap_renderer) if TILEMAP_HOT_RELOAD_IN_EDITOR else None
         self.editor = TileMapEditor(self)
         Sky()
 
     def update(self):
+        if self.tilemap_watcher is not None:
+            self.editor.toolbox.reload_tilemap(self.tilemap_watcher)
         self.editor.update()
         super().update()
 
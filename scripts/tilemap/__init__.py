@@ -1,2 +1,14 @@
-from .tilemap import TilemapData, TilemapRenderer, BASE_TILEMAP_PATH
-from .spawner import spawn_all_entities_by_data
\ No newline at end of file
+from .tilemap import TilemapData, TilemapRenderer, BASE_TILEMAP_PATH, DO_NOT_RENDER_TILES
+from .tile_grid import TileGrid
+from .type_index import TileTypeIndex
+from .off_grid_index import OffGridIndex, OFF_GRID_CELL_SIZE
+from .collision import CollisionShapes, merge_solid_cells
+from .chunk import TileChunkBaker, TileChunkCache, CHUNK_SIZE, CHUNK_CACHE_BUDGET
+from .compiled_map import read_compiled_tilemap, write_compiled_tilemap, verify_compiled_tilemap, COMPILED_TILEMAP_EXT
+from .level_compiler import CompiledLevel, compile_level, compile_all_levels, load_compiled_level, COMPILED_LEVEL_EXT
+from .autotile import autotile_all, autotile_around, AUTOTILE_TYPES, AUTOTILE_TABLES
+from .edit_history import EditHistory, apply_changes, BULK_REPAINT_THRESHOLD
+from .hot_reload import TilemapWatcher, diff_tilemap, TILEMAP_HOT_RELOAD, TILEMAP_HOT_RELOAD_IN_EDITOR, HOT_RELOAD_POLL_INTERVAL
+from .prefetch import TilemapPrefetcher, PrefetchedLevel, prepare_level
+from .minimap import Minimap, bake_minimap, MINIMAP_PIXELS_PER_TILE
+from .spawner import spawn_all_entities_by_data
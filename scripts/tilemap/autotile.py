@@ -0,0 +1,116 @@
+import re
+
+from .tile_grid import TileGrid, NEIGHBOR_OFFSETS
+
+# 오토타일 적용할 타일 타입들
+AUTOTILE_TYPES = ("dirt", "stone", "dead_grass")
+
+# 같은 타입 이웃 방향 비트
+NEIGHBOR_RIGHT = 1
+NEIGHBOR_LEFT = 2
+NEIGHBOR_UP = 4
+NEIGHBOR_DOWN = 8
+
+# 이웃 비트마스크 -> variant (여기 없는 모양은 variant 그대로 둠)
+AUTOTILE_RULES = {
+    NEIGHBOR_RIGHT | NEIGHBOR_DOWN: 0,
+    NEIGHBOR_RIGHT | NEIGHBOR_DOWN | NEIGHBOR_LEFT: 1,
+    NEIGHBOR_LEFT | NEIGHBOR_DOWN: 2,
+    NEIGHBOR_LEFT | NEIGHBOR_UP | NEIGHBOR_DOWN: 3,
+    NEIGHBOR_LEFT | NEIGHBOR_UP: 4,
+    NEIGHBOR_LEFT | NEIGHBOR_UP | NEIGHBOR_RIGHT: 5,
+    NEIGHBOR_RIGHT | NEIGHBOR_UP: 6,
+    NEIGHBOR_RIGHT | NEIGHBOR_UP | NEIGHBOR_DOWN: 7,
+    NEIGHBOR_RIGHT | NEIGHBOR_LEFT | NEIGHBOR_UP | NEIGHBOR_DOWN: 8,
+}
+
+# 비트마스크(0~15) -> variant 조회표, KEEP_VARIANT면 안 바꿈 (bytes.translate에 바로 쓸 수 있게 256칸)
+KEEP_VARIANT = 0xFF
+AUTOTILE_LUT = bytes(AUTOTILE_RULES.get(mask, KEEP_VARIANT) for mask in range(256))
+# 타입별 조회표 (지금은 셋 다 같은 모양 규칙)
+AUTOTILE_TABLES: dict[str, bytes] = {tile_type: AUTOTILE_LUT for tile_type in AUTOTILE_TYPES}
+
+# 규칙 없는 비트마스크 -> 0xFF, 있으면 0 (일괄 처리때 안 바꿀 칸 골라내기용)
+_KEEP_MASK_TABLE = bytes(0xFF if variant == KEEP_VARIANT else 0 for variant in AUTOTILE_LUT)
+_CHANGED_CELL = re.compile(rb"[^\x00]")
+
+def neighbor_mask(grid: TileGrid, x: int, y: int) -> int:
+    '''(x, y) 칸 기준 같은 타입 상하좌우 이웃 비트마스크'''
+    type_id = grid.ids[grid.index(x, y)]
+    mask = 0
+    for bit, (offset_x, offset_y) in ((NEIGHBOR_RIGHT, (1, 0)), (NEIGHBOR_LEFT, (-1, 0)),
+                                      (NEIGHBOR_UP, (0, -1)), (NEIGHBOR_DOWN, (0, 1))):
+        i = grid.index(x + offset_x, y + offset_y)
+        if i >= 0 and grid.ids[i] == type_id:
+            mask |= bit
+    return mask
+
+def autotile_around(tilemap_data, x: int, y: int) -> list[tuple[dict, dict]]:
+    """
+    (x, y) 칸이랑 주변 8칸만 다시 오토타일 (타일 하나 놓거나 지운 직후용)
+
+    - variant 바뀌는 타일은 새 dict로 바꿔 끼움 (undo 기록이 예전 dict를 들고 있으니까)
+
+    :return: 바뀐 타일들 (이전 타일, 새 타일) 리스트
+    """
+    grid = tilemap_data.grid
+    changes = []
+    for offset_x, offset_y in NEIGHBOR_OFFSETS:
+        tile = grid.get(x + offset_x, y + offset_y)
+        if tile is None or tile["type"] not in AUTOTILE_TABLES:
+            continue
+        variant = AUTOTILE_TABLES[tile["type"]][neighbor_mask(grid, x + offset_x, y + offset_y)]
+        if variant != KEEP_VARIANT and variant != tile["variant"]:
+            new_tile = dict(tile, variant=variant)
+            tilemap_data.set_grid_tile(new_tile)
+            changes.append((tile, new_tile))
+    return changes
+
+def autotile_all(tilemap_data, auto_tile_types: tuple[str, ...] = AUTOTILE_TYPES) -> list[tuple[dict, dict]]:
+    """
+    맵 전체를 한번에 오토타일 (에디터 일괄 적용 / 오프라인 컴파일용)
+
+    그리드 배열 전체를 큰 정수 하나로 보고 비트 시프트로 이웃 비트마스크를 한번에 계산함
+    (바이트 하나 = 칸 하나, 8비트 시프트 = 옆칸, 8 * width 비트 시프트 = 윗칸 / 아랫칸)
+    실제로 variant가 바뀌는 칸만 파이썬에서 하나씩 처리함
+
+    :return: 바뀐 타일들 (이전 타일, 새 타일) 리스트
+    """
+    grid = tilemap_data.grid
+    width, height = grid.width, grid.height
+    cells = width * height
+    if cells == 0:
+        return []
+
+    full = (1 << (8 * cells)) - 1
+    not_last_column = int.from_bytes((b"\x01" * (width - 1) + b"\x00") * height, "little")
+    not_first_column = int.from_bytes((b"\x00" + b"\x01" * (width - 1)) * height, "little")
+    variants = int.from_bytes(grid.variants, "little")
+
+    changes = []
+    for tile_type in auto_tile_types:
+        if tile_type not in grid.type_ids or tile_type not in AUTOTILE_TABLES:
+            continue
+        type_id = grid.type_ids[tile_type]
+        same = int.from_bytes(grid.ids.translate(bytes(int(i == type_id) for i in range(256))), "little")
+
+        right = (same >> 8) & not_last_column
+        left = (same << 8) & not_first_column & full
+        up = (same << (8 * width)) & full
+        down = same >> (8 * width)
+        masks = (right * NEIGHBOR_RIGHT | left * NEIGHBOR_LEFT | up * NEIGHBOR_UP | down * NEIGHBOR_DOWN) & (same * 0xFF)
+        mask_bytes = masks.to_bytes(cells, "little")
+
+        # 안 바꿀 칸 = 다른 타입이거나 규칙 없는 모양
+        keep = int.from_bytes(mask_bytes.translate(_KEEP_MASK_TABLE), "little") | (full ^ (same * 0xFF))
+        new_variants = int.from_bytes(mask_bytes.translate(AUTOTILE_TABLES[tile_type]), "little")
+        changed = ((new_variants ^ variants) & ~keep & full).to_bytes(cells, "little")
+
+        new_variant_bytes = new_variants.to_bytes(cells, "little")
+        for match in _CHANGED_CELL.finditer(changed):
+            i = match.start()
+            tile = grid.tiles[i]
+            new_tile = dict(tile, variant=new_variant_bytes[i])
+            tilemap_data.set_grid_tile(new_tile)
+            changes.append((tile, new_tile))
+    return changes
@@ -0,0 +1,270 @@
+import pygame as pg
+from collections import OrderedDict
+
+from .level_compiler import tile_assets_signature
+
+# 청크 한 변의 길이 (픽셀, 타일 크기 64의 배수로 맞춰둠)
+CHUNK_SIZE = 512
+# 구운 청크 서피스들이 쓸 수 있는 최대 메모리 (바이트)
+CHUNK_CACHE_BUDGET = 64 * 1024 * 1024
+
+ChunkKey = tuple[int, int]
+
+class TileChunkBaker:
+    '''
+    타일맵을 CHUNK_SIZE 크기 청크로 나눠서 청크 하나씩 서피스로 구워주는 클래스
+    GameObject 아님. 렌더러(혹은 다른 스레드)가 들고 쓰는 용도
+
+    :param tilemap_data: 구울 타일맵 데이터
+    :param tile_assets: App.ASSETS["tilemap"] (타입 -> 이미지 리스트)
+    :param chunk_size: 청크 한 변 길이 (픽셀)
+    :param skip_types: 굽지 않을 타일 타입들
+    '''
+
+    def __init__(self, tilemap_data, tile_assets: dict[str, list[pg.Surface]],
+                 chunk_size: int = CHUNK_SIZE, skip_types: tuple[str, ...] = ()):
+        self.data = tilemap_data
+        self.tile_assets = tile_assets
+        self.chunk_size = chunk_size
+        self.skip_types = skip_types
+
+        # 청크 좌표 -> 그 청크에 걸쳐있는 타일들 (off_grid 먼저, in_grid 나중 순서 유지)
+        self.chunk_tiles: dict[ChunkKey, list[dict]] = {}
+        # 타일(id) -> 인덱스에 넣을때 계산한 Rect (지울때 variant가 바뀌었어도 원래 자리 찾으려고, 없으면 그때 계산)
+        self.tile_rects: dict[int, pg.Rect] = {}
+        if not self.load_compiled_index():
+            self.rebuild_index()
+
+    def tile_rect(self, data: dict) -> pg.Rect:
+        '''타일 이미지가 차지하는 월드 Rect (그려지는 위치 기준)'''
+        image = self.tile_assets[data["type"]][data["variant"]]
+        tile_size = self.data.tile_size
+        x = round(data["pos"][0] * tile_size)
+        y = round(data["pos"][1] * tile_size)
+        return pg.Rect(x, y, image.get_width(), image.get_height())
+
+    def chunk_keys_in_rect(self, rect: pg.Rect) -> list[ChunkKey]:
+        '''월드 Rect에 걸치는 모든 청크 좌표 반환'''
+        size = self.chunk_size
+        start_x, end_x = rect.left // size, (rect.right - 1) // size
+        start_y, end_y = rect.top // size, (rect.bottom - 1) // size
+        return [(cx, cy) for cy in range(start_y, end_y + 1) for cx in range(start_x, end_x + 1)]
+
+    def rebuild_index(self):
+        '''
+        청크별 타일 목록 전체 재계산
+        그리는 순서가 원래 캐시 서피스 방식이랑 같도록 off_grid -> in_grid 순서로 넣음
+        '''
+        self.chunk_tiles = {}
+        self.tile_rects = {}
+        for data in self.data.off_grid:
+            self._index_tile(data)
+        for data in self.data.in_grid.values():
+            self._index_tile(data)
+
+    def load_compiled_index(self) -> bool:
+        '''
+        컴파일된 레벨에 있는 청크 인덱스를 그대로 씀 (타일마다 Rect 계산 생략)
+
+        :return: 썼으면 True, 컴파일된 레벨이 없거나 설정이 달라서 못 쓰면 False
+        '''
+        level = getattr(self.data, "compiled_level", None)
+        if (level is None or level.chunk_size != self.chunk_size or level.skip_types != tuple(self.skip_types)
+                or level.assets_signature != tile_assets_signature(self.tile_assets)):
+            return False
+
+        tiles = self.data.off_grid + list(self.data.in_grid.values())
+        self.chunk_tiles = {key: [tiles[i] for i in indices] for key, indices in level.chunks.items()}
+        self.tile_rects = {}
+        return True
+
+    def _index_tile(self, data: dict):
+        if data["type"] in self.skip_types:
+            return
+        rect = self.tile_rect(data)
+        self.tile_rects[id(data)] = rect
+        for key in self.chunk_keys_in_rect(rect):
+            self.chunk_tiles.setdefault(key, []).append(data)
+
+    def add_tile(self, data: dict, in_grid: bool) -> pg.Rect | None:
+        '''
+        타일 하나를 청크 인덱스에 추가 (전체 재계산 없이)
+        off_grid 타일은 off_grid 리스트 순서대로, 그 청크의 in_grid 타일들보다 앞에 넣어서 원래 그리는 순서 유지
+        (off_grid 타일이면 tilemap_data.off_grid에 먼저 넣고 부를 것)
+
+        :param in_grid: 그리드 타일인지 (False면 자유 배치 타일)
+        :return: 타일이 차지하는 월드 Rect (안 그리는 타입이면 None)
+        '''
+        if data["type"] in self.skip_types:
+            return None
+        rect = self.tile_rect(data)
+        self.tile_rects[id(data)] = rect
+        # off_grid 타일 순서 (undo로 중간에 다시 들어가는 경우도 있어서 리스트 위치 기준으로 끼워넣음)
+        off_grid_order = None if in_grid else {id(tile): i for i, tile in enumerate(self.data.off_grid)}
+        for key in self.chunk_keys_in_rect(rect):
+            tiles = self.chunk_tiles.setdefault(key, [])
+            if in_grid:
+                tiles.append(data)
+                continue
+            # 그리드 타일(off_grid에 없는 타일)이나 off_grid에서 더 뒤에 있는 타일 앞에 끼워넣음
+            order = off_grid_order[id(data)]
+            insert_at = len(tiles)
+            for i, other in enumerate(tiles):
+                if off_grid_order.get(id(other), order + 1) > order:
+                    insert_at = i
+                    break
+            tiles.insert(insert_at, data)
+        return rect
+
+    def remove_tile(self, data: dict) -> pg.Rect | None:
+        '''
+        타일 하나를 청크 인덱스에서 뺌 (타일이 하나도 안 남은 청크는 목록에서도 지움)
+
+        :return: 타일이 차지하던 월드 Rect (안 그리는 타입이면 None)
+        '''
+        rect = self.tile_rects.pop(id(data), None)
+        if rect is None:
+            if data["type"] in self.skip_types:
+                return None
+            rect = self.tile_rect(data)
+        for key in self.chunk_keys_in_rect(rect):
+            tiles = self.chunk_tiles.get(key)
+            if tiles is None:
+                continue
+            for i, other in enumerate(tiles):
+                if other is data:
+                    del tiles[i]
+                    break
+            if not tiles:
+                del self.chunk_tiles[key]
+        return rect
+
+    def replace_tile(self, old: dict, new: dict) -> pg.Rect | None:
+        '''
+        그리드 칸의 타일을 다른 타일로 교체 (같은 자리에 그대로 바꿔 끼워서 그리는 순서 유지)
+
+        :return: 다시 그려야 하는 월드 Rect (둘다 안 그리는 타입이면 None)
+        '''
+        old_rect = self.tile_rects.get(id(old))
+        if old_rect is None or new["type"] in self.skip_types or self.tile_rect(new) != old_rect:
+            removed, added = self.remove_tile(old), self.add_tile(new, in_grid=True)
+            if removed is None or added is None:
+                return removed or added
+            return removed.union(added)
+
+        del self.tile_rects[id(old)]
+        self.tile_rects[id(new)] = old_rect
+        for key in self.chunk_keys_in_rect(old_rect):
+            tiles = self.chunk_tiles[key]
+            for i, other in enumerate(tiles):
+                if other is old:
+                    tiles[i] = new
+                    break
+        return old_rect
+
+    def repaint(self, surface: pg.Surface, key: ChunkKey, world_rect: pg.Rect):
+        '''
+        구워둔 청크 서피스에서 world_rect 부분만 지우고 다시 그림 (청크 전체 다시 굽는 것보다 훨씬 쌈)
+        '''
+        origin = self.chunk_origin(key)
+        local_rect = world_rect.move(-int(origin.x), -int(origin.y)).clip(surface.get_rect())
+        if not local_rect:
+            return
+        surface.set_clip(local_rect)
+        surface.fill((0, 0, 0, 0), local_rect)
+        for data in self.chunk_tiles.get(key, ()):
+            rect = self.tile_rects.get(id(data)) or self.tile_rect(data)
+            if rect.colliderect(world_rect):
+                self.draw_tile(surface, data, origin)
+        surface.set_clip(None)
+
+    def chunk_origin(self, key: ChunkKey) -> pg.Vector2:
+        '''청크 좌상단 월드 좌표'''
+        return pg.Vector2(key[0] * self.chunk_size, key[1] * self.chunk_size)
+
+    def draw_tile(self, surface: pg.Surface, data: dict, origin: pg.Vector2):
+        '''
+        타일 하나를 서피스에 그림
+
+        :param surface: 그릴 서피스 (보통 청크 서피스)
+        :param data: 타일 데이터 dict (pos, type, variant 등)
+        :param origin: 서피스 (0, 0)에 해당하는 월드 좌표
+        '''
+        image = self.tile_assets[data["type"]][data["variant"]]
+        world_pos = pg.Vector2(data["pos"]) * self.data.tile_size
+        surface.blit(image, (round(world_pos.x) - origin.x, round(world_pos.y) - origin.y))
+
+    def bake(self, key: ChunkKey) -> pg.Surface | None:
+        '''
+        청크 하나를 새 서피스에 구워서 반환
+        그릴 타일이 하나도 없으면 서피스 안 만들고 None 반환 (메모리 0)
+        '''
+        tiles = self.chunk_tiles.get(key)
+        if not tiles:
+            return None
+
+        surface = pg.Surface((self.chunk_size, self.chunk_size), pg.SRCALPHA)
+        origin = self.chunk_origin(key)
+        for data in tiles:
+            self.draw_tile(surface, data, origin)
+        return surface
+
+class TileChunkCache:
+    '''
+    구운 청크 서피스 LRU 캐시
+    메모리 예산 넘으면 가장 오래 안 쓴 청크부터 버림 (버린 청크는 다시 보이면 또 구움)
+
+    :param budget_bytes: 청크 서피스들이 쓸 수 있는 최대 바이트
+    '''
+
+    def __init__(self, budget_bytes: int = CHUNK_CACHE_BUDGET):
+        self.budget_bytes = budget_bytes
+        self.used_bytes = 0
+        # 빈 청크는 None으로 저장 (다시 굽지 않게 표시만 해둠)
+        self.chunks: OrderedDict[ChunkKey, pg.Surface | None] = OrderedDict()
+
+    @staticmethod
+    def surface_bytes(surface: pg.Surface | None) -> int:
+        if surface is None:
+            return 0
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+
+    def __contains__(self, key: ChunkKey) -> bool:
+        return key in self.chunks
+
+    def __len__(self) -> int:
+        return len(self.chunks)
+
+    def get(self, key: ChunkKey) -> pg.Surface | None:
+        '''청크 서피스 반환 + 최근 사용으로 표시 (없으면 KeyError)'''
+        self.chunks.move_to_end(key)
+        return self.chunks[key]
+
+    def put(self, key: ChunkKey, surface: pg.Surface | None, keep: set[ChunkKey] = frozenset()):
+        '''
+        청크 서피스 저장 후 예산 넘으면 오래된 것부터 버림
+
+        :param keep: 이번 프레임에 보이는 청크들 (예산 넘어도 안 버림)
+        '''
+        self.discard(key)
+        self.chunks[key] = surface
+        self.used_bytes += self.surface_bytes(surface)
+        self.evict(keep)
+
+    def evict(self, keep: set[ChunkKey] = frozenset()):
+        '''예산 안으로 들어올 때까지 LRU 순서로 청크 버림'''
+        for key in list(self.chunks):
+            if self.used_bytes <= self.budget_bytes:
+                return
+            if key in keep:
+                continue
+            self.discard(key)
+
+    def discard(self, key: ChunkKey):
+        '''청크 하나 버림 (다음에 보이면 다시 구워짐)'''
+        if key in self.chunks:
+            self.used_bytes -= self.surface_bytes(self.chunks.pop(key))
+
+    def clear(self):
+        self.chunks.clear()
+        self.used_bytes = 0
@@ -0,0 +1,146 @@
+import pygame as pg
+from array import array
+
+from .tile_grid import TileGrid, NEIGHBOR_OFFSETS
+
+NO_SHAPE = -1
+
+def merge_solid_cells(solid: bytearray, width: int, height: int) -> list[tuple[int, int, int, int]]:
+    '''
+    충돌 비트맵에서 붙어있는 충돌 칸들을 최대한 큰 직사각형으로 합침 (greedy)
+
+    - 위에서 아래, 왼쪽에서 오른쪽으로 훑으면서 아직 안 쓴 충돌 칸을 만나면
+      오른쪽으로 최대한 늘리고, 그 폭 그대로 아래로 최대한 늘림
+    - 모든 충돌 칸은 정확히 하나의 직사각형에만 들어감
+
+    :param solid: 셀별 충돌 여부 (1 = 충돌), 행 우선
+    :param width: 그리드 가로 칸 수
+    :param height: 그리드 세로 칸 수
+    :return: (칸 x, 칸 y, 칸 폭, 칸 높이) 리스트 (그리드 로컬 좌표)
+    '''
+    used = bytearray(width * height)
+    shapes = []
+    for y in range(height):
+        row = y * width
+        x = 0
+        while x < width:
+            i = row + x
+            if not solid[i] or used[i]:
+                x += 1
+                continue
+
+            # 오른쪽으로 늘리기
+            w = 1
+            while x + w < width and solid[i + w] and not used[i + w]:
+                w += 1
+
+            # 같은 폭으로 아래로 늘리기 (행 전체가 충돌 + 미사용이어야 함)
+            full, empty = b"\x01" * w, bytes(w)
+            h = 1
+            while y + h < height:
+                j = i + h * width
+                if solid[j:j + w] != full or used[j:j + w] != empty:
+                    break
+                h += 1
+
+            for k in range(h):
+                j = i + k * width
+                used[j:j + w] = full
+            shapes.append((x, y, w, h))
+            x += w
+    return shapes
+
+class CollisionShapes:
+    '''
+    타일맵 충돌 칸들을 greedy로 합친 직사각형들 + 칸 -> 직사각형 조회표
+
+    - rects: 합쳐진 충돌 Rect들 (월드 좌표, 절대 수정하지 말 것)
+    - cell_shape: 그리드 칸 인덱스 -> rects 인덱스 (충돌 칸 아니면 -1)
+    - 그리드가 바뀌면 (에디터 등) 다음 조회때 알아서 다시 합침
+
+    :param grid: 합칠 충돌 비트맵을 가진 TileGrid
+    :param rects: 미리 합쳐둔 충돌 직사각형들 (컴파일된 레벨), 없으면 지금 합침
+    '''
+
+    def __init__(self, grid: TileGrid, rects: list[tuple[int, int, int, int]] | None = None):
+        self.grid = grid
+        self.rects: list[pg.Rect] = []
+        self.cell_shape = array("i")
+        self.built_revision = -1
+        if rects is not None:
+            self.load(rects)
+        else:
+            self.rebuild()
+
+    def rebuild(self):
+        '''충돌 직사각형 전체 다시 계산'''
+        grid = self.grid
+        size = grid.tile_size
+        self.rects = []
+        self.cell_shape = array("i", [NO_SHAPE]) * (grid.width * grid.height)
+
+        for shape_id, (x, y, w, h) in enumerate(merge_solid_cells(grid.solid, grid.width, grid.height)):
+            self.rects.append(pg.Rect((grid.origin_x + x) * size, (grid.origin_y + y) * size, w * size, h * size))
+            for row in range(y, y + h):
+                start = row * grid.width + x
+                self.cell_shape[start:start + w] = array("i", [shape_id]) * w
+
+        self.built_revision = grid.revision
+
+    def load(self, rects: list[tuple[int, int, int, int]]):
+        '''미리 합쳐둔 충돌 직사각형들(월드 좌표)로 채움 (합치는 계산 생략)'''
+        grid = self.grid
+        size = grid.tile_size
+        self.rects = [pg.Rect(rect) for rect in rects]
+        self.cell_shape = array("i", [NO_SHAPE]) * (grid.width * grid.height)
+
+        for shape_id, rect in enumerate(self.rects):
+            x, w = rect.x // size - grid.origin_x, rect.w // size
+            for row in range(rect.y // size - grid.origin_y, rect.bottom // size - grid.origin_y):
+                start = row * grid.width + x
+                self.cell_shape[start:start + w] = array("i", [shape_id]) * w
+
+        self.built_revision = grid.revision
+
+    def ensure_built(self):
+        '''그리드가 마지막으로 합친 뒤 바뀌었으면 다시 합침'''
+        if self.built_revision != self.grid.revision:
+            self.rebuild()
+
+    def rect_at(self, pos) -> pg.Rect | None:
+        '''
+        월드 좌표가 들어있는 충돌 직사각형 반환 (없으면 None)
+
+        :param pos: 월드 좌표 (pg.Vector2나 (x, y) 튜플)
+        '''
+        self.ensure_built()
+        grid = self.grid
+        i = grid.index(int(pos[0] // grid.tile_size), int(pos[1] // grid.tile_size))
+        if i < 0 or self.cell_shape[i] == NO_SHAPE:
+            return None
+        return self.rects[self.cell_shape[i]]
+
+    def rects_around_points(self, points) -> list[pg.Rect]:
+        '''
+        여러 좌표 각각의 주변 3x3 칸에 걸친 충돌 직사각형들 반환 (중복 제거됨)
+
+        :param points: 월드 좌표들 (pg.Vector2나 (x, y) 튜플)
+        '''
+        self.ensure_built()
+        grid = self.grid
+        tile_size = grid.tile_size
+        cell_shape = self.cell_shape
+        seen = set()
+        rects = []
+        for point in points:
+            tile_x = int(point[0] // tile_size)
+            tile_y = int(point[1] // tile_size)
+            for offset_x, offset_y in NEIGHBOR_OFFSETS:
+                i = grid.index(tile_x + offset_x, tile_y + offset_y)
+                if i < 0:
+                    continue
+                shape_id = cell_shape[i]
+                if shape_id != NO_SHAPE and shape_id not in seen:
+                    seen.add(shape_id)
+                    rects.append(self.rects[shape_id])
+        return rects
@@ -0,0 +1,241 @@
+"""
+타일맵 바이너리 포맷 (.ltm) 읽기 / 쓰기 + JSON -> 바이너리 변환기
+
+JSON은 타일마다 "pos", "type", "variant", "can_collide" 키를 반복해서 들고 있어서
+크고 파싱도 느림. 재시작 / 레벨 전환때 JSON 파싱 안 하도록 같은 내용을 바이너리로 저장해둠.
+
+파일 구조 (전부 little endian):
+    헤더         HEADER_FORMAT (매직, 버전, tile_size, 원본 JSON sha1, 원본 JSON 크기, 원본 JSON 수정 시간(ns),
+                              타입 수, in_grid 수, off_grid 수)
+    문자열 테이블 타입 이름마다 (길이 u8 + utf-8 바이트)
+    in_grid     GRID_RECORD_FORMAT 레코드들 (x, y, 타입 id, variant, 플래그)
+    off_grid    OFF_GRID_RECORD_FORMAT 레코드들 (x, y, 타입 id, variant)
+
+- 원본 JSON의 sha1을 헤더에 같이 저장해서, JSON이 바뀌었으면 바이너리는 무시하고 JSON 씀
+- 원본 JSON 크기 / 수정 시간이 헤더랑 같으면 JSON은 열지도 않음 (다를때만 JSON 읽어서 sha1 비교,
+  git checkout 등으로 수정 시간만 바뀐 경우라 내용이 같으면 그대로 씀)
+- 읽을 때는 mmap으로 열고 struct.iter_unpack으로 레코드 단위로 바로 풀어냄
+
+변환 / 검증은 프로젝트 루트의 convert_tilemaps.py 참고
+"""
+import glob
+import hashlib
+import json
+import mmap
+import os
+import struct
+
+COMPILED_TILEMAP_EXT = ".ltm"
+COMPILED_TILEMAP_MAGIC = b"LTMP"
+COMPILED_TILEMAP_VERSION = 2
+
+HEADER_FORMAT = "<4sHH20sQqIII"
+GRID_RECORD_FORMAT = "<iiHBB"
+OFF_GRID_RECORD_FORMAT = "<ddHBx"
+
+# 그리드 레코드 플래그 비트
+FLAG_CAN_COLLIDE = 1
+
+class CompiledTilemapError(Exception):
+    """바이너리 타일맵이 깨졌거나 버전이 다를 때"""
+
+def compiled_path(json_path: str) -> str:
+    """JSON 타일맵 경로 -> 같은 폴더의 바이너리 타일맵 경로"""
+    return os.path.splitext(json_path)[0] + COMPILED_TILEMAP_EXT
+
+def source_hash(json_bytes: bytes) -> bytes:
+    """원본 JSON 내용 해시 (바이너리가 최신인지 확인용)"""
+    return hashlib.sha1(json_bytes).digest()
+
+def read_source_hash(json_path: str) -> bytes | None:
+    """JSON 파일 해시 (파일 없으면 None)"""
+    try:
+        with open(json_path, "rb") as f:
+            return source_hash(f.read())
+    except FileNotFoundError:
+        return None
+
+def read_source_stat(json_path: str) -> tuple[int, int] | None:
+    """JSON 파일 (크기, 수정 시간 ns) (파일 없으면 None)"""
+    try:
+        stat = os.stat(json_path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+def encode_tilemap(tile_size: int, in_grid: dict[str, dict], off_grid: list[dict], json_hash: bytes = bytes(20),
+                   json_stat: tuple[int, int] = (0, 0)) -> bytes:
+    """
+    타일맵 내용을 바이너리로 변환
+
+    :param json_hash: 원본 JSON의 sha1 (없으면 0으로 채움)
+    :param json_stat: 원본 JSON (크기, 수정 시간 ns) (없으면 0이라 읽을때 항상 sha1로 비교함)
+    :return: .ltm 파일 내용
+    """
+    type_ids: dict[str, int] = {}
+    def type_id(name: str) -> int:
+        if name not in type_ids:
+            type_ids[name] = len(type_ids)
+        return type_ids[name]
+
+    grid_records = bytearray()
+    for tile in in_grid.values():
+        if not 0 <= tile["variant"] <= 0xFF:
+            raise ValueError(f"variant 범위 초과: {tile}")
+        flags = FLAG_CAN_COLLIDE if tile["can_collide"] else 0
+        grid_records += struct.pack(GRID_RECORD_FORMAT, tile["pos"][0], tile["pos"][1], type_id(tile["type"]), tile["variant"], flags)
+
+    off_grid_records = bytearray()
+    for tile in off_grid:
+        if not 0 <= tile["variant"] <= 0xFF:
+            raise ValueError(f"variant 범위 초과: {tile}")
+        off_grid_records += struct.pack(OFF_GRID_RECORD_FORMAT, tile["pos"][0], tile["pos"][1], type_id(tile["type"]), tile["variant"])
+
+    string_table = bytearray()
+    for name in type_ids:
+        encoded = name.encode("utf-8")
+        string_table += struct.pack("<B", len(encoded)) + encoded
+
+    header = struct.pack(HEADER_FORMAT, COMPILED_TILEMAP_MAGIC, COMPILED_TILEMAP_VERSION, tile_size,
+                         json_hash, json_stat[0], json_stat[1], len(type_ids), len(in_grid), len(off_grid))
+    return header + bytes(string_table) + bytes(grid_records) + bytes(off_grid_records)
+
+def decode_header(buffer) -> tuple[bytes, tuple[int, int]]:
+    """
+    헤더만 읽어서 원본 JSON 정보 반환 (레코드는 안 풂)
+
+    :return: (원본 JSON 해시, 원본 JSON (크기, 수정 시간 ns))
+    """
+    try:
+        magic, version, _, json_hash, json_size, json_mtime, *_ = struct.unpack_from(HEADER_FORMAT, buffer)
+    except struct.error as e:
+        raise CompiledTilemapError("헤더가 잘림") from e
+    if magic != COMPILED_TILEMAP_MAGIC:
+        raise CompiledTilemapError("타일맵 바이너리 파일이 아님")
+    if version != COMPILED_TILEMAP_VERSION:
+        raise CompiledTilemapError(f"지원 안 하는 버전: {version}")
+    return json_hash, (json_size, json_mtime)
+
+def decode_tilemap(buffer) -> tuple[int, bytes, dict[str, dict], list[dict]]:
+    """
+    바이너리 내용을 타일맵 데이터로 풀어냄 (JSON으로 읽은거랑 같은 dict 구조)
+
+    :param buffer: .ltm 내용 (bytes, mmap 등 버퍼 프로토콜 지원하는거)
+    :return: (tile_size, 원본 JSON 해시, in_grid, off_grid)
+    """
+    view = memoryview(buffer)
+    try:
+        header_size = struct.calcsize(HEADER_FORMAT)
+        if len(view) < header_size:
+            raise CompiledTilemapError("헤더가 잘림")
+        magic, version, tile_size, json_hash, _, _, type_count, grid_count, off_grid_count = struct.unpack_from(HEADER_FORMAT, view)
+        if magic != COMPILED_TILEMAP_MAGIC:
+            raise CompiledTilemapError("타일맵 바이너리 파일이 아님")
+        if version != COMPILED_TILEMAP_VERSION:
+            raise CompiledTilemapError(f"지원 안 하는 버전: {version}")
+
+        offset = header_size
+        type_names = []
+        for _ in range(type_count):
+            length = view[offset]
+            type_names.append(bytes(view[offset + 1:offset + 1 + length]).decode("utf-8"))
+            offset += 1 + length
+
+        grid_end = offset + grid_count * struct.calcsize(GRID_RECORD_FORMAT)
+        off_grid_end = grid_end + off_grid_count * struct.calcsize(OFF_GRID_RECORD_FORMAT)
+        if off_grid_end != len(view):
+            raise CompiledTilemapError("레코드 크기가 헤더랑 안 맞음")
+
+        in_grid = {}
+        for x, y, type_index, variant, flags in struct.iter_unpack(GRID_RECORD_FORMAT, view[offset:grid_end]):
+            in_grid[f"{x},{y}"] = {"pos": [x, y], "type": type_names[type_index], "variant": variant,
+                                   "can_collide": bool(flags & FLAG_CAN_COLLIDE)}
+
+        off_grid = [{"pos": [x, y], "type": type_names[type_index], "variant": variant}
+                    for x, y, type_index, variant in struct.iter_unpack(OFF_GRID_RECORD_FORMAT, view[grid_end:off_grid_end])]
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        raise CompiledTilemapError(f"깨진 타일맵 바이너리: {e}") from e
+    finally:
+        view.release()
+
+    return tile_size, json_hash, in_grid, off_grid
+
+def write_compiled_tilemap(json_path: str) -> str:
+    """
+    JSON 타일맵 하나를 바이너리로 변환해서 옆에 저장
+
+    :return: 저장한 바이너리 경로
+    """
+    json_stat = read_source_stat(json_path)
+    with open(json_path, "rb") as f:
+        json_bytes = f.read()
+    json_data = json.loads(json_bytes)
+    data = encode_tilemap(json_data["tile_size"], json_data["in_grid"], json_data["off_grid"], source_hash(json_bytes), json_stat)
+
+    path = compiled_path(json_path)
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+def read_compiled_tilemap(json_path: str) -> tuple[int, bytes, dict[str, dict], list[dict]] | None:
+    """
+    JSON 타일맵에 해당하는 바이너리가 있고 최신이면 mmap으로 열어서 읽음
+
+    - JSON 크기 / 수정 시간이 헤더랑 같으면 JSON은 안 열고 최신으로 봄, 다르면 JSON sha1로 비교
+    - 바이너리가 없거나, 깨졌거나, JSON이 그 뒤로 바뀌었으면 None (JSON 그대로 읽으면 됨)
+    - JSON 자체가 없으면 바이너리만 믿고 읽음
+
+    :return: (tile_size, 원본 JSON 해시, in_grid, off_grid) 또는 None
+    """
+    path = compiled_path(json_path)
+    try:
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            compiled_hash, compiled_stat = decode_header(mapped)
+            json_stat = read_source_stat(json_path)
+            if json_stat is not None and json_stat != compiled_stat and read_source_hash(json_path) != compiled_hash:
+                return None
+            tile_size, _, in_grid, off_grid = decode_tilemap(mapped)
+    except (OSError, ValueError, CompiledTilemapError):
+        return None
+    return tile_size, compiled_hash, in_grid, off_grid
+
+def verify_compiled_tilemap(json_path: str) -> list[str]:
+    """
+    바이너리가 원본 JSON이랑 완전히 같은 내용으로 풀리는지 확인
+
+    :return: 문제 목록 (비어있으면 통과)
+    """
+    with open(json_path, "rb") as f:
+        json_bytes = f.read()
+    json_data = json.loads(json_bytes)
+
+    try:
+        with open(compiled_path(json_path), "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            tile_size, json_hash, in_grid, off_grid = decode_tilemap(mapped)
+    except (OSError, ValueError, CompiledTilemapError) as e:
+        return [f"바이너리 읽기 실패: {e}"]
+
+    problems = []
+    if json_hash != source_hash(json_bytes):
+        problems.append("JSON이 바뀜 (다시 변환 필요)")
+    if tile_size != json_data["tile_size"]:
+        problems.append(f"tile_size 다름: {tile_size} != {json_data['tile_size']}")
+    if list(in_grid.items()) != list(json_data["in_grid"].items()):
+        problems.append("in_grid 내용 다름")
+    if off_grid != json_data["off_grid"]:
+        problems.append("off_grid 내용 다름")
+    return problems
+
+def convert_all_tilemaps(base_path: str, verify_only: bool = False) -> dict[str, list[str]]:
+    """
+    base_path 아래 모든 JSON 타일맵을 바이너리로 변환하고 검증
+
+    :param verify_only: True면 변환은 안 하고 기존 바이너리 검증만
+    :return: JSON 경로 -> 문제 목록 (비어있으면 통과)
+    """
+    results = {}
+    for json_path in sorted(glob.glob(os.path.join(base_path, "**", "*.json"), recursive=True)):
+        if not verify_only:
+            write_compiled_tilemap(json_path)
+        results[json_path] = verify_compiled_tilemap(json_path)
+    return results
@@ -0,0 +1,146 @@
+from .tilemap import TilemapData, TilemapRenderer
+
+# 한 단계에 바뀐 타일이 이것보다 많으면 타일마다 다시 그리지 말고 전체 리렌더
+BULK_REPAINT_THRESHOLD = 256
+
+# 변경 기록 하나:
+#   ("grid", 이전 타일 or None, 이후 타일 or None)       그리드 칸 하나가 바뀜
+#   ("off_grid", 인덱스, 타일, 추가됐으면 True)           자유 배치 타일 하나가 추가 / 삭제됨
+# 타일 dict는 복사 안 하고 참조만 들고 있음 (그래서 타일 dict를 직접 고치면 안 되고 새 dict로 바꿔 끼워야 함)
+TileChange = tuple
+
+def apply_changes(tilemap_data: TilemapData, renderer: TilemapRenderer | None, changes: list[TileChange], reverse: bool):
+    """
+    변경 기록들을 타일맵에 적용 (reverse면 거꾸로 되돌림)
+
+    :param renderer: 바뀐 칸만 다시 그릴 렌더러 (None이면 안 그림)
+    """
+    bulk = renderer is not None and len(changes) > BULK_REPAINT_THRESHOLD
+    paint = renderer if not bulk else None
+
+    for change in (reversed(changes) if reverse else changes):
+        if change[0] == "grid":
+            _, before, after = change
+            target = before if reverse else after
+            x, y = (after or before)["pos"]
+            current = tilemap_data.get_grid_tile(x, y)
+            if target is None:
+                tilemap_data.remove_grid_tile(x, y)
+                if paint and current is not None:
+                    paint.remove_tile(current)
+            else:
+                tilemap_data.set_grid_tile(target)
+                if paint and current is not None:
+                    paint.replace_tile(current, target)
+                elif paint:
+                    paint.add_tile(target, in_grid=True)
+        else:
+            _, index, tile, added = change
+            if added != reverse:
+                tilemap_data.add_off_grid_tile(tile, index)
+                if paint:
+                    paint.add_tile(tile, in_grid=False)
+            else:
+                tilemap_data.remove_off_grid_tile(tile)
+                if paint:
+                    paint.remove_tile(tile)
+
+    if bulk:
+        renderer.rerender()
+
+class EditHistory:
+    '''
+    타일맵 에디터 undo / redo 기록 (바뀐 칸만 저장)
+
+    - record_*로 바뀐 내용 쌓다가 commit하면 한 단계로 묶임 (마우스 누른채로 칠한 한 획 = 한 단계)
+    - 한 획 안에서 같은 칸을 여러번 바꾸면 처음 상태 / 마지막 상태만 남김
+    - 단계 수, 전체 변경 수 둘다 제한 넘으면 오래된 단계부터 버림
+    - 저장할때 mark_saved() 불러두면 is_modified()로 저장 안 한 편집이 있는지 알 수 있음
+
+    :param max_steps: 최대 undo 단계 수
+    :param max_changes: 모든 단계 합쳐서 최대 변경 기록 수 (메모리 제한)
+    '''
+
+    def __init__(self, max_steps: int, max_changes: int):
+        self.max_steps = max_steps
+        self.max_changes = max_changes
+        self.undo_stack: list[list[TileChange]] = []
+        self.redo_stack: list[list[TileChange]] = []
+        self.stored_changes = 0
+
+        self.pending: list[TileChange] = []
+        self.pending_cells: dict[tuple[int, int], int] = {}  # 칸 -> pending 안 인덱스 (같은 칸 합치기용)
+        self.saved_step: list[TileChange] | None = None      # 저장했을때 undo_stack 맨 위 단계 (없었으면 None)
+
+    def record_grid(self, before: dict | None, after: dict | None):
+        '''그리드 칸 하나 바뀐거 기록 (before / after는 바뀌기 전 / 후 타일, 없으면 None)'''
+        if before is after:
+            return
+        x, y = (after or before)["pos"]
+        i = self.pending_cells.get((x, y))
+        if i is not None:
+            first_before = self.pending[i][1]
+            self.pending[i] = ("grid", first_before, after)
+            return
+        self.pending_cells[(x, y)] = len(self.pending)
+        self.pending.append(("grid", before, after))
+
+    def record_off_grid(self, index: int, tile: dict, added: bool):
+        '''자유 배치 타일 하나 추가(added) / 삭제된거 기록, index는 off_grid 리스트 안 위치'''
+        self.pending.append(("off_grid", index, tile, added))
+
+    def commit(self):
+        '''지금까지 기록한 변경들을 한 단계로 묶음 (새로 뭘 했으니 redo 기록은 버림)'''
+        if not self.pending:
+            return
+        self.undo_stack.append(self.pending)
+        self.stored_changes += len(self.pending)
+        self.pending = []
+        self.pending_cells = {}
+
+        for step in self.redo_stack:
+            self.stored_changes -= len(step)
+        self.redo_stack = []
+
+        # 제한 넘으면 오래된 것부터 버림 (방금 넣은 단계는 남김)
+        while len(self.undo_stack) > 1 and (len(self.undo_stack) > self.max_steps or self.stored_changes > self.max_changes):
+            self.stored_changes -= len(self.undo_stack.pop(0))
+
+    def record_changes(self, changes: list[TileChange]):
+        '''이미 적용된 변경 기록들(핫 리로드 등)을 한 단계로 기록'''
+        self.commit()
+        for change in changes:
+            if change[0] == "grid":
+                self.record_grid(change[1], change[2])
+            else:
+                self.record_off_grid(change[1], change[2], change[3])
+        self.commit()
+
+    def mark_saved(self):
+        '''지금 상태를 파일에 저장된 상태로 기록'''
+        self.commit()
+        self.saved_step = self.undo_stack[-1] if self.undo_stack else None
+
+    def is_modified(self) -> bool:
+        '''마지막 저장 뒤로 바뀐게 있는지 (undo로 저장한 상태까지 되돌리면 False)'''
+        top = self.undo_stack[-1] if self.undo_stack else None
+        return bool(self.pending) or top is not self.saved_step
+
+    def undo(self, tilemap_data: TilemapData, renderer: TilemapRenderer | None = None) -> bool:
+        '''마지막 단계 되돌림, 되돌릴게 없으면 False'''
+        self.commit()
+        if not self.undo_stack:
+            return False
+        step = self.undo_stack.pop()
+        apply_changes(tilemap_data, renderer, step, reverse=True)
+        self.redo_stack.append(step)
+        return True
+
+    def redo(self, tilemap_data: TilemapData, renderer: TilemapRenderer | None = None) -> bool:
+        '''마지막으로 되돌린 단계 다시 적용, 다시 할게 없으면 False'''
+        if self.pending or not self.redo_stack:
+            return False
+        step = self.redo_stack.pop()
+        apply_changes(tilemap_data, renderer, step, reverse=False)
+        self.undo_stack.append(step)
+        return True
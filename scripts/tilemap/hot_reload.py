@@ -0,0 +1,136 @@
+import json
+import os
+import time
+
+from .tilemap import TilemapData, TilemapRenderer, BASE_TILEMAP_PATH
+from .edit_history import apply_changes, TileChange
+
+# 타일맵 JSON 파일 바뀌었는지 확인하는 간격 (초)
+HOT_RELOAD_POLL_INTERVAL = 0.5
+# 게임에서 타일맵 핫 리로드 켜기 (개발할때만 켤 것, 켜면 레벨 파일을 계속 확인하고 다시 읽음)
+# 꺼져있어도 디버그 모드(App.is_debug)로 레벨을 시작하면 켜짐
+TILEMAP_HOT_RELOAD = False
+# 타일맵 에디터에서 핫 리로드 켜기 (에디터는 개발용이라 기본으로 켬)
+TILEMAP_HOT_RELOAD_IN_EDITOR = True
+
+def _off_grid_key(tile: dict) -> tuple:
+    return tile["type"], tile.get("variant", 0), tuple(tile["pos"])
+
+def diff_tilemap(tilemap_data: TilemapData, json_data: dict) -> list[TileChange]:
+    """
+    지금 타일맵이랑 새로 읽은 JSON 내용을 비교해서 바뀐 타일만 변경 기록으로 만듦 (edit_history 변경 기록 형식)
+
+    - 그리드 타일: 칸마다 내용이 다르면 ("grid", 지금 타일, 새 타일)
+    - 자유 배치 타일: (타입, variant, 위치)가 같은건 그대로 두고, 없어진건 뒤에서부터 지우고 새로 생긴건 새 리스트 위치에 끼워넣음
+      (그래서 적용하고 나면 off_grid 순서도 새 파일이랑 같아짐, 순서만 바꾼 경우는 무시)
+    """
+    changes: list[TileChange] = []
+
+    new_in_grid = json_data["in_grid"]
+    for key, tile in tilemap_data.in_grid.items():
+        new_tile = new_in_grid.get(key)
+        if new_tile is None:
+            changes.append(("grid", tile, None))
+        elif new_tile != tile:
+            changes.append(("grid", tile, new_tile))
+    for key, new_tile in new_in_grid.items():
+        if key not in tilemap_data.in_grid:
+            changes.append(("grid", None, new_tile))
+
+    # 같은 내용 타일이 여러개일 수 있어서 키마다 남은 개수로 짝 맞춤
+    remaining: dict[tuple, int] = {}
+    for tile in json_data["off_grid"]:
+        key = _off_grid_key(tile)
+        remaining[key] = remaining.get(key, 0) + 1
+    kept = [False] * len(tilemap_data.off_grid)
+    for i, tile in enumerate(tilemap_data.off_grid):
+        key = _off_grid_key(tile)
+        if remaining.get(key, 0) > 0:
+            remaining[key] -= 1
+            kept[i] = True
+    for i in range(len(tilemap_data.off_grid) - 1, -1, -1):
+        if not kept[i]:
+            changes.append(("off_grid", i, tilemap_data.off_grid[i], False))
+
+    remaining = {}
+    for i, tile in enumerate(tilemap_data.off_grid):
+        if kept[i]:
+            key = _off_grid_key(tile)
+            remaining[key] = remaining.get(key, 0) + 1
+    for i, tile in enumerate(json_data["off_grid"]):
+        key = _off_grid_key(tile)
+        if remaining.get(key, 0) > 0:
+            remaining[key] -= 1
+        else:
+            changes.append(("off_grid", i, tile, True))
+    return changes
+
+class TilemapWatcher:
+    '''
+    타일맵 JSON 파일 수정 시간(mtime)을 주기적으로 확인해서, 밖에서 고치면 바뀐 타일만 반영해주는 클래스
+    GameObject 아님. 씬이 update에서 poll() 직접 불러야 함.
+
+    - 바뀐 칸만 타일맵 데이터에 적용하고 렌더러는 그 칸이 걸친 청크만 다시 그림 (많이 바뀌면 전체 리렌더)
+    - 이미 스폰된 엔티티들은 안 건드림
+    - 저장 도중이라 JSON이 깨져있으면 다음 확인때 다시 읽음
+    - poll(apply=False)면 파일 수정 시간만 보고 읽지도 반영하지도 않음 (reload_pending으로 바뀐것만 알려줌)
+
+    :param tilemap_data: 반영할 타일맵 데이터 (file_name 파일을 지켜봄)
+    :param renderer: 바뀐 청크 다시 그릴 렌더러 (None이면 데이터만 갱신)
+    :param poll_interval: 파일 확인 간격 (초)
+    '''
+
+    def __init__(self, tilemap_data: TilemapData, renderer: TilemapRenderer | None = None,
+                 poll_interval: float = HOT_RELOAD_POLL_INTERVAL):
+        self.tilemap_data = tilemap_data
+        self.renderer = renderer
+        self.poll_interval = poll_interval
+        self.path = BASE_TILEMAP_PATH + tilemap_data.file_name
+
+        # 데이터를 실제로 읽은 시점의 수정 시간부터 비교 (프리페치로 미리 읽었으면 그 사이 고친것도 잡힘)
+        self.mtime = tilemap_data.source_mtime
+        self.reload_pending = False  # 파일이 바뀌었는데 아직 반영 안 했는지
+        self.next_poll_time = time.monotonic() + poll_interval
+
+    def read_mtime(self) -> int | None:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def sync(self):
+        '''지금 파일 내용이 이미 반영된걸로 기록 (직접 저장한 다음에 부름)'''
+        self.mtime = self.read_mtime()
+        self.reload_pending = False
+
+    def poll(self, apply: bool = True) -> list[TileChange]:
+        '''
+        확인할 때가 됐으면 파일 수정 시간 보고, 바뀌었으면 다시 읽어서 반영
+
+        :param apply: False면 바뀌었는지만 확인 (에디터에 저장 안 한 편집이 있을때)
+        :return: 반영한 변경 기록들 (안 바뀌었으면 빈 리스트)
+        '''
+        now = time.monotonic()
+        if now < self.next_poll_time:
+            return []
+        self.next_poll_time = now + self.poll_interval
+
+        mtime = self.read_mtime()
+        self.reload_pending = mtime is not None and mtime != self.mtime
+        if not self.reload_pending or not apply:
+            return []
+        try:
+            with open(self.path, 'r', encoding="utf-8") as f:
+                json_data = json.load(f)
+        except (OSError, ValueError):
+            return []  # 아직 쓰는 중, 다음에 다시 읽음
+        self.mtime = mtime
+        self.reload_pending = False
+
+        # 타일 크기가 바뀌면 칸 단위로 비교할 수가 없음 (레벨 다시 시작해야 함)
+        if json_data["tile_size"] != self.tilemap_data.tile_size:
+            return []
+        changes = diff_tilemap(self.tilemap_data, json_data)
+        if changes:
+            apply_changes(self.tilemap_data, self.renderer, changes, reverse=False)
+        return changes
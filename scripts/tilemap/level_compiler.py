@@ -0,0 +1,214 @@
+"""
+레벨 오프라인 컴파일 (.level)
+
+게임 시작 / 레벨 전환때마다 하던 전처리를 미리 해서 타일맵 옆에 저장해둠:
+    - chunks:    청크별 그릴 타일 목록 (TileChunkBaker 청크 인덱스, 타일 번호로 저장)
+    - collision: greedy로 합친 충돌 직사각형들 (CollisionShapes)
+    - spawners:  스포너 / 마커 타일 위치표 (spawn_all_entities_by_data 등에서 씀)
+
+- 원본 JSON 해시, 컴파일러 버전, 타일 이미지 크기 시그니처가 하나라도 다르면 그 .level은 안 씀
+- 타일 번호는 off_grid 먼저, 그 다음 in_grid 순서 (TileChunkBaker 그리는 순서랑 같음)
+
+컴파일은 프로젝트 루트의 compile_levels.py 참고
+"""
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+
+import pygame as pg
+
+from .compiled_map import compiled_path, read_source_hash, write_compiled_tilemap, verify_compiled_tilemap
+
+COMPILED_LEVEL_EXT = ".level"
+LEVEL_COMPILER_VERSION = 1
+
+# 위치표 미리 만들어둘 타일 타입들 (게임에서 안 그리는 스포너 / 마커 타일들)
+SPAWNER_TILE_TYPES = ("spawners_entities", "spawners_enemies", "custom_point")
+
+def compiled_level_path(json_path: str) -> str:
+    """JSON 타일맵 경로 -> 같은 폴더의 컴파일된 레벨 경로"""
+    return os.path.splitext(json_path)[0] + COMPILED_LEVEL_EXT
+
+def tile_assets_signature(tile_assets: dict[str, list[pg.Surface]]) -> str:
+    """타일 이미지 크기들로 만든 시그니처 (이미지 크기가 바뀌면 청크 인덱스도 달라지니까)"""
+    sizes = [(name, [image.get_size() for image in images]) for name, images in sorted(tile_assets.items())]
+    return hashlib.sha1(repr(sizes).encode("utf-8")).hexdigest()
+
+class CompiledLevel:
+    '''
+    .level 파일 내용
+
+    :param source_hash: 원본 JSON sha1 (hex)
+    :param assets_signature: 컴파일할때 타일 이미지 시그니처
+    :param chunk_size: 청크 인덱스 만들때 쓴 청크 크기
+    :param skip_types: 청크 인덱스에서 뺀 타일 타입들
+    :param chunks: 청크 좌표 -> 타일 번호 리스트
+    :param collision_rects: 합쳐진 충돌 직사각형들 (x, y, w, h)
+    :param spawners: 타일 타입 -> variant -> 월드 좌표 리스트
+    '''
+
+    def __init__(self, source_hash: str, assets_signature: str, chunk_size: int, skip_types: tuple[str, ...],
+                 chunks: dict[tuple[int, int], list[int]], collision_rects: list[tuple[int, int, int, int]],
+                 spawners: dict[str, dict[int, list[tuple[float, float]]]]):
+        self.source_hash = source_hash
+        self.assets_signature = assets_signature
+        self.chunk_size = chunk_size
+        self.skip_types = skip_types
+        self.chunks = chunks
+        self.collision_rects = collision_rects
+        self.spawners = spawners
+
+    def to_json(self) -> dict:
+        return {
+            "version": LEVEL_COMPILER_VERSION,
+            "source_hash": self.source_hash,
+            "assets_signature": self.assets_signature,
+            "chunk_size": self.chunk_size,
+            "skip_types": list(self.skip_types),
+            "chunks": {f"{x},{y}": indices for (x, y), indices in self.chunks.items()},
+            "collision": [list(rect) for rect in self.collision_rects],
+            "spawners": {tile_type: {str(variant): [list(pos) for pos in positions] for variant, positions in by_variant.items()}
+                         for tile_type, by_variant in self.spawners.items()},
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "CompiledLevel":
+        chunks = {}
+        for key, indices in data["chunks"].items():
+            x, y = key.split(",")
+            chunks[(int(x), int(y))] = indices
+        spawners = {tile_type: {int(variant): [tuple(pos) for pos in positions] for variant, positions in by_variant.items()}
+                    for tile_type, by_variant in data["spawners"].items()}
+        return cls(data["source_hash"], data["assets_signature"], data["chunk_size"], tuple(data["skip_types"]),
+                   chunks, [tuple(rect) for rect in data["collision"]], spawners)
+
+def load_compiled_level(json_path: str, source_hash: bytes | None) -> CompiledLevel | None:
+    """
+    타일맵 옆의 .level 읽기
+
+    :param source_hash: 지금 원본 JSON의 sha1 (이거랑 다르면 옛날 컴파일 결과라 안 씀)
+    :return: 컴파일된 레벨 (없거나 버전 / 해시가 다르면 None)
+    """
+    if source_hash is None:
+        return None
+    try:
+        with open(compiled_level_path(json_path), "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("version") != LEVEL_COMPILER_VERSION or data.get("source_hash") != source_hash.hex():
+        return None
+    return CompiledLevel.from_json(data)
+
+def compile_level(file_name: str, tile_assets: dict[str, list[pg.Surface]]) -> CompiledLevel:
+    """
+    타일맵 하나 컴파일 (청크 인덱스, 충돌 직사각형, 스포너 위치표)
+
+    :param file_name: BASE_TILEMAP_PATH 기준 타일맵 파일 이름
+    """
+    from .tilemap import TilemapData, BASE_TILEMAP_PATH, DO_NOT_RENDER_TILES
+    from .chunk import TileChunkBaker, CHUNK_SIZE
+
+    data = TilemapData(file_name, use_compiled_level=False)
+    baker = TileChunkBaker(data, tile_assets, CHUNK_SIZE, DO_NOT_RENDER_TILES)
+
+    tiles = data.off_grid + list(data.in_grid.values())
+    tile_index = {id(tile): i for i, tile in enumerate(tiles)}
+    chunks = {key: [tile_index[id(tile)] for tile in chunk_tiles] for key, chunk_tiles in baker.chunk_tiles.items()}
+
+    collision_rects = [tuple(rect) for rect in data.collision.rects]
+
+    spawners = {}
+    for tile in list(data.in_grid.values()) + data.off_grid:
+        if tile["type"] in SPAWNER_TILE_TYPES:
+            pos = (tile["pos"][0] * data.tile_size, tile["pos"][1] * data.tile_size)
+            spawners.setdefault(tile["type"], {}).setdefault(tile.get("variant", 0), []).append(pos)
+    for tile_type in SPAWNER_TILE_TYPES:
+        spawners.setdefault(tile_type, {})
+
+    return CompiledLevel(read_source_hash(BASE_TILEMAP_PATH + file_name).hex(), tile_assets_signature(tile_assets),
+                         CHUNK_SIZE, DO_NOT_RENDER_TILES, chunks, collision_rects, spawners)
+
+def is_compiled_level_fresh(file_name: str, tile_assets: dict[str, list[pg.Surface]]) -> bool:
+    """.level과 .ltm이 둘다 지금 원본 JSON / 타일 이미지 기준으로 최신인지"""
+    from .tilemap import BASE_TILEMAP_PATH
+
+    json_path = BASE_TILEMAP_PATH + file_name
+    level = load_compiled_level(json_path, read_source_hash(json_path))
+    if level is None or level.assets_signature != tile_assets_signature(tile_assets):
+        return False
+    return not verify_compiled_tilemap(json_path)
+
+# 프로세스 풀 워커마다 한번만 로드하는 타일 이미지들
+_worker_tile_assets: dict[str, list[pg.Surface]] | None = None
+
+def _init_compile_worker():
+    '''워커 프로세스 초기화 (화면 없이 돌아가게 dummy 비디오 드라이버 사용)'''
+    global _worker_tile_assets
+    os.environ["SDL_VIDEODRIVER"] = "dummy"
+    from scripts.asset_load.load_all_assets import load_tilemap_assets
+    from scripts.asset_load.atlas import TextureAtlas
+
+    pg.display.init()
+    pg.display.set_mode((1, 1))  # convert_alpha 하려면 화면이 있어야 함
+    # 워커 여러개가 같은 캐시 파일 쓰면 안 되니까 아틀라스 캐시는 항상 끔 (이미지 크기만 필요함)
+    atlas = TextureAtlas("tilemap", cache_dir=None)
+    _worker_tile_assets = load_tilemap_assets(atlas)
+    atlas.build()
+
+def autotile_source(file_name: str) -> int:
+    """
+    원본 JSON 타일맵 전체를 일괄 오토타일해서 바뀐게 있으면 JSON 덮어씀
+
+    :return: variant 바뀐 타일 수
+    """
+    from .tilemap import TilemapData, BASE_TILEMAP_PATH
+    from .autotile import autotile_all
+
+    data = TilemapData(file_name, use_compiled_level=False)
+    changes = autotile_all(data)
+    if changes:
+        with open(BASE_TILEMAP_PATH + file_name, 'w', encoding="utf-8") as f:
+            json.dump(data.to_json(), f)
+    return len(changes)
+
+def _compile_level_job(file_name: str, force: bool, autotile: bool) -> str:
+    '''워커에서 레벨 하나 컴파일, 결과 상태 문자열 반환'''
+    from .tilemap import BASE_TILEMAP_PATH
+
+    autotiled = autotile_source(file_name) if autotile else 0
+    suffix = f" (autotiled {autotiled})" if autotiled else ""
+
+    if not force and is_compiled_level_fresh(file_name, _worker_tile_assets):
+        return "skipped" + suffix
+
+    json_path = BASE_TILEMAP_PATH + file_name
+    write_compiled_tilemap(json_path)
+    level = compile_level(file_name, _worker_tile_assets)
+    with open(compiled_level_path(json_path), "w", encoding="utf-8") as f:
+        json.dump(level.to_json(), f, separators=(",", ":"))
+    return "compiled" + suffix
+
+def compile_all_levels(file_names: list[str], jobs: int | None = None, force: bool = False, autotile: bool = False) -> dict[str, str]:
+    """
+    여러 타일맵을 프로세스 풀로 나눠서 컴파일 (원본이 안 바뀐건 건너뜀)
+
+    :param file_names: BASE_TILEMAP_PATH 기준 타일맵 파일 이름들
+    :param jobs: 워커 프로세스 수 (None이면 CPU 수)
+    :param force: True면 최신이어도 다시 컴파일
+    :param autotile: True면 컴파일 전에 원본 JSON을 일괄 오토타일 (바뀐 맵은 JSON도 갱신됨)
+    :return: 파일 이름 -> "compiled" / "skipped" / "failed: ..."
+    """
+    results = {}
+    # 워커마다 SDL을 새로 초기화해야 하니까 fork 말고 spawn으로 띄움
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=jobs, mp_context=context, initializer=_init_compile_worker) as executor:
+        futures = {file_name: executor.submit(_compile_level_job, file_name, force, autotile) for file_name in file_names}
+        for file_name, future in futures.items():
+            try:
+                results[file_name] = future.result()
+            except Exception as e:
+                results[file_name] = f"failed: {e!r}"
+    return results
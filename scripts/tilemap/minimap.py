@@ -0,0 +1,112 @@
+import pygame as pg
+
+from scripts.constants import *
+from scripts.utils import *
+from scripts.entities import PlayerCharacter, Soul, Portal
+from scripts.enemies.base.enemy import EnemyBase
+from .tile_grid import TileGrid
+
+# 타일 하나당 미니맵 픽셀 수 (맵이 커서 MINIMAP_MAX_SIZE 넘으면 줄어듦, 최소 1)
+MINIMAP_PIXELS_PER_TILE = 3
+# 미니맵 최대 크기 (픽셀)
+MINIMAP_MAX_SIZE = (360, 150)
+# 화면 우상단 기준 여백
+MINIMAP_MARGIN = 20
+MINIMAP_ALPHA = 200
+
+# 팔레트 인덱스 0: 빈칸(투명), 1: 충돌 안하는 타일, 2: 충돌 타일
+MINIMAP_TILE_COLORS = (pg.Color(0, 0, 0), pg.Color(70, 70, 90), pg.Color(190, 190, 210))
+MINIMAP_BACKGROUND_COLOR = pg.Color(0, 0, 0, 120)
+# 마커 종류 -> (색, 크기)
+MINIMAP_MARKERS = {
+    PlayerCharacter: (pg.Color(255, 255, 255), 4),
+    Portal: (pg.Color(160, 90, 255), 5),
+    Soul: (pg.Color(90, 220, 255), 3),
+    EnemyBase: (pg.Color(255, 70, 70), 3),
+}
+
+# 칸 타입 id -> 타일 있으면 1 (bytes.translate용)
+_OCCUPIED_TABLE = bytes([0] + [1] * 255)
+
+def bake_minimap(grid: TileGrid, pixels_per_tile: int) -> pg.Surface | None:
+    """
+    타일 그리드를 미니맵 서피스로 한번에 구움
+
+    칸마다 blit 안 하고, 그리드 바이트 배열을 그대로 8비트 팔레트 이미지 픽셀로 씀
+    (팔레트 인덱스 = 타일 있음(0/1) + 충돌 타일(0/1), 바이트끼리 더해도 자리올림 없음)
+    그 다음 pixels_per_tile 배로 한번에 확대
+
+    :return: 미니맵 서피스 (그리드가 비어있으면 None)
+    """
+    if grid.width == 0 or grid.height == 0:
+        return None
+    cells = grid.width * grid.height
+    occupied = int.from_bytes(grid.ids.translate(_OCCUPIED_TABLE), "little")
+    solid = int.from_bytes(grid.solid, "little")
+    pixels = (occupied + solid).to_bytes(cells, "little")
+
+    image = pg.image.frombytes(pixels, (grid.width, grid.height), "P")
+    image.set_palette(MINIMAP_TILE_COLORS)
+    image.set_colorkey(0)
+    return pg.transform.scale(image, (grid.width * pixels_per_tile, grid.height * pixels_per_tile))
+
+class Minimap(GameObject):
+    '''
+    화면 우상단 미니맵 (레벨 하나당 한번만 구워둠)
+
+    - 타일은 레벨 시작할때 bake_minimap으로 한번 굽고, 그리드가 바뀌었을때만(핫 리로드 등) 다시 구움
+    - 플레이어 / 포탈 / 영혼 / 적 마커는 매 프레임 씬의 타입별 목록에서 꺼내서 위치만 찍음
+      (플레이 도중 새로 생긴 적도 바로 나옴)
+
+    :param tilemap_data: 미니맵 그릴 타일맵 데이터
+    '''
+
+    def __init__(self, tilemap_data):
+        super().__init__()
+        self.tilemap_data = tilemap_data
+        grid = tilemap_data.grid
+        max_width, max_height = MINIMAP_MAX_SIZE
+        self.pixels_per_tile = max(1, min(MINIMAP_PIXELS_PER_TILE,
+                                          max_width // max(grid.width, 1), max_height // max(grid.height, 1)))
+
+        self.image: pg.Surface | None = None
+        self.background: pg.Surface | None = None
+        self.grid_revision = -1
+        self.bake()
+
+    def bake(self):
+        '''미니맵 다시 구움'''
+        grid = self.tilemap_data.grid
+        self.grid_revision = grid.revision
+        self.image = bake_minimap(grid, self.pixels_per_tile)
+        if self.image is None:
+            self.background = None
+            return
+        self.image.set_alpha(MINIMAP_ALPHA)
+        self.background = pg.Surface(self.image.get_size(), pg.SRCALPHA)
+        self.background.fill(MINIMAP_BACKGROUND_COLOR)
+
+    def draw(self):
+        super().draw()
+        if self.scene.scene_paused:
+            return
+        if self.tilemap_data.grid.revision != self.grid_revision:
+            self.bake()
+        if self.image is None:
+            return
+
+        surface = self.app.surfaces[LAYER_INTERFACE]
+        grid = self.tilemap_data.grid
+        left = SCREEN_SIZE.x - MINIMAP_MARGIN - self.image.get_width()
+        top = MINIMAP_MARGIN
+        surface.blit(self.background, (left, top))
+        surface.blit(self.image, (left, top))
+
+        # 월드 좌표 -> 미니맵 좌표
+        scale = self.pixels_per_tile / self.tilemap_data.tile_size
+        offset_x = left - grid.origin_x * self.pixels_per_tile
+        offset_y = top - grid.origin_y * self.pixels_per_tile
+        for marker_type, (color, size) in MINIMAP_MARKERS.items():
+            for obj in self.scene.get_objects_by_types(marker_type):
+                center_x, center_y = obj.rect.center
+                surface.fill(color, (offset_x + center_x * scale - size // 2, offset_y + center_y * scale - size // 2, size, size))
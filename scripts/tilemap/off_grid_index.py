@@ -0,0 +1,91 @@
+import pygame as pg
+from typing import Iterable
+
+# 공간 인덱스 셀 한 변의 길이 (픽셀)
+OFF_GRID_CELL_SIZE = 256
+
+CellKey = tuple[int, int]
+
+class OffGridIndex:
+    '''
+    off_grid(자유 배치) 타일들 균일 격자 공간 인덱스
+
+    - 타일 이미지 Rect가 걸치는 셀마다 타일을 넣어둠 (셀 -> {타일 id: 타일})
+    - 점 / Rect 조회는 겹치는 셀들만 보고, 실제로 Rect가 겹치는 타일만 돌려줌
+    - 타일 추가 / 삭제할때 같이 갱신해야 함 (TilemapData.add_off_grid_tile / remove_off_grid_tile에서 해줌)
+    - 넣을때 Rect를 기억해둬서, 타일 dict 내용이 바뀌었어도 원래 셀에서 뺄 수 있음
+
+    :param tile_size: 타일 크기 (타일 pos -> 월드 좌표 변환용)
+    :param tile_assets: App.ASSETS["tilemap"] (타일 이미지 크기 계산용)
+    :param cell_size: 셀 한 변 길이 (픽셀)
+    '''
+
+    def __init__(self, tile_size: int, tile_assets: dict[str, list[pg.Surface]],
+                 tiles: Iterable[dict] = (), cell_size: int = OFF_GRID_CELL_SIZE):
+        self.tile_size = tile_size
+        self.tile_assets = tile_assets
+        self.cell_size = cell_size
+
+        self.cells: dict[CellKey, dict[int, dict]] = {}
+        self.tile_rects: dict[int, pg.Rect] = {}
+        self.build(tiles)
+
+    def tile_rect(self, tile: dict) -> pg.Rect:
+        '''타일 이미지가 차지하는 월드 Rect (TileChunkBaker.tile_rect랑 같은 기준)'''
+        image = self.tile_assets[tile["type"]][tile["variant"]]
+        x = round(tile["pos"][0] * self.tile_size)
+        y = round(tile["pos"][1] * self.tile_size)
+        return pg.Rect(x, y, image.get_width(), image.get_height())
+
+    def cell_keys_in_rect(self, rect: pg.Rect) -> list[CellKey]:
+        '''월드 Rect에 걸치는 모든 셀 좌표'''
+        size = self.cell_size
+        start_x, end_x = rect.left // size, (max(rect.right, rect.left + 1) - 1) // size
+        start_y, end_y = rect.top // size, (max(rect.bottom, rect.top + 1) - 1) // size
+        return [(cx, cy) for cy in range(start_y, end_y + 1) for cx in range(start_x, end_x + 1)]
+
+    def build(self, tiles: Iterable[dict]):
+        '''인덱스 전체 새로 만듦'''
+        self.cells = {}
+        self.tile_rects = {}
+        for tile in tiles:
+            self.add(tile)
+
+    def add(self, tile: dict):
+        '''타일 넣기 (이미 있으면 지금 위치 기준으로 다시 넣음)'''
+        self.remove(tile)
+        rect = self.tile_rect(tile)
+        self.tile_rects[id(tile)] = rect
+        for key in self.cell_keys_in_rect(rect):
+            self.cells.setdefault(key, {})[id(tile)] = tile
+
+    def remove(self, tile: dict):
+        '''타일 빼기 (없으면 무시)'''
+        rect = self.tile_rects.pop(id(tile), None)
+        if rect is None:
+            return
+        for key in self.cell_keys_in_rect(rect):
+            cell = self.cells[key]
+            del cell[id(tile)]
+            if not cell:
+                del self.cells[key]
+
+    def query_point(self, point: pg.Vector2 | tuple[float, float]) -> list[dict]:
+        '''월드 좌표 점이 이미지 안에 들어가는 타일들 (넣은 순서)'''
+        x, y = int(point[0] // 1), int(point[1] // 1)  # 음수 좌표도 내림
+        cell = self.cells.get((x // self.cell_size, y // self.cell_size))
+        if not cell:
+            return []
+        return [tile for tile_id, tile in cell.items() if self.tile_rects[tile_id].collidepoint(x, y)]
+
+    def query_rect(self, rect: pg.Rect) -> list[dict]:
+        '''월드 Rect랑 이미지가 겹치는 타일들 (여러 셀에 걸친 타일도 한번만)'''
+        found: dict[int, dict] = {}
+        for key in self.cell_keys_in_rect(rect):
+            cell = self.cells.get(key)
+            if not cell:
+                continue
+            for tile_id, tile in cell.items():
+                if tile_id not in found and self.tile_rects[tile_id].colliderect(rect):
+                    found[tile_id] = tile
+        return list(found.values())
@@ -0,0 +1,98 @@
+import pygame as pg
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from scripts.constants import *
+from .tilemap import TilemapData, DO_NOT_RENDER_TILES, CHUNK_PREBAKE_MARGIN
+from .chunk import TileChunkBaker, ChunkKey, CHUNK_SIZE
+
+class PrefetchedLevel:
+    '''
+    워커 스레드에서 미리 준비해둔 레벨 하나
+
+    :param data: 파싱 + 전처리(그리드, 충돌 모양) 끝난 타일맵 데이터
+    :param baker: 청크 목록까지 계산된 청크 베이커 (렌더러가 그대로 씀)
+    :param spawn_chunk_keys: 스폰 위치 근처 청크들 (씬 시작할때 메인 스레드에서 구움)
+    '''
+
+    def __init__(self, data: TilemapData, baker: TileChunkBaker, spawn_chunk_keys: list[ChunkKey]):
+        self.data = data
+        self.baker = baker
+        self.spawn_chunk_keys = spawn_chunk_keys
+
+def prepare_level(file_name: str, tile_assets: dict[str, list[pg.Surface]],
+                  chunk_size: int = CHUNK_SIZE, skip_types: tuple[str, ...] = DO_NOT_RENDER_TILES) -> PrefetchedLevel:
+    '''
+    타일맵 파일 읽고 전처리(그리드, 충돌 모양, 청크 목록)한 다음, 플레이어 스폰 위치 근처 청크 좌표를 골라서 반환
+
+    워커 스레드에서 돌아가니까 App이나 씬 건드리면 안되고, 서피스에 그리지도 않음
+    (타일 이미지가 아틀라스 페이지 서브서피스라서 메인 스레드가 같은 페이지를 그리는 동안 blit하면 안전하지 않음)
+    '''
+    data = TilemapData(file_name)
+    baker = TileChunkBaker(data, tile_assets, chunk_size, skip_types)
+
+    spawn_chunk_keys = []
+    spawn_positions = data.get_positions_by_types("spawners_entities", 0)
+    if spawn_positions:
+        # 씬 시작하면 카메라가 스폰 위치를 중심으로 보니까 그 화면 + 여유분
+        view_rect = pg.Rect((0, 0), SCREEN_SIZE).inflate(CHUNK_PREBAKE_MARGIN * 2, CHUNK_PREBAKE_MARGIN * 2)
+        view_rect.center = spawn_positions[0]
+        spawn_chunk_keys = [key for key in baker.chunk_keys_in_rect(view_rect) if key in baker.chunk_tiles]
+
+    return PrefetchedLevel(data, baker, spawn_chunk_keys)
+
+class TilemapPrefetcher:
+    '''
+    다음에 쓸 타일맵을 워커 스레드 하나에서 미리 읽어두는 클래스
+    씬이 바뀌어도 살아있어야 하니까 씬 오브젝트(GameObject) 말고 씬이 직접 들고 있을 것
+
+    사용법:
+        prefetcher.prefetch("chap_1/b.json", tile_assets)   # 플레이 중에 미리 요청
+        level = prefetcher.take("chap_1/b.json")            # 다음 씬 시작할 때 꺼내씀 (없으면 None)
+        prefetcher.shutdown()                               # 씬 끝날때 / 게임 끌때 (아직 시작 안 한 요청 취소)
+    '''
+
+    def __init__(self):
+        self.executor: ThreadPoolExecutor | None = None  # 처음 요청할때 만듦 (shutdown 뒤에도 다시 만듦)
+        self.pending: dict[str, Future] = {}
+
+    def prefetch(self, file_name: str, tile_assets: dict[str, list[pg.Surface]]):
+        '''해당 타일맵을 백그라운드에서 준비 시작 (이미 요청한거면 무시, 취소된 요청이면 다시 요청)'''
+        future = self.pending.get(file_name)
+        if future is not None and not future.cancelled():
+            return
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tilemap_prefetch")
+        self.pending[file_name] = self.executor.submit(prepare_level, file_name, tile_assets)
+
+    def shutdown(self):
+        '''
+        워커 스레드 정리 (기다리지 않음)
+
+        - 아직 시작 안 한 요청은 취소하고 목록에서 뺌 (다음에 prefetch하면 다시 요청됨)
+        - 이미 끝났거나 돌고 있는 요청은 그대로 두니까 끝나면 take로 꺼내 쓸 수 있음
+        '''
+        if self.executor is None:
+            return
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.executor = None
+        self.pending = {file_name: future for file_name, future in self.pending.items() if not future.cancelled()}
+
+    def take(self, file_name: str) -> PrefetchedLevel | None:
+        '''
+        준비된 레벨 꺼내기 (아직 준비 중이면 끝날 때까지 기다림)
+
+        :return: 준비된 레벨, 요청한 적 없거나 준비하다 실패했으면 None (그냥 직접 로드하면 됨)
+        '''
+        future = self.pending.pop(file_name, None)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception:
+            return None
+
+    def retain(self, file_names: list[str]):
+        '''file_names에 없는 요청은 버림 (안 쓸 레벨 데이터 들고 있지 않게)'''
+        for file_name in list(self.pending):
+            if file_name not in file_names:
+                self.pending.pop(file_name).cancel()
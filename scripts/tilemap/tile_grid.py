@@ -0,0 +1,194 @@
+import pygame as pg
+from typing import Iterable
+
+EMPTY_TILE_ID = 0
+
+# 검사할 주변 칸 오프셋 (현재 칸 중심 기준 3x3)
+NEIGHBOR_OFFSETS = (
+    (-1, 0), (-1, -1), (0, -1), (1, -1),
+    (1, 0), (0, 0), (-1, 1), (0, 1), (1, 1)
+)
+
+class TileGrid:
+    '''
+    in_grid 타일들을 정수 좌표로 바로 찾을 수 있게 펼쳐둔 촘촘한 2D 배열
+
+    - (origin_x, origin_y) 칸부터 width x height 크기, 범위 밖에 타일 넣으면 알아서 늘어남
+    - ids: 셀별 타일 타입 id (0은 빈칸, 타입 이름은 type_names[id])
+    - variants: 셀별 variant
+    - solid: 충돌 비트맵 (1이면 can_collide 타일)
+    - tiles: 셀별 원본 타일 dict 참조 (tiles_around 같은거 할때 dict 그대로 돌려주려고)
+    - rects: 셀별 충돌 Rect (충돌 타일만, 타일 놓을때 한번만 만들어서 계속 재사용)
+
+    - revision: 내용 바뀔때마다 1씩 올라감 (충돌 모양 같은 파생 데이터 갱신 체크용)
+
+    문자열 키 만들기 / dict 해싱 없이 셀 인덱스 계산 한번으로 조회 가능함
+    '''
+
+    def __init__(self, tile_size: int, tiles: Iterable[dict] = ()):
+        self.tile_size = tile_size
+        self.origin_x = 0
+        self.origin_y = 0
+        self.width = 0
+        self.height = 0
+
+        self.type_names: list[str] = [""]
+        self.type_ids: dict[str, int] = {}
+
+        self.ids = bytearray()
+        self.variants = bytearray()
+        self.solid = bytearray()
+        self.tiles: list[dict | None] = []
+        self.rects: list[pg.Rect | None] = []
+        self.revision = 0
+
+        self.build(tiles)
+
+    def build(self, tiles: Iterable[dict]):
+        '''타일 dict들로 그리드 전체를 새로 만듦 (범위는 한번에 계산해서 할당)'''
+        tiles = list(tiles)
+        self.origin_x = self.origin_y = self.width = self.height = 0
+        self.ids = bytearray()
+        self.variants = bytearray()
+        self.solid = bytearray()
+        self.tiles = []
+        self.rects = []
+        self.revision += 1
+        if not tiles:
+            return
+
+        xs = [tile["pos"][0] for tile in tiles]
+        ys = [tile["pos"][1] for tile in tiles]
+        self._resize(min(xs), min(ys), max(xs), max(ys))
+        for tile in tiles:
+            self.set(tile)
+
+    def type_id(self, type_name: str) -> int:
+        '''타일 타입 이름 -> 작은 정수 id (처음 보는 타입이면 새로 등록)'''
+        if type_name not in self.type_ids:
+            self.type_ids[type_name] = len(self.type_names)
+            self.type_names.append(type_name)
+        return self.type_ids[type_name]
+
+    def index(self, x: int, y: int) -> int:
+        '''그리드 좌표 -> 배열 인덱스 (범위 밖이면 -1)'''
+        local_x = x - self.origin_x
+        local_y = y - self.origin_y
+        if 0 <= local_x < self.width and 0 <= local_y < self.height:
+            return local_y * self.width + local_x
+        return -1
+
+    def get(self, x: int, y: int) -> dict | None:
+        '''해당 칸 타일 dict (없으면 None)'''
+        i = self.index(x, y)
+        return self.tiles[i] if i >= 0 else None
+
+    def is_solid(self, x: int, y: int) -> bool:
+        '''해당 칸이 충돌 타일인지'''
+        i = self.index(x, y)
+        return i >= 0 and self.solid[i] == 1
+
+    def raycast(self, start_x: float, start_y: float, end_x: float, end_y: float) -> tuple[int, int, float] | None:
+        '''
+        선분 따라 지나가는 칸들을 순서대로 훑어서(DDA) 처음 만나는 충돌 칸 찾기
+
+        - 시작점이 들어있는 칸부터 검사함 (시작점이 벽 안이면 t = 0으로 바로 맞음)
+        - Rect / 리스트 안 만들고 solid 배열만 봄 (매 프레임 불러도 됨)
+
+        :return: (칸 x, 칸 y, t) 처음 맞은 칸이랑 그 칸에 들어간 지점 비율 (0~1, 월드 좌표 = 시작 + (끝 - 시작) * t), 안 맞으면 None
+        '''
+        tile_size = self.tile_size
+        x, y = int(start_x // tile_size), int(start_y // tile_size)
+        last_x, last_y = int(end_x // tile_size), int(end_y // tile_size)
+        dx, dy = end_x - start_x, end_y - start_y
+
+        # 다음 세로선 / 가로선까지의 t, 칸 하나 건널때마다 늘어나는 t
+        if dx > 0:
+            step_x, t_delta_x, t_max_x = 1, tile_size / dx, ((x + 1) * tile_size - start_x) / dx
+        elif dx < 0:
+            step_x, t_delta_x, t_max_x = -1, tile_size / -dx, (x * tile_size - start_x) / dx
+        else:
+            step_x, t_delta_x, t_max_x = 0, 0.0, float("inf")
+        if dy > 0:
+            step_y, t_delta_y, t_max_y = 1, tile_size / dy, ((y + 1) * tile_size - start_y) / dy
+        elif dy < 0:
+            step_y, t_delta_y, t_max_y = -1, tile_size / -dy, (y * tile_size - start_y) / dy
+        else:
+            step_y, t_delta_y, t_max_y = 0, 0.0, float("inf")
+
+        solid, width, height = self.solid, self.width, self.height
+        origin_x, origin_y = self.origin_x, self.origin_y
+        t = 0.0
+        # 지나가는 칸 수는 가로 칸 수 + 세로 칸 수 + 1 넘을 수 없음 (부동소수 오차로 안 끝나는거 방지)
+        for _ in range(abs(last_x - x) + abs(last_y - y) + 1):
+            local_x, local_y = x - origin_x, y - origin_y
+            if 0 <= local_x < width and 0 <= local_y < height and solid[local_y * width + local_x]:
+                return x, y, t
+            if x == last_x and y == last_y:
+                break
+            if t_max_x < t_max_y:
+                t = t_max_x
+                x += step_x
+                t_max_x += t_delta_x
+            else:
+                t = t_max_y
+                y += step_y
+                t_max_y += t_delta_y
+        return None
+
+    def set(self, tile: dict):
+        '''타일 dict를 pos 칸에 넣음 (이미 있으면 덮어씀)'''
+        x, y = int(tile["pos"][0]), int(tile["pos"][1])
+        if self.width == 0:
+            self._resize(x, y, x, y)
+        elif self.index(x, y) < 0:
+            self._resize(min(x, self.origin_x), min(y, self.origin_y),
+                         max(x, self.origin_x + self.width - 1), max(y, self.origin_y + self.height - 1))
+        i = self.index(x, y)
+        self.ids[i] = self.type_id(tile["type"])
+        self.variants[i] = tile["variant"]
+        self.solid[i] = 1 if tile.get("can_collide") else 0
+        self.tiles[i] = tile
+
+        size = self.tile_size
+        self.rects[i] = pg.Rect(x * size, y * size, size, size) if self.solid[i] else None
+        self.revision += 1
+
+    def remove(self, x: int, y: int) -> dict | None:
+        '''해당 칸 비움, 지운 타일 dict 반환 (원래 비어있으면 None)'''
+        i = self.index(x, y)
+        if i < 0:
+            return None
+        tile = self.tiles[i]
+        self.ids[i] = EMPTY_TILE_ID
+        self.variants[i] = 0
+        self.solid[i] = 0
+        self.tiles[i] = None
+        self.rects[i] = None
+        self.revision += 1
+        return tile
+
+    def _resize(self, min_x: int, min_y: int, max_x: int, max_y: int):
+        '''범위를 (min_x, min_y) ~ (max_x, max_y)로 늘리고 기존 행들을 옮겨 담음'''
+        width = max_x - min_x + 1
+        height = max_y - min_y + 1
+        ids = bytearray(width * height)
+        variants = bytearray(width * height)
+        solid = bytearray(width * height)
+        tiles: list[dict | None] = [None] * (width * height)
+        rects: list[pg.Rect | None] = [None] * (width * height)
+
+        shift_x = self.origin_x - min_x
+        shift_y = self.origin_y - min_y
+        for row in range(self.height):
+            src = row * self.width
+            dst = (row + shift_y) * width + shift_x
+            ids[dst:dst + self.width] = self.ids[src:src + self.width]
+            variants[dst:dst + self.width] = self.variants[src:src + self.width]
+            solid[dst:dst + self.width] = self.solid[src:src + self.width]
+            tiles[dst:dst + self.width] = self.tiles[src:src + self.width]
+            rects[dst:dst + self.width] = self.rects[src:src + self.width]
+
+        self.origin_x, self.origin_y = min_x, min_y
+        self.width, self.height = width, height
+        self.ids, self.variants, self.solid, self.tiles, self.rects = ids, variants, solid, tiles, rects
@@ -1,41 +1,214 @@
 import pygame as pg
 import json
+import os
+from itertools import chain
+from typing import Iterable
 
 from scripts.constants import *
 from scripts.camera import *
 from scripts.utils import *
+from .tile_grid import TileGrid, NEIGHBOR_OFFSETS
+from .type_index import TileTypeIndex
+from .off_grid_index import OffGridIndex
+from .collision import CollisionShapes
+from .chunk import TileChunkBaker, TileChunkCache, ChunkKey, CHUNK_SIZE, CHUNK_CACHE_BUDGET
+from .compiled_map import read_compiled_tilemap, source_hash
+from .level_compiler import CompiledLevel, load_compiled_level
 
 # 타일맵 데이터 기본 경로
 BASE_TILEMAP_PATH = "data/tilemaps/"
 
+# 화면 밖 이만큼(픽셀)까지 들어온 청크는 미리 구워둠
+CHUNK_PREBAKE_MARGIN = 256
+# 미리 굽기는 프레임당 이 개수까지만 (보이는 청크는 제한 없이 바로 구움)
+MAX_PREBAKES_PER_FRAME = 1
+# 게임에서 안 그리는 타일 타입들 (에디터에선 다 그림)
+DO_NOT_RENDER_TILES = ("spawners_entities", "spawners_enemies", "custom_point")
+
 class TilemapData:
-    def __init__(self, file_name : str = "temp.json"):
+    """
+    타일맵 데이터 (in_grid / off_grid 타일 + 조회용 그리드 + 충돌 모양)
+
+    :param file_name: BASE_TILEMAP_PATH 기준 타일맵 파일 이름
+    :param use_compiled_level: 컴파일된 레벨(.level)이 최신이면 그 전처리 결과를 씀 (에디터에선 끔)
+    """
+    def __init__(self, file_name : str = "temp.json", use_compiled_level : bool = True):
         self.file_name = file_name
+        json_path = BASE_TILEMAP_PATH + self.file_name
+        # 읽기 전에 수정 시간 기록 (핫 리로드가 이거 기준으로 바뀌었는지 봄, 프리페치로 미리 읽은 경우도 같음)
+        try:
+            self.source_mtime : int | None = os.stat(json_path).st_mtime_ns
+        except OSError:
+            self.source_mtime = None
+
+        # 최신 바이너리(.ltm)가 있으면 그걸 읽고 (JSON은 안 열어도 됨), 없으면 JSON 데이터 불러오기
+        compiled = read_compiled_tilemap(json_path)
+        if compiled is not None:
+            tile_size, json_hash, in_grid, off_grid = compiled
+        else:
+            with open(json_path, 'rb') as f:
+                json_bytes = f.read()
+            json_hash = source_hash(json_bytes)
+            json_data = json.loads(json_bytes)
+            tile_size, in_grid, off_grid = json_data["tile_size"], json_data["in_grid"], json_data["off_grid"]
+
+        self.tile_size : int             = tile_size
+        self.in_grid   : dict[str, dict] = in_grid
+        self.off_grid  : list            = off_grid
+
+        # 미리 컴파일해둔 청크 인덱스 / 충돌 직사각형 / 스포너 위치표 (타일 고치면 None으로 버림)
+        self.compiled_level : CompiledLevel | None = load_compiled_level(json_path, json_hash) if use_compiled_level else None
+
+        # 매 프레임 조회용 정수 그리드 (in_grid랑 항상 같은 내용이어야 함)
+        self.grid = TileGrid(self.tile_size, self.in_grid.values())
+        # 충돌 칸들을 큰 직사각형으로 합친 충돌 모양 (그리드 바뀌면 알아서 다시 합침)
+        compiled_rects = self.compiled_level.collision_rects if self.compiled_level else None
+        self.collision = CollisionShapes(self.grid, compiled_rects)
+        # (타입, variant) -> 타일 인덱스, 컴파일된 스포너 위치표로 답 못할때 처음 필요해지면 만듦
+        self.type_index : TileTypeIndex | None = None
+        # off_grid 타일 공간 인덱스, 타일 이미지 크기가 필요해서 get_off_grid_index로 처음 부를때 만듦
+        self.off_grid_index : OffGridIndex | None = None
+
+    def to_json(self) -> dict:
+        """JSON 파일로 저장할 내용 (tile_size, in_grid, off_grid)"""
+        return {
+            "tile_size": self.tile_size,
+            "in_grid": self.in_grid,
+            "off_grid": self.off_grid
+        }
+
+    @staticmethod
+    def grid_key(x: int, y: int) -> str:
+        """in_grid(JSON) 딕셔너리 키 "x,y" 만들기 (저장/에디터용, 매 프레임 쓰지 말것)"""
+        return f"{x},{y}"
+
+    def rebuild_grid(self):
+        """in_grid / off_grid를 통째로 바꿨을 때 (undo 등) 정수 그리드랑 타입 인덱스 다시 만듦"""
+        self.compiled_level = None
+        self.type_index = None
+        self.off_grid_index = None
+        self.grid.build(self.in_grid.values())
+
+    def get_type_index(self) -> TileTypeIndex:
+        """(타입, variant) 인덱스 반환 (아직 없으면 in_grid -> off_grid 순서로 만듦, 편집 뒤에도 이 순서 유지)"""
+        if self.type_index is None:
+            self.type_index = TileTypeIndex(self.iter_tiles(), scan_order=self.iter_tiles)
+        return self.type_index
+
+    def iter_tiles(self):
+        """전체 타일 dict를 in_grid -> off_grid 순서로"""
+        return chain(self.in_grid.values(), self.off_grid)
 
-        # JSON 데이터 불러오기
-        with open(BASE_TILEMAP_PATH + self.file_name, 'r', encoding="utf-8") as f:
-            json_data = json.load(f)
+    def get_off_grid_index(self, tile_assets: dict[str, list[pg.Surface]]) -> OffGridIndex:
+        """
+        off_grid 타일 공간 인덱스 반환 (아직 없으면 만듦)
+
+        :param tile_assets: App.ASSETS["tilemap"] (타일 이미지 크기 계산용)
+        """
+        if self.off_grid_index is None:
+            self.off_grid_index = OffGridIndex(self.tile_size, tile_assets, self.off_grid)
+        return self.off_grid_index
+
+    def get_grid_tile(self, x: int, y: int) -> dict | None:
+        """그리드 좌표의 타일 dict 반환 (없으면 None)"""
+        return self.grid.get(x, y)
+
+    def set_grid_tile(self, tile: dict):
+        """
+        그리드 타일 추가/교체 (in_grid 딕셔너리랑 정수 그리드 둘다 갱신)
 
-        self.tile_size : int             = json_data["tile_size"]
-        self.in_grid   : dict[str, dict] = json_data["in_grid"]
-        self.off_grid  : list            = json_data["off_grid"]
+        :param tile: 타일 dict (pos, type, variant, can_collide)
+        """
+        x, y = int(tile["pos"][0]), int(tile["pos"][1])
+        self.compiled_level = None
+        if self.type_index is not None:
+            previous = self.grid.get(x, y)
+            if previous is not None:
+                self.type_index.remove(previous)
+            self.type_index.add(tile)
+        self.in_grid[self.grid_key(x, y)] = tile
+        self.grid.set(tile)
+
+    def remove_grid_tile(self, x: int, y: int) -> dict | None:
+        """
+        그리드 타일 삭제 (in_grid 딕셔너리랑 정수 그리드 둘다 갱신)
+
+        :return: 지운 타일 dict (없었으면 None)
+        """
+        self.compiled_level = None
+        self.in_grid.pop(self.grid_key(x, y), None)
+        tile = self.grid.remove(x, y)
+        if tile is not None and self.type_index is not None:
+            self.type_index.remove(tile)
+        return tile
+
+    def add_off_grid_tile(self, tile: dict, index: int | None = None):
+        """
+        자유 배치 타일 추가 (off_grid 리스트, 타입 인덱스, 공간 인덱스 다 갱신)
+
+        :param tile: 타일 dict (pos, type, variant)
+        :param index: off_grid 리스트에 넣을 위치 (None이면 맨 뒤, undo할때 원래 자리로 돌려놓는 용도)
+        """
+        self.compiled_level = None
+        if index is None:
+            self.off_grid.append(tile)
+        else:
+            self.off_grid.insert(index, tile)
+        if self.type_index is not None:
+            self.type_index.add(tile)
+        if self.off_grid_index is not None:
+            self.off_grid_index.add(tile)
+
+    def remove_off_grid_tile(self, tile: dict) -> int | None:
+        """
+        자유 배치 타일 삭제 (같은 dict 객체를 찾아서 지움)
+
+        :return: 지운 타일이 있던 off_grid 인덱스 (없었으면 None)
+        """
+        # 내용이 같은 다른 타일이랑 헷갈리지 않게 is로 찾음 (list.index는 == 비교라서)
+        i = next((i for i, t in enumerate(self.off_grid) if t is tile), None)
+        if i is None:
+            return None
+        self.compiled_level = None
+        del self.off_grid[i]
+        if self.type_index is not None:
+            self.type_index.remove(tile)
+        if self.off_grid_index is not None:
+            self.off_grid_index.remove(tile)
+        return i
+
+    def clear_off_grid(self) -> list[dict]:
+        """
+        자유 배치 타일 전부 삭제 (하나씩 지우지 않고 리스트 / 인덱스를 한번에 비움)
+
+        :return: 지운 타일들 (원래 off_grid 순서, 인덱스 = 있던 자리)
+        """
+        removed = self.off_grid[:]
+        if not removed:
+            return removed
+        self.compiled_level = None
+        self.off_grid.clear()
+        if self.type_index is not None:
+            for tile in removed:
+                self.type_index.remove(tile)
+        if self.off_grid_index is not None:
+            self.off_grid_index.build(())
+        return removed
 
     def get_positions_by_types(self, tile_type: str, variant: int = 0) -> list[pg.Vector2]:
         """
-        해당 타입과 variant를 가진 타일 위치 리스트 반환
+        해당 타입과 variant를 가진 타일 위치 리스트 반환 (인덱스 조회라 전체 타일 안 훑음)
 
         :param tile_type: 타일 종류 (예: "dirt")
         :param variant: variant 인덱스
-        :return: 월드 좌표 리스트 (pg.Vector2)
-        """
-        matched = []
-        for tile in list(self.in_grid.values()) + self.off_grid:
-            if tile["type"] == tile_type and tile.get("variant", 0) == variant:
-                # 그리드 좌표를 월드 좌표로 변환
-                world_pos = pg.Vector2(tile["pos"][0] * self.tile_size, tile["pos"][1] * self.tile_size)
-                matched.append(world_pos)
-        return matched
-    
+        :return: 월드 좌표 리스트 (pg.Vector2, 매번 새로 만들어서 줌)
+        """
+        # 스포너 / 마커 타일은 컴파일할때 만든 위치표에서 바로 꺼냄
+        if self.compiled_level is not None and tile_type in self.compiled_level.spawners:
+            return [pg.Vector2(pos) for pos in self.compiled_level.spawners[tile_type].get(variant, ())]
+
+        return self.get_type_index().positions(tile_type, variant, self.tile_size)
+
     def tiles_around(self, pos: pg.Vector2) -> list[dict]:
         """
         주어진 월드 좌표 주변 타일 정보 반환 (그리드 내 타일만)
@@ -43,97 +216,250 @@ class TilemapData:
         :param pos: 월드 좌표
         :return: 타일 dict 리스트
         """
-        
-        # 검사할 주변 타일 좌표 오프셋 (현재 타일 중심 좌표 기준)
-        NEIGHBOR_OFFSETS = [
-            (-1, 0), (-1, -1), (0, -1), (1, -1),
-            (1, 0), (0, 0), (-1, 1), (0, 1), (1, 1)
-        ]
+        grid = self.grid
+        tile_x = int(pos[0] // self.tile_size)
+        tile_y = int(pos[1] // self.tile_size)
 
         result = []
-        tile_loc = (int(pos.x // self.tile_size), int(pos.y // self.tile_size))
-        for offset in NEIGHBOR_OFFSETS:
-            key = f"{tile_loc[0] + offset[0]},{tile_loc[1] + offset[1]}"
-            if key in self.in_grid:
-                result.append(self.in_grid[key])
+        for offset_x, offset_y in NEIGHBOR_OFFSETS:
+            i = grid.index(tile_x + offset_x, tile_y + offset_y)
+            if i >= 0 and grid.tiles[i] is not None:
+                result.append(grid.tiles[i])
         return result
 
     def physic_tiles_around(self, pos: pg.Vector2) -> list[pg.Rect]:
         """
         충돌 가능 타일 주변 목록을 Rect로 반환 (충돌 검사용)
+
+        - Rect는 레벨 로드할때 만들어둔 캐시 그대로 돌려줌 (절대 수정하지 말 것!!)
+
         :param pos: 월드 좌표
         :return: 충돌 타일들의 pg.Rect 리스트
         """
+        grid = self.grid
+        tile_x = int(pos[0] // self.tile_size)
+        tile_y = int(pos[1] // self.tile_size)
+
         rects = []
-        for tile in self.tiles_around(pos):
-            if tile.get("can_collide"):
-                tile_pos = pg.Vector2(tile['pos']) * self.tile_size
-                rects.append(pg.Rect(tile_pos, (self.tile_size, self.tile_size)))
+        for offset_x, offset_y in NEIGHBOR_OFFSETS:
+            i = grid.index(tile_x + offset_x, tile_y + offset_y)
+            if i >= 0 and grid.solid[i]:
+                rects.append(grid.rects[i])
+        return rects
+
+    def collision_rect_at(self, pos) -> pg.Rect | None:
+        """
+        월드 좌표가 들어있는 합쳐진 충돌 Rect 반환 (점 충돌 검사용, 탄환/AI 등)
+
+        :param pos: 월드 좌표 (pg.Vector2나 (x, y) 튜플)
+        :return: 충돌 Rect (충돌 타일 밖이면 None, 절대 수정하지 말 것)
+        """
+        return self.collision.rect_at(pos)
+
+    def raycast(self, start, end) -> tuple[int, int, float] | None:
+        """
+        시작점 -> 끝점 선분이 처음 지나가는 충돌 타일 찾기 (빠른 탄환 충돌, AI 시야 검사용)
+
+        - 그리드 칸을 DDA로 하나씩 따라가서 중간에 건너뛰는 벽이 없음
+        - 합쳐진 충돌 Rect가 아니라 칸 단위 검사 (충돌 타일 칸 = 충돌 모양이라 결과 같음)
+
+        :param start: 시작 월드 좌표 (pg.Vector2나 (x, y) 튜플)
+        :param end: 끝 월드 좌표
+        :return: (타일 x, 타일 y, t) 처음 맞은 칸이랑 선분 위 비율 (0~1), 안 맞으면 None
+        """
+        return self.grid.raycast(start[0], start[1], end[0], end[1])
+
+    def has_line_of_sight(self, start, end) -> bool:
+        """두 월드 좌표 사이에 충돌 타일이 하나도 없는지 (AI 시야 검사용)"""
+        return self.grid.raycast(start[0], start[1], end[0], end[1]) is None
+
+    def collision_rects_around_points(self, points) -> list[pg.Rect]:
+        """
+        여러 좌표 주변에 걸친 합쳐진 충돌 Rect들을 한번에 반환 (엔티티 충돌 검사용)
+
+        - 타일 하나하나 대신 붙어있는 충돌 타일을 합친 큰 Rect라서 검사 횟수가 훨씬 적음
+        - Rect는 캐시 그대로 돌려주니까 절대 수정하지 말 것
+
+        :param points: 월드 좌표들 (pg.Vector2나 (x, y) 튜플)
+        :return: 충돌 Rect 리스트 (중복 제거됨)
+        """
+        return self.collision.rects_around_points(points)
+
+    def physic_tiles_around_points(self, points) -> list[pg.Rect]:
+        """
+        여러 좌표 주변 충돌 타일 Rect를 한번에 반환 (중복 제거됨)
+
+        - 엔티티 꼭짓점 4개, 혹은 여러 엔티티 꼭짓점 전부를 한번에 넘기면 됨
+        - 순서는 points 순서대로 처음 나온 순서 (하나씩 physic_tiles_around 부른거랑 같음)
+        - Rect는 캐시 그대로 돌려주니까 절대 수정하지 말 것
+
+        :param points: 월드 좌표들 (pg.Vector2나 (x, y) 튜플)
+        :return: 충돌 타일들의 pg.Rect 리스트
+        """
+        grid = self.grid
+        tile_size = self.tile_size
+        seen = set()
+        rects = []
+        for point in points:
+            tile_x = int(point[0] // tile_size)
+            tile_y = int(point[1] // tile_size)
+            for offset_x, offset_y in NEIGHBOR_OFFSETS:
+                i = grid.index(tile_x + offset_x, tile_y + offset_y)
+                if i >= 0 and grid.solid[i] and i not in seen:
+                    seen.add(i)
+                    rects.append(grid.rects[i])
         return rects
 
 class TilemapRenderer(GameObject):
+    """
+    타일맵을 CHUNK_SIZE 크기 청크로 나눠서 그리는 렌더러
+
+    - 청크는 카메라 근처에 처음 들어올 때만 구움 (레벨 로드시 전체를 굽지 않음)
+    - 구운 청크는 메모리 예산 있는 LRU 캐시에 보관
+    - 화면에 보이는 청크만 그림 (맵 크기 제한 없음)
+
+    :param tilemap_data: 그릴 타일맵 데이터
+    :param chunk_size: 청크 한 변 길이 (픽셀)
+    :param cache_budget: 구운 청크들이 쓸 수 있는 최대 메모리 (바이트)
+    :param do_not_render_tiles: 게임에서 안 그릴 타일 타입들 (에디터에선 다 그림)
+    :param baker: 미리 만들어둔 청크 베이커 (프리페치된 레벨), 없으면 새로 만듦
+    :param prebake_keys: 시작할때 바로 구워둘 청크들 (프리페치된 레벨의 스폰 위치 근처)
+    """
     def __init__(self, tilemap_data : TilemapData,
-                 cache_surface_size : pg.Vector2 = pg.Vector2(15000, 15000),
-                 do_not_render_tiles : list[str] = ["spawners_entities", "spawners_enemies", "custom_point"]):
+                 chunk_size : int = CHUNK_SIZE,
+                 cache_budget : int = CHUNK_CACHE_BUDGET,
+                 do_not_render_tiles : tuple[str, ...] = DO_NOT_RENDER_TILES,
+                 baker : TileChunkBaker | None = None,
+                 prebake_keys : Iterable[ChunkKey] = ()):
         super().__init__()
+        from scripts.scenes import TileMapEditScene  # 순환 참조 방지용 임포트
 
         self.data = tilemap_data
-        self.cache_surface_size = cache_surface_size
         self.do_not_render_tiles = do_not_render_tiles
 
-        self.cache_surface = pg.Surface(cache_surface_size, pg.SRCALPHA)
-        self.rerender()
+        # 특정 씬(예: 타일맵 에디터)에서만 렌더링 제외 타일을 표시
+        skip_types = () if isinstance(self.scene, TileMapEditScene) else tuple(do_not_render_tiles)
+        if baker is None or baker.data is not tilemap_data or baker.skip_types != skip_types:
+            baker = TileChunkBaker(tilemap_data, self.app.ASSETS["tilemap"], chunk_size, skip_types)
+        self.baker = baker
+        self.cache = TileChunkCache(cache_budget)
+        for key in prebake_keys:
+            if key in baker.chunk_tiles:
+                self.cache.put(key, baker.bake(key))
 
     def rerender(self):
         """
-        캐시 서피스에 타일 전체를 다시 그림
+        청크 목록을 다시 계산하고 구워둔 청크를 전부 버림
 
-        - off_grid 타일과 in_grid 타일 모두 그림
-        - 엄청 무거움!!! 매프레임마다 부르면 fps30가는거 순식간;;
-        - 특정 씬(예: 타일맵 에디터)에서만 렌더링 제외 타일을 표시
+        - 실제로 굽는건 청크가 다시 화면 근처에 올때 (보이는 청크만 구워서 예전처럼 무겁진 않음)
         """
-        from scripts.scenes import TileMapEditScene  # 순환 참조 방지용 임포트
+        self.baker.rebuild_index()
+        self.cache.clear()
 
-        self.cache_surface.fill((0, 0, 0, 0))  # 투명으로 초기화
+    def add_tile(self, data: dict, in_grid: bool):
+        """
+        타일 하나 추가된걸 반영 (그 타일이 걸친 청크 부분만 다시 그림)
 
-        for data in self.data.off_grid:
-            # 렌더링 제외 타일 필터링
-            if data["type"] in self.do_not_render_tiles and not isinstance(self.scene, TileMapEditScene):
-                continue
-            self.draw_tile(self.cache_surface, data)
+        :param in_grid: 그리드 타일인지 (False면 자유 배치 타일)
+        """
+        rect = self.baker.add_tile(data, in_grid)
+        if rect is not None:
+            self.repaint_rect(rect)
 
-        for data in self.data.in_grid.values():
-            if data["type"] in self.do_not_render_tiles and not isinstance(self.scene, TileMapEditScene):
+    def remove_tile(self, data: dict):
+        """타일 하나 지워진걸 반영 (그 타일이 있던 청크 부분만 다시 그림)"""
+        rect = self.baker.remove_tile(data)
+        if rect is not None:
+            self.repaint_rect(rect)
+
+    def replace_tile(self, old: dict, new: dict):
+        """그리드 칸 타일이 다른 타일로 바뀐걸 반영 (그 칸만 다시 그림)"""
+        rect = self.baker.replace_tile(old, new)
+        if rect is not None:
+            self.repaint_rect(rect)
+
+    def repaint_rect(self, world_rect: pg.Rect):
+        """
+        world_rect에 걸친 구워둔 청크들을 그 부분만 다시 그림
+
+        - 아직 안 구운 청크는 그냥 둠 (보일때 알아서 구워짐)
+        - 비어있던 청크에 타일이 생겼거나, 타일이 다 지워진 청크는 캐시에서 버림
+        """
+        for key in self.baker.chunk_keys_in_rect(world_rect):
+            if key not in self.cache:
                 continue
-            self.draw_tile(self.cache_surface, data)
+            surface = self.cache.get(key)
+            if surface is None or key not in self.baker.chunk_tiles:
+                self.cache.discard(key)
+                continue
+            self.baker.repaint(surface, key, world_rect)
+            forget_scaled_image(surface)
 
-    def draw_tile(self, surface: pg.Surface, data: dict):
+    def draw_tile(self, surface: pg.Surface, data: dict, origin: pg.Vector2 = pg.Vector2()):
         """
         주어진 타일 데이터를 주어진 서피스에 그림
 
-        :param surface: 타일을 그릴 서피스 (주로 캐시 서피스)
+        :param surface: 타일을 그릴 서피스 (주로 청크 서피스)
         :param data: 타일 데이터 dict (pos, type, variant 등)
+        :param origin: 서피스 (0, 0)에 해당하는 월드 좌표
         """
-        tile_asset = self.app.ASSETS["tilemap"]
-        world_pos = pg.Vector2(data["pos"]) * self.data.tile_size
+        self.baker.draw_tile(surface, data, origin)
+
+    def get_view_rect(self) -> pg.Rect:
+        """카메라가 보고 있는 월드 Rect"""
+        top_left = CameraMath.screen_to_world(self.camera, pg.Vector2(0, 0))
+        return pg.Rect(int(top_left.x), int(top_left.y), int(SCREEN_SIZE.x) + 1, int(SCREEN_SIZE.y) + 1)
 
-        image = tile_asset[data["type"]][data["variant"]]
+    def get_chunk(self, key: ChunkKey, keep: set[ChunkKey] = frozenset()) -> pg.Surface | None:
+        """
+        청크 서피스 반환, 캐시에 없으면 그 자리에서 구움
+
+        :param keep: 캐시 예산 넘어도 버리면 안되는 청크들 (보통 화면에 보이는 청크)
+        :return: 청크 서피스 (그릴게 없으면 None)
+        """
+        if key not in self.baker.chunk_tiles:
+            return None
+        if key in self.cache:
+            return self.cache.get(key)
+        surface = self.baker.bake(key)
+        self.cache.put(key, surface, keep)
+        return surface
 
-        # 캐시에 그릴 때 월드 좌표 + 캐시 오프셋 (월드 좌표 중심을 캐시 중앙으로 이동)
-        cache_pos = world_pos + self.cache_surface_size / 2
-        surface.blit(image, (round(cache_pos.x), round(cache_pos.y)))
+    def prebake_near(self, view_rect: pg.Rect, keep: set[ChunkKey]):
+        """
+        화면 밖이지만 곧 보일 청크를 프레임당 조금씩 미리 구움 (한번에 다 구우면 프레임 튐)
+        """
+        baked = 0
+        near_rect = view_rect.inflate(CHUNK_PREBAKE_MARGIN * 2, CHUNK_PREBAKE_MARGIN * 2)
+        for key in self.baker.chunk_keys_in_rect(near_rect):
+            if baked >= MAX_PREBAKES_PER_FRAME:
+                return
+            if key in self.cache or key not in self.baker.chunk_tiles:
+                continue
+            self.cache.put(key, self.baker.bake(key), keep)
+            baked += 1
 
     def draw(self):
         """
         매 프레임 호출되는 그리기 함수.
 
-        캐시 서피스를 화면에 그리며, 카메라 이동 효과를 적용.
+        화면에 보이는 청크만 카메라 위치에 맞춰 그림.
         """
         super().draw()
 
-        surface = self.app.surfaces[LAYER_OBJ]
-        camera = self.camera
+        view_rect = self.get_view_rect()
+        visible_keys = self.baker.chunk_keys_in_rect(view_rect)
+        keep = set(visible_keys)
+
+        # 오브젝트 레이어는 렌더 해상도 배율 적용받음 (줄인 청크는 청크 다시 그릴때 버림)
+        scale = self.app.render_scale
+        blit_sequence = []
+        for key in visible_keys:
+            chunk = self.get_chunk(key, keep)
+            if chunk is None:
+                continue
+            render_pos = CameraMath.world_to_render(self.camera, self.baker.chunk_origin(key))
+            blit_sequence.append((scale_image(chunk, scale), render_pos))
+        self.app.surfaces[LAYER_OBJ].blits(blit_sequence, doreturn=False)
 
-        # 캐시 서피스의 월드 시작점 (-오프셋)을 스크린 좌표로 변환
-        cache_screen_pos = CameraMath.world_to_screen(camera, -self.cache_surface_size / 2)
-        surface.blit(self.cache_surface, cache_screen_pos)
\ No newline at end of file
+        self.prebake_near(view_rect, keep)
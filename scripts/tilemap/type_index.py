@@ -0,0 +1,83 @@
+import pygame as pg
+from typing import Callable, Iterable
+
+TypeKey = tuple[str, int]
+
+class TileTypeIndex:
+    '''
+    (타일 타입, variant) -> 그 타일 dict들 인덱스
+
+    - 타일 추가 / 삭제할때 같이 갱신하면 전체 타일 안 훑고 바로 위치를 찾을 수 있음
+    - 같은 키 안에서는 scan_order 순서 유지 (예전 전체 검색이랑 순서 같음)
+        - build할때는 넣은 순서 그대로 (in_grid -> off_grid 순서로 넣으면 됨)
+        - 나중에 add한 타일은 일단 맨 뒤에 붙이고, 그 키를 처음 조회할때 scan_order로 한번 다시 정렬
+          (scan_order 없으면 넣은 순서 그대로)
+    - 타일은 dict 객체 자체(id)로 구분함 (내용이 같은 타일이 여러개 있어도 됨)
+    - 넣을때 키를 기억해둬서, 타일 dict의 type / variant를 직접 고친 뒤에 remove -> add 해도 됨 (오토타일 등)
+
+    :param tiles: 처음 넣을 타일들 (scan_order 순서대로)
+    :param scan_order: 전체 타일을 원래 검색 순서대로 돌려주는 함수 (정렬용)
+    '''
+
+    def __init__(self, tiles: Iterable[dict] = (), scan_order: Callable[[], Iterable[dict]] | None = None):
+        self.buckets: dict[TypeKey, dict[int, dict]] = {}
+        self.tile_keys: dict[int, TypeKey] = {}
+        self.scan_order = scan_order
+        self.unsorted: set[TypeKey] = set()  # 나중에 add해서 순서가 틀어졌을 수 있는 키
+        self.build(tiles)
+
+    @staticmethod
+    def key_of(tile: dict) -> TypeKey:
+        return tile["type"], tile.get("variant", 0)
+
+    def build(self, tiles: Iterable[dict]):
+        '''인덱스 전체 새로 만듦'''
+        self.buckets = {}
+        self.tile_keys = {}
+        self.unsorted = set()
+        for tile in tiles:
+            self.insert(tile)
+
+    def insert(self, tile: dict) -> TypeKey:
+        '''타일을 키 버킷 맨 뒤에 넣기 (이미 있으면 지금 type / variant 기준으로 다시 넣음)'''
+        self.remove(tile)
+        key = self.key_of(tile)
+        self.buckets.setdefault(key, {})[id(tile)] = tile
+        self.tile_keys[id(tile)] = key
+        return key
+
+    def add(self, tile: dict):
+        '''타일 넣기 (로드 뒤에 추가 / 교체된 타일, 다음 조회때 원래 검색 순서로 정렬됨)'''
+        self.unsorted.add(self.insert(tile))
+
+    def remove(self, tile: dict):
+        '''타일 빼기 (없으면 무시)'''
+        key = self.tile_keys.pop(id(tile), None)
+        if key is None:
+            return
+        bucket = self.buckets[key]
+        del bucket[id(tile)]
+        if not bucket:
+            del self.buckets[key]
+
+    def bucket(self, key: TypeKey) -> dict[int, dict] | None:
+        '''키 버킷 (순서 틀어졌으면 scan_order로 다시 정렬해서 줌)'''
+        bucket = self.buckets.get(key)
+        if bucket and key in self.unsorted:
+            self.unsorted.discard(key)
+            if self.scan_order is not None:
+                bucket = {id(tile): tile for tile in self.scan_order() if id(tile) in bucket}
+                self.buckets[key] = bucket
+        return bucket
+
+    def tiles(self, tile_type: str, variant: int = 0) -> list[dict]:
+        '''해당 타입 + variant 타일 dict 리스트'''
+        bucket = self.bucket((tile_type, variant))
+        return list(bucket.values()) if bucket else []
+
+    def positions(self, tile_type: str, variant: int, tile_size: int) -> list[pg.Vector2]:
+        '''해당 타입 + variant 타일들의 월드 좌표 (매번 새 Vector2라서 받은 쪽에서 수정해도 됨)'''
+        bucket = self.bucket((tile_type, variant))
+        if not bucket:
+            return []
+        return [pg.Vector2(tile["pos"][0] * tile_size, tile["pos"][1] * tile_size) for tile in bucket.values()]
@@ -1,5 +1,8 @@
 from .game_object import GameObject
-from .animation import Animation
+from .animation import AnimationClip, AnimationPlayer
 from .timer import Timer
 from .tween import Tween
-from .event_bus import EventBus
\ No newline at end of file
+from .event_bus import EventBus
+from .compositor import LayerCompositor
+from .render_scale import scale_image, forget_scaled_image
+from .quality import QualityGovernor, QualityTier, QUALITY_TIERS, FOG_MULTIPLY, FOG_FILL
@@ -1,24 +1,55 @@
 import pygame as pg
 
-class Animation:
-    '''  
-    루프 가능한 스프라이트 시퀀스 애니메이션 클래스  
-    이미지 리스트를 받아서 일정 시간마다 프레임 넘겨줌  
-    파티클이나 캐릭터 애니메이션에 씀  
+class AnimationClip:
     '''
+    스프라이트 시퀀스 애니메이션 데이터 (에셋 로드할때 한번만 만들고 다같이 씀)
+    프레임 이미지, 프레임 지속 시간, 루프 여부, 반전된 프레임들만 가짐
+    재생 상태는 AnimationPlayer가 따로 가짐
 
-    def __init__(self, images: list[pg.Surface], img_dur_seconds=0.1, loop=True, flip_x=False, flip_y=False):
+    반전된 프레임들은 (flip_x, flip_y) 조합별로 처음 쓸때 한번만 만들어둠
+    '''
+
+    def __init__(self, images: list[pg.Surface], img_dur_seconds=0.1, loop=True):
         '''
-        :param images: 프레임 이미지 리스트  
-        :param img_dur_seconds: 각 프레임 지속 시간(초)  
-        :param loop: True면 끝나도 계속 반복  
-        :param flip_x: True면 이미지 좌우 반전  
-        :param flip_y: True면 이미지 상하 반전  
+        :param images: 프레임 이미지 리스트
+        :param img_dur_seconds: 각 프레임 지속 시간(초)
+        :param loop: True면 끝나도 계속 반복
         '''
         self.images = images
         self.img_duration = img_dur_seconds
         self.loop = loop
+        # (flip_x, flip_y) -> 반전된 프레임 리스트
+        self.flipped_frames: dict[tuple[bool, bool], list[pg.Surface]] = {(False, False): images}
+
+    def __len__(self) -> int:
+        return len(self.images)
+
+    def frames(self, flip_x: bool = False, flip_y: bool = False) -> list[pg.Surface]:
+        '''
+        반전 적용된 프레임 리스트 (같이 쓰는 서피스라 수정하면 안 됨)
+        '''
+        key = (bool(flip_x), bool(flip_y))
+        frames = self.flipped_frames.get(key)
+        if frames is None:
+            frames = [pg.transform.flip(image, *key) for image in self.images]
+            self.flipped_frames[key] = frames
+        return frames
+
+class AnimationPlayer:
+    '''
+    AnimationClip 재생 상태 (지금 프레임, 지난 시간, 끝났는지, 반전 여부)
+    엔티티 / 파티클 / 탄환마다 하나씩 가짐, 클립 데이터는 복사 안 함
+    액션 바꿀때는 play()로 클립만 바꿔 끼움
+    '''
+    __slots__ = ("clip", "flip_x", "flip_y", "done", "elapsed", "frame")
 
+    def __init__(self, clip: AnimationClip, flip_x=False, flip_y=False):
+        '''
+        :param clip: 재생할 클립
+        :param flip_x: True면 이미지 좌우 반전
+        :param flip_y: True면 이미지 상하 반전
+        '''
+        self.clip = clip
         self.flip_x = flip_x
         self.flip_y = flip_y
 
@@ -26,38 +57,44 @@ class Animation:
         self.elapsed = 0.0        # 현재 프레임까지 지난 시간
         self.frame = 0            # 현재 프레임 인덱스
 
-    def copy(self):
-        '''  
-        애니메이션 복제 (깊은 복사 같은 효과)  
+    def play(self, clip: AnimationClip):
         '''
-        clone = Animation(self.images, self.img_duration, self.loop, self.flip_x, self.flip_y)
-        return clone
+        다른 클립으로 바꿔서 처음부터 재생 (반전도 기본값으로 돌아감)
+        '''
+        self.clip = clip
+        self.flip_x = False
+        self.flip_y = False
+        self.done = False
+        self.elapsed = 0.0
+        self.frame = 0
 
     def update(self, dt: float):
-        '''  
-        dt만큼 시간을 더해 애니메이션 진행  
-        끝나면 콜백 호출, auto_destroy면 owner.destroy() 호출  
+        '''
+        dt만큼 시간을 더해 애니메이션 진행
+        루프 아닌 클립은 마지막 프레임에서 멈추고 done = True
         '''
         if self.done:
             return
 
+        clip = self.clip
         self.elapsed += dt
-        frames_advanced = int(self.elapsed / self.img_duration)
+        frames_advanced = int(self.elapsed / clip.img_duration)
 
         if frames_advanced > 0:
-            self.elapsed %= self.img_duration
+            self.elapsed %= clip.img_duration
             self.frame += frames_advanced
 
-            if self.frame >= len(self.images):
-                if self.loop:
-                    self.frame %= len(self.images)
+            frame_count = len(clip.images)
+            if self.frame >= frame_count:
+                if clip.loop:
+                    self.frame %= frame_count
                 else:
-                    self.frame = len(self.images) - 1
+                    self.frame = frame_count - 1
                     self.done = True
 
     def img(self) -> pg.Surface:
-        '''  
-        현재 프레임 이미지 반환 (flip_x, flip_y 적용됨)  
         '''
-        base = self.images[self.frame]
-        return pg.transform.flip(base, self.flip_x, self.flip_y)
\ No newline at end of file
+        현재 프레임 이미지 반환 (flip_x, flip_y 적용됨)
+        같이 쓰는 서피스라 수정하면 안 됨
+        '''
+        return self.clip.frames(self.flip_x, self.flip_y)[self.frame]
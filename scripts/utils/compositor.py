@@ -0,0 +1,207 @@
+import pygame as pg
+
+from scripts.constants import *
+
+TRANSPARENT = pg.Color(0, 0, 0, 0)
+
+class LayerCompositor(dict):
+    '''
+    레이어 -> Surface 딕셔너리 (App.surfaces) + 이번 프레임에 실제로 쓴 레이어만 지우고 합치는 합성기
+
+    - 레이어 종류는 LAYER_CONFIG 참고
+        - LAYER_OPAQUE: 알파 없는 서피스, 맨 아래 레이어면 따로 안 만들고 화면에 바로 그림 (화면 채우기 필요 없음)
+        - LAYER_ALPHA: 픽셀별 알파 서피스, 처음부터 만들어둠
+        - LAYER_OPTIONAL: 픽셀별 알파 서피스, 처음 꺼낼때 만듦 (안 쓰는 씬은 메모리 / 지우기 비용 없음)
+    - surfaces[레이어]로 꺼내면 그 레이어는 이번 프레임에 쓴 걸로 기록됨
+      (프레임에서 처음 꺼낼때, 전에 그린게 남아있으면 그때 지움, 불투명 레이어는 검은색으로 채움)
+    - 이번 프레임에 아무도 안 꺼낸 레이어는 지우기 / 화면에 합치기 둘다 건너뜀
+    - cover(레이어)는 그 레이어를 불투명한 그림으로 화면 전체를 덮는다는 뜻 (지우기 생략, 그 아래 레이어들은 안 합침)
+    - skipped_passes: 지난 프레임에 건너뛴 전체 화면 작업 수 (화면 채우기 1 + 레이어 지우기 n + 합치기 n 기준, 디버그 표시용)
+    - render_scale이 1보다 작으면 scaled_layers는 그만큼 작은 서피스로 만들고,
+      맨 아래 레이어(작은 서피스)에 먼저 합친 다음 화면 크기로 한번만 늘림 (그 위 레이어들은 원래 해상도로 합침)
+      scaled_layers는 layer_config 순서에서 맨 아래부터 붙어있어야 함
+    - submit(레이어, 이미지, 위치)로 넣은 스프라이트는 레이어별 큐에 모아뒀다가 fblits 한번으로 그림
+      (그 레이어를 surfaces[레이어]로 꺼낼때 / compose할때 먼저 그려서, 직접 그리는 것과 순서가 안 섞임)
+    - sort_queues면 큐를 원본 서피스(아틀라스 페이지)별로 정렬해서 그림
+      (같은 레이어 안에서 겹치는 스프라이트 앞뒤가 바뀔 수 있음)
+
+    :param screen: 최종 화면 서피스
+    :param layer_config: 레이어 -> 종류 (합치는 순서대로, 아래 -> 위, 레이어 번호로 정렬하지 않고 딕셔너리 순서 그대로 씀)
+    :param surface_flags: 알파 레이어 서피스 만들때 쓸 플래그
+    :param scaled_layers: 렌더 해상도 배율 적용받는 레이어들
+    :param render_scale: 렌더 해상도 배율 (0~1)
+    :param sort_queues: True면 스프라이트 큐를 원본 서피스별로 정렬해서 그림
+    '''
+
+    def __init__(self, screen: pg.Surface, layer_config: dict[int, str], surface_flags: int = pg.SRCALPHA,
+                 scaled_layers: tuple[int, ...] = (), render_scale: float = 1, sort_queues: bool = False):
+        super().__init__()
+        self.screen = screen
+        self.layer_config = dict(layer_config)
+        self.order = list(layer_config)  # 번호 순서로 정렬하면 안 됨 (탄환 / 파티클이 안개 아래로 들어감)
+        self.surface_flags = surface_flags
+        self.scaled_layers = frozenset(scaled_layers)
+        self.render_scale = render_scale
+        self.sort_queues = sort_queues
+
+        # 레이어 -> 아직 안 그린 (이미지, 위치) 목록
+        self.queues: dict[int, list[tuple[pg.Surface, tuple[float, float]]]] = {}
+        self.touched: set[int] = set()  # 이번 프레임에 꺼낸 레이어
+        self.dirty: set[int] = set()    # 그린게 남아있어서 다음에 쓰기 전에 지워야 하는 레이어
+        self.covered_layer: int | None = None
+        self.passes = 0
+        self.skipped_passes = 0
+
+        for layer, kind in self.layer_config.items():
+            if kind != LAYER_OPTIONAL:
+                self.create_surface(layer)
+
+    def layer_size(self, layer: int) -> tuple[int, int]:
+        '''레이어 서피스 크기 (렌더 해상도 배율 적용)'''
+        width, height = self.screen.get_size()
+        if layer not in self.scaled_layers or self.render_scale == 1:
+            return width, height
+        return max(1, round(width * self.render_scale)), max(1, round(height * self.render_scale))
+
+    def create_surface(self, layer: int) -> pg.Surface:
+        '''레이어 서피스 만들기 (종류에 맞게)'''
+        kind = self.layer_config[layer]
+        size = self.layer_size(layer)
+        if kind == LAYER_OPAQUE and layer == self.order[0] and size == self.screen.get_size():
+            surface = self.screen
+        elif kind == LAYER_OPAQUE:
+            surface = pg.Surface(size).convert()
+        else:
+            surface = pg.Surface(size, self.surface_flags).convert_alpha()
+        super().__setitem__(layer, surface)
+        return surface
+
+    def get_surface(self, layer: int) -> pg.Surface:
+        '''레이어 서피스 (없으면 만듦), 꺼낸걸로 기록 안 함'''
+        surface = self.get(layer)
+        if surface is None:
+            surface = self.create_surface(layer)
+        return surface
+
+    def set_render_scale(self, render_scale: float):
+        '''렌더 해상도 배율 바꾸기 (배율 적용받는 레이어 서피스를 새로 만듦)'''
+        if render_scale == self.render_scale:
+            return
+        self.render_scale = render_scale
+        for layer in self.scaled_layers:
+            if layer not in self:
+                continue
+            super().__delitem__(layer)
+            self.dirty.discard(layer)
+            self.queues.pop(layer, None)
+            if self.layer_config[layer] != LAYER_OPTIONAL or layer in self.touched:
+                self.create_surface(layer)
+
+    def is_opaque(self, layer: int) -> bool:
+        return self.layer_config[layer] == LAYER_OPAQUE
+
+    def touch(self, layer: int) -> pg.Surface:
+        '''레이어 서피스 꺼내고 이번 프레임에 쓴걸로 기록 (처음이면 지움)'''
+        surface = self.get_surface(layer)
+        if layer not in self.touched:
+            self.touched.add(layer)
+            if self.is_opaque(layer):
+                surface.fill("black")
+                self.passes += 1
+            elif layer in self.dirty:
+                surface.fill(TRANSPARENT)
+                self.passes += 1
+            self.dirty.add(layer)
+        return surface
+
+    def __getitem__(self, layer: int) -> pg.Surface:
+        surface = self.touch(layer)
+        if layer in self.queues:
+            self.flush(layer)
+        return surface
+
+    def submit(self, layer: int, image: pg.Surface, position):
+        '''
+        스프라이트 하나 그리기 예약 (surfaces[layer].blit(image, position)이랑 결과 같음)
+
+        :param layer: 그릴 레이어
+        :param image: 그릴 이미지
+        :param position: 레이어 서피스 기준 왼쪽 위 위치
+        '''
+        queue = self.queues.get(layer)
+        if queue is None:
+            queue = self.queues[layer] = []
+        queue.append((image, position))
+
+    def flush(self, layer: int):
+        '''layer 큐에 모인 스프라이트들 한번에 그림'''
+        queue = self.queues.pop(layer, None)
+        if not queue:
+            return
+        if self.sort_queues:
+            # 서브서피스(아틀라스 프레임)는 부모 페이지 기준 (정렬이 안정적이라 같은 페이지끼리는 순서 유지)
+            queue.sort(key=lambda item: id(item[0].get_parent() or item[0]))
+        self.touch(layer).fblits(queue)
+
+    def flush_all(self):
+        '''모든 레이어 큐 그림'''
+        for layer in list(self.queues):
+            self.flush(layer)
+
+    def cover(self, layer: int) -> pg.Surface:
+        '''
+        이번 프레임에 layer를 불투명한 그림으로 화면 전체를 덮을거라고 알리고 그릴 서피스 받기
+        (이 프레임에서 그 레이어에 먼저 그린건 어차피 가려짐, 큐에 있던 것도 버림)
+
+        :return: 그릴 서피스 (지우지 않은 상태)
+        '''
+        self.queues.pop(layer, None)
+        surface = self.get_surface(layer)
+        if self.covered_layer is None or self.order.index(layer) > self.order.index(self.covered_layer):
+            self.covered_layer = layer
+        self.touched.add(layer)
+        self.dirty.add(layer)
+        return surface
+
+    def begin_frame(self):
+        '''프레임 시작 (실제 지우기는 레이어를 처음 꺼낼때 함)'''
+        self.touched = set()
+        self.queues.clear()
+        self.covered_layer = None
+        self.passes = 0
+
+    def compose(self):
+        '''
+        이번 프레임에 쓴 레이어들만 순서대로 화면에 합침 (화면 전체를 덮은 레이어 아래는 생략)
+        렌더 해상도 배율이 1보다 작으면 배율 레이어들은 맨 아래 레이어에 합치고 화면 크기로 늘린 다음 나머지를 합침
+        '''
+        self.flush_all()
+        start = None
+        for i, layer in enumerate(self.order):
+            if layer in self.touched and (self.is_opaque(layer) or layer == self.covered_layer):
+                start = i
+
+        screen = self.screen
+        base = self.get_surface(self.order[0])  # 렌더 해상도 배율이 1이면 화면 그 자체
+        if start is None:
+            base.fill("black")
+            self.passes += 1
+            start = 0
+
+        upscaled = base is screen
+        for layer in self.order[start:]:
+            if layer not in self.touched:
+                continue
+            target = base if layer in self.scaled_layers else screen
+            if target is screen and not upscaled:
+                pg.transform.scale(base, screen.get_size(), screen)
+                self.passes += 1
+                upscaled = True
+            surface = self.get_surface(layer)
+            if surface is not target:
+                target.blit(surface, (0, 0))
+                self.passes += 1
+        if not upscaled:
+            pg.transform.scale(base, screen.get_size(), screen)
+            self.passes += 1
+        self.skipped_passes = 1 + 2 * len(self.order) - self.passes
@@ -0,0 +1,119 @@
+from collections import deque
+
+# 안개 그리는 방식
+FOG_MULTIPLY = "multiply"  # 오브젝트 / 엔티티 레이어에만 곱하기 (제일 비쌈)
+FOG_FILL = "fill"          # 볼륨 레이어 전체를 안개 색으로 채움
+
+class QualityTier:
+    '''
+    품질 단계 하나의 설정값
+
+    :param name: 디버그 표시용 이름
+    :param fog_mode: FOG_MULTIPLY / FOG_FILL
+    :param fog_scale: 안개 + 빛 그리는 해상도 배율 (1보다 작으면 작게 그리고 화면 크기로 늘림)
+    :param cloud_count: 그릴 구름 최대 개수
+    :param particle_budget: 한 프레임에 그릴 애니메이션 파티클 최대 개수
+    '''
+
+    def __init__(self, name: str, fog_mode: str, fog_scale: float, cloud_count: int, particle_budget: int):
+        self.name = name
+        self.fog_mode = fog_mode
+        self.fog_scale = fog_scale
+        self.cloud_count = cloud_count
+        self.particle_budget = particle_budget
+
+# 높은 품질 -> 낮은 품질 순서 (0번이 원래 그래픽)
+QUALITY_TIERS = (
+    QualityTier("high", FOG_MULTIPLY, 1, 16, 256),
+    QualityTier("medium", FOG_FILL, 1, 10, 64),
+    QualityTier("low", FOG_FILL, .5, 6, 32),
+    QualityTier("lowest", FOG_FILL, .25, 0, 12),
+)
+
+# 프레임 시간 몇 개 모아서 판단할지
+QUALITY_WINDOW = 60
+# 중간값이 프레임 예산 * 이 값보다 크면 한 단계 낮춤
+QUALITY_DOWNGRADE_RATIO = 1.15
+# 중간값이 프레임 예산 * 이 값보다 작은 구간이 QUALITY_UPGRADE_WINDOWS번 연속이면 한 단계 올림
+QUALITY_UPGRADE_RATIO = .6
+QUALITY_UPGRADE_WINDOWS = 4
+
+class QualityGovernor:
+    '''
+    측정한 프레임 시간 보고 품질 단계를 자동으로 오르내리는 클래스 (App.quality)
+    GameObject 아님. 씬 바뀌어도 유지됨.
+
+    - 프레임마다 record()로 프레임 작업 시간(리미터 대기 시간 뺀 것)을 넣음
+    - QUALITY_WINDOW개 모이면 중간값으로 판단 (씬 로딩 같은 한 프레임 튀는건 무시됨)
+    - 낮출때는 바로 한 단계, 올릴때는 여유 있는 구간이 여러번 연속이어야 한 단계 (왔다갔다 안 하게)
+    - pinned_tier가 있으면 자동 조절 안 하고 그 단계로 고정 (player_data["quality_tier"])
+    - 파티클 예산은 프레임마다 begin_frame()으로 다시 채움
+
+    :param frame_budget: 목표 프레임 시간 (초)
+    :param pinned_tier: 고정할 단계 (None이면 자동)
+    '''
+
+    def __init__(self, frame_budget: float, pinned_tier: int | None = None):
+        self.frame_budget = frame_budget
+        self.samples: deque[float] = deque(maxlen=QUALITY_WINDOW)
+        self.good_windows = 0
+        self.tier_index = 0
+        self.pinned_tier: int | None = None
+        self.particles_left = 0
+        self.pin(pinned_tier)
+        self.begin_frame()
+
+    @property
+    def tier(self) -> QualityTier:
+        return QUALITY_TIERS[self.tier_index]
+
+    def pin(self, tier_index: int | None):
+        '''단계 고정 (None이면 자동 조절로 돌아감)'''
+        if tier_index is None:
+            self.pinned_tier = None
+        else:
+            self.pinned_tier = max(0, min(len(QUALITY_TIERS) - 1, int(tier_index)))
+            self.tier_index = self.pinned_tier
+        self.samples.clear()
+        self.good_windows = 0
+
+    def set_tier(self, tier_index: int):
+        self.tier_index = max(0, min(len(QUALITY_TIERS) - 1, tier_index))
+        self.samples.clear()
+        self.good_windows = 0
+
+    def record(self, frame_time: float):
+        '''프레임 작업 시간 (초) 하나 넣기, 모이면 단계 판단'''
+        if self.pinned_tier is not None:
+            return
+        self.samples.append(frame_time)
+        if len(self.samples) < QUALITY_WINDOW:
+            return
+
+        median = sorted(self.samples)[QUALITY_WINDOW // 2]
+        self.samples.clear()
+        if median > self.frame_budget * QUALITY_DOWNGRADE_RATIO:
+            self.good_windows = 0
+            if self.tier_index < len(QUALITY_TIERS) - 1:
+                self.set_tier(self.tier_index + 1)
+        elif median < self.frame_budget * QUALITY_UPGRADE_RATIO:
+            self.good_windows += 1
+            if self.good_windows >= QUALITY_UPGRADE_WINDOWS and self.tier_index > 0:
+                self.set_tier(self.tier_index - 1)
+        else:
+            self.good_windows = 0
+
+    def begin_frame(self):
+        '''프레임 시작 (파티클 예산 다시 채움)'''
+        self.particles_left = self.tier.particle_budget
+
+    def take_particle(self) -> bool:
+        '''파티클 하나 그려도 되는지 (되면 예산에서 하나 뺌)'''
+        if self.particles_left <= 0:
+            return False
+        self.particles_left -= 1
+        return True
+
+    def describe(self) -> str:
+        '''디버그 표시용 문자열'''
+        return f"Q{self.tier_index} {self.tier.name}" + (" (pin)" if self.pinned_tier is not None else "")
@@ -0,0 +1,34 @@
+import weakref
+import pygame as pg
+
+# 원본 이미지 -> (배율, 줄인 이미지), 원본이 없어지면 같이 없어짐
+_scaled_images: 'weakref.WeakKeyDictionary[pg.Surface, tuple[float, pg.Surface]]' = weakref.WeakKeyDictionary()
+
+def scale_image(image: pg.Surface, scale: float) -> pg.Surface:
+    '''
+    월드 레이어에 그릴 이미지를 렌더 해상도 배율로 줄인 것 (원본 이미지마다 한번만 만듦)
+
+    - 배율이 1이면 원본 그대로
+    - 원본 내용을 제자리에서 고치는 서피스(청크 등)는 고친 다음 forget_scaled_image 불러야 함
+
+    :param image: 원본 이미지
+    :param scale: 렌더 해상도 배율 (App.render_scale)
+    '''
+    if scale == 1:
+        return image
+    cached = _scaled_images.get(image)
+    if cached is not None and cached[0] == scale:
+        return cached[1]
+
+    width, height = image.get_size()
+    size = (max(1, round(width * scale)), max(1, round(height * scale)))
+    if image.get_bitsize() >= 24:
+        scaled = pg.transform.smoothscale(image, size)
+    else:
+        scaled = pg.transform.scale(image, size)
+    _scaled_images[image] = (scale, scaled)
+    return scaled
+
+def forget_scaled_image(image: pg.Surface):
+    '''원본 내용이 바뀌었을때 줄여둔 이미지 버림'''
+    _scaled_images.pop(image, None)
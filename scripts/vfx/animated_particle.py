@@ -12,17 +12,19 @@ class AnimatedParticle(GameObject):
     - 특정 위치에 애니메이션 효과를 띄우는 파티클
     - 애니메이션이 끝나면 자동으로 자신을 파괴해서 메모리 누수 방지
     - 보통 폭발, 불꽃, 마법 효과 등에 사용
+    - 화면 밖이면 안 그림, 화면 안인데 품질 단계의 파티클 예산을 넘으면 그 프레임엔 안 그림 (업데이트 / 수명은 그대로)
+      (화면 밖 파티클은 예산 안 씀)
 
-    :param anim: Animation 인스턴스 (복사본으로 사용)
+    :param anim: 재생할 AnimationClip (파티클마다 재생 상태만 따로 가짐)
     :param position: 월드 좌표 기준 위치 (엔티티 중심 등)
     :param anchor: 이미지 기준 앵커 (0~1), 기본 중앙 (0.5, 0.5)
     """
 
-    def __init__(self, anim : Animation, position: pg.Vector2, anchor: pg.Vector2 = pg.Vector2(.5, .5)):
+    def __init__(self, anim : AnimationClip, position: pg.Vector2, anchor: pg.Vector2 = pg.Vector2(.5, .5)):
         super().__init__()
 
-        # 애니메이션 복사본 생성 (원본 공유 X)
-        self.anim = anim.copy()
+        # 재생 상태만 새로 만듦 (클립 데이터는 공유)
+        self.anim = AnimationPlayer(anim)
 
         self.position = position
         self.anchor = anchor
@@ -38,13 +40,15 @@ class AnimatedParticle(GameObject):
     def draw(self):
         super().draw()
         camera = self.camera
-        surface = self.app.surfaces[LAYER_DYNAMIC]
 
         image = self.anim.img()
-        # 이미지 크기 고려해 앵커 위치에 맞춰서 화면 좌표 계산
-        screen_pos = CameraMath.world_to_screen(
-            camera,
-            self.position - pg.Vector2(image.get_size()).elementwise() * self.anchor
-        )
+        # 이미지 크기 고려해 앵커 위치에 맞춘 월드 좌표 (화면 밖이면 예산 안 쓰고 넘어감)
+        world_pos = self.position - pg.Vector2(image.get_size()).elementwise() * self.anchor
+        if not CameraView.is_rect_in_view(camera, pg.Rect(world_pos, image.get_size())):
+            return
+        if not self.app.quality.take_particle():
+            return
 
-        surface.blit(image, screen_pos)
\ No newline at end of file
+        render_pos = CameraMath.world_to_render(camera, world_pos)
+
+        self.app.surfaces.submit(LAYER_DYNAMIC, scale_image(image, self.app.render_scale), render_pos)
\ No newline at end of file
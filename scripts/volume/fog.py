@@ -31,6 +31,9 @@ class Fog(GameObject):
         # 안개 효과를 그릴 임시 Surface를 생성함.
         # 최적화를 위해 오브젝트와 엔티티 레이어의 크기로 만듦.
         self.fog_surface = pg.Surface(SCREEN_SIZE, flags=pg.SRCALPHA)
+
+        # 품질 단계가 낮을때 안개 + 빛을 작게 그릴 Surface (배율별로 처음 쓸때 만듦).
+        self.low_res_surfaces: dict[float, pg.Surface] = {}
     
     @property
     def fog_color(self) -> pg.Color:
@@ -59,13 +62,25 @@ class Fog(GameObject):
         저사양 방식: 볼륨 레이어 전체를 안개 색으로 채움.
         
         주로 시야가 완전히 가려지는 효과를 위해 사용함.
+        품질 단계의 fog_scale이 볼륨 레이어 해상도(렌더 해상도 배율)보다 작으면 작은 Surface에 그린 다음 늘림.
         """
-        # 볼륨 레이어 전체를 계산된 안개 색으로 채움.
         volume_surface = self.app.surfaces[LAYER_VOLUME]
-        volume_surface.fill(self.fog_color)
-        
-        # 라이트매니저를 통해 빛 효과를 적용해서 어두운 배경에 구멍을 뚫음.
-        self.scene.light_manager.draw_lights(volume_surface)
+        render_scale = self.app.render_scale
+        scale = self.app.quality.tier.fog_scale
+        if scale >= render_scale:
+            # 볼륨 레이어 전체를 계산된 안개 색으로 채움.
+            volume_surface.fill(self.fog_color)
+            # 라이트매니저를 통해 빛 효과를 적용해서 어두운 배경에 구멍을 뚫음.
+            self.scene.light_manager.draw_lights(volume_surface, render_scale)
+            return
+
+        low_res_surface = self.low_res_surfaces.get(scale)
+        if low_res_surface is None:
+            low_res_surface = pg.Surface(SCREEN_SIZE * scale, flags=pg.SRCALPHA)
+            self.low_res_surfaces[scale] = low_res_surface
+        low_res_surface.fill(self.fog_color)
+        self.scene.light_manager.draw_lights(low_res_surface, scale)
+        pg.transform.scale(low_res_surface, volume_surface.get_size(), volume_surface)
         
     def draw_multiply(self):
         """
@@ -73,6 +88,11 @@ class Fog(GameObject):
         
         더욱 정교하고 시각적으로 흥미로운 안개 효과를 연출함.
         """
+        # 볼륨 레이어는 렌더 해상도 배율을 따르므로 크기가 다르면 임시 Surface를 다시 만듦.
+        volume_surface = self.app.surfaces[LAYER_VOLUME]
+        if self.fog_surface.get_size() != volume_surface.get_size():
+            self.fog_surface = pg.Surface(volume_surface.get_size(), flags=pg.SRCALPHA)
+
         # 임시 안개 Surface를 투명하게 초기화함.
         self.fog_surface.fill((0, 0, 0, 0))
 
@@ -86,10 +106,10 @@ class Fog(GameObject):
         self.fog_surface.fill(self.fog_color, special_flags=pg.BLEND_RGBA_MULT)
 
         # 빛 효과를 임시 안개 Surface에 적용해서 어두워진 부분에 밝은 구멍을 만듦.
-        self.scene.light_manager.draw_lights(self.fog_surface)
+        self.scene.light_manager.draw_lights(self.fog_surface, self.app.render_scale)
 
         # 최종적으로 완성된 안개 Surface를 볼륨 레이어에 그림.
-        self.app.surfaces[LAYER_VOLUME].blit(self.fog_surface, (0, 0))
+        volume_surface.blit(self.fog_surface, (0, 0))
     
     def draw(self):
         """
@@ -104,9 +124,10 @@ class Fog(GameObject):
             # 특정 소울 효과가 있으면 저사양 fill 방식으로 시야를 완전히 가림.
             if SOUL_EVIL_C in player_status.soul_queue:
                 self.draw_fill()
-            # 아니면 기본 고사양 multiply 방식을 사용함.
-            else:
-                self.draw_multiply()
+                return
+
+        # 아니면 품질 단계에 맞는 방식을 사용함 (기본은 고사양 multiply 방식).
+        if self.app.quality.tier.fog_mode == FOG_FILL:
+            self.draw_fill()
         else:
-            # 플레이어 상태가 없으면 기본 고사양 multiply 방식을 사용함.
             self.draw_multiply()
\ No newline at end of file
@@ -94,7 +94,7 @@ class LightManager:
         """
         self.scene = scene
 
-    def draw_lights(self, surface: pg.Surface):
+    def draw_lights(self, surface: pg.Surface, scale: float = 1):
         """
         씬에 존재하는 모든 Light 객체를 받아서 surface에 빛 효과를 적용함.
         
@@ -102,6 +102,7 @@ class LightManager:
         
         Args:
             surface (pg.Surface): 빛 효과를 적용할 대상 Surface.
+            scale (float): surface의 화면 대비 해상도 배율 (렌더 해상도 배율 / 낮은 품질 단계에서 작게 그릴때 사용).
         """
         # 씬에 등록된 모든 Light 객체를 가져옴.
         all_lights = self.scene.get_objects_by_types(Light)
@@ -115,7 +116,11 @@ class LightManager:
             # 월드 좌표계의 Rect -> 스크린 좌표계의 Rect
             screen_rect = CameraView.world_rect_to_screen_rect(self.scene.camera, light.bound_box)
             # BLEND_RGBA_SUB 모드로 빛 이미지를 그림.
-            surface.blit(light.surface, screen_rect.topleft, special_flags=pg.BLEND_RGBA_SUB)
+            if scale == 1:
+                surface.blit(light.surface, screen_rect.topleft, special_flags=pg.BLEND_RGBA_SUB)
+            else:
+                surface.blit(scale_image(light.surface, scale),
+                             (screen_rect.x * scale, screen_rect.y * scale), special_flags=pg.BLEND_RGBA_SUB)
 
     def is_rect_in_light(self, rect: pg.Rect) -> bool:
         """